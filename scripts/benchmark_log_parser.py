@@ -0,0 +1,321 @@
+import argparse
+import json
+import multiprocessing
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from bulmaai.utils.log_parser import (
+    MAX_STACKTRACE_LEN,
+    LogReport,
+    _RE_DRAGONMINEZ_VERSION,
+    _RE_ERROR_LINE,
+    _RE_FORGE_VERSION,
+    _RE_FORGE_VERSION_ALT,
+    _RE_JAVA_VERSION,
+    _RE_JAVA_VERSION_ALT,
+    _RE_JAVA_VERSION_PROP,
+    _RE_MC_VERSION,
+    _RE_MC_VERSION_ALT,
+    _RE_MEMORY,
+    _RE_MOD_DISCOVERY,
+    _RE_MOD_LOG_TABLE,
+    _RE_MOD_SIMPLE,
+    _RE_MODLOADER,
+    _RE_OS,
+    _RE_STACKTRACE_START,
+    parse_log,
+    parse_log_file,
+)
+
+DEFAULT_CORPUS_DIR = REPO_ROOT / "tests" / "fixtures" / "log_corpus"
+
+# The legacy parser's original patterns, before the backtracking fixes.
+_RE_MOD_CRASH_REPORT_TABLE = re.compile(
+    r"^\s*[^|]+\s*\|\s*[^|]+\s*\|\s*([a-z0-9_\-]+)\s*\|\s*([0-9][\w.\-+]+)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_RE_MOD_ENTRY = re.compile(
+    r"(?:Mod ID:\s*'?|Loading\s+)([a-z_][a-z0-9_]*)'?.*?Version:\s*'?([^'\";\n]+)",
+    re.IGNORECASE,
+)
+_RE_OS_ALT = re.compile(r";\s*OS\s+(.+?)\s+arch", re.IGNORECASE)
+
+
+def legacy_parse_log(text: str) -> LogReport:
+    """The previous multi-pass implementation, kept as the benchmark baseline."""
+    report = LogReport()
+
+    for pat in (_RE_JAVA_VERSION, _RE_JAVA_VERSION_ALT, _RE_JAVA_VERSION_PROP):
+        m = pat.search(text)
+        if m:
+            report.java_version = m.group(1).strip()
+            break
+
+    m = _RE_FORGE_VERSION.search(text) or _RE_FORGE_VERSION_ALT.search(text)
+    if m:
+        report.forge_version = m.group(1).strip()
+
+    m = _RE_MC_VERSION.search(text) or _RE_MC_VERSION_ALT.search(text)
+    if m:
+        report.mc_version = m.group(1).strip()
+
+    if _RE_MODLOADER.search(text):
+        report.is_forge = True
+    if "forge" in text.lower() and "minecraft crash report" in text.lower():
+        report.is_forge = True
+
+    m = _RE_OS.search(text) or _RE_OS_ALT.search(text)
+    if m:
+        report.operating_system = m.group(1).strip()
+
+    m = _RE_MEMORY.search(text)
+    if m:
+        report.memory = m.group(1).strip()
+
+    for m in _RE_MOD_DISCOVERY.finditer(text):
+        report.mods[m.group(1).strip().lower()] = m.group(2).strip()
+    for m in _RE_MOD_CRASH_REPORT_TABLE.finditer(text):
+        mod_id = m.group(1).strip().lower()
+        if mod_id not in report.mods and mod_id not in ("mod id", "modid"):
+            report.mods[mod_id] = m.group(2).strip()
+    for pattern in (_RE_MOD_LOG_TABLE, _RE_MOD_ENTRY, _RE_MOD_SIMPLE):
+        for m in pattern.finditer(text):
+            mod_id = m.group(1).strip().lower()
+            if mod_id not in report.mods:
+                report.mods[mod_id] = m.group(2).strip()
+
+    dmz = report.mods.get("dragonminez")
+    if dmz:
+        report.dragonminez_version = dmz
+    else:
+        m = _RE_DRAGONMINEZ_VERSION.search(text)
+        if m:
+            report.dragonminez_version = m.group(1).strip()
+
+    error_lines: list[str] = []
+    trace_lines: list[str] = []
+    in_trace = False
+    consecutive_blanks = 0
+    is_crash_report = "---- Minecraft Crash Report ----" in text
+
+    for line in text.splitlines():
+        if _RE_ERROR_LINE.match(line):
+            error_lines.append(line.strip())
+            in_trace = True
+            consecutive_blanks = 0
+            trace_lines.append(line.strip())
+            continue
+        if is_crash_report and line.strip().startswith("Description:"):
+            error_lines.append(line.strip())
+            in_trace = True
+            continue
+        if _RE_STACKTRACE_START.search(line):
+            in_trace = True
+            consecutive_blanks = 0
+        if in_trace:
+            stripped = line.strip()
+            if stripped:
+                consecutive_blanks = 0
+                trace_lines.append(stripped)
+            else:
+                consecutive_blanks += 1
+                if consecutive_blanks >= 2:
+                    in_trace = False
+                    consecutive_blanks = 0
+
+    report.errors = error_lines[:15]
+    if trace_lines:
+        full_trace = "\n".join(trace_lines)
+        if len(full_trace) > MAX_STACKTRACE_LEN:
+            full_trace = full_trace[:MAX_STACKTRACE_LEN] + "\n... (truncated)"
+        report.stacktrace = full_trace
+    return report
+
+
+# ── Synthetic logs ────────────────────────────────────────────────────────────
+
+_HEADER = (
+    "[24Jun2023 06:57:40.001] [main/INFO] [cpw.mods.modlauncher.Launcher/MODLAUNCHER]: "
+    "ModLauncher running: args [--username, Player, --version, 1.20.1, --launchTarget, forgeclient, "
+    "--fml.forgeVersion, 47.2.0, --fml.mcVersion, 1.20.1, --fml.forgeGroup, net.minecraftforge]",
+    "[24Jun2023 06:57:40.010] [main/INFO] [cpw.mods.modlauncher.Launcher/MODLAUNCHER]: "
+    "ModLauncher 10.0.9+10.0.9+main.dcd20f30 starting: java version 17.0.8 by Microsoft; "
+    "OS Windows 10 arch amd64 version 10.0",
+    "[24Jun2023 06:57:42.886] [main/INFO] [net.minecraftforge.fml.loading.FMLLoader/CORE]: "
+    "Forge mod loading, version 47.2.0, for MC 1.20.1 with MCP 20230612.114412",
+)
+
+_BODY = (
+    "[{ts}] [Render thread/INFO] [net.minecraft.client.Minecraft/]: Loaded {n} advancements",
+    "[{ts}] [Worker-Main-{n}/INFO] [net.minecraft.server.packs.resources/]: Reloading ResourceManager: vanilla, mod_resources",
+    "[{ts}] [Render thread/WARN] [net.minecraft.client.sounds.SoundEngine/]: Missing sound for event: dragonminez:ki_blast_{n}",
+    "[{ts}] [modloading-worker-0/DEBUG] [net.minecraftforge.registries.GameData/REGISTRIES]: Registering {n} entries",
+    "[{ts}] [Server thread/INFO] [net.minecraft.server.MinecraftServer/]: Player{n} joined the game",
+)
+
+_ERROR_BLOCK = (
+    "[{ts}] [Render thread/ERROR] [net.minecraftforge.fml.ModLoader/]: Failed to create mod instance. ModID: dragonminez",
+    "java.lang.NullPointerException: Cannot invoke \"Object.getClass()\" because \"value\" is null",
+    "\tat com.dragonminez.common.init.MainEntity.register(MainEntity.java:{n})",
+    "\tat net.minecraftforge.eventbus.EventBus.post(EventBus.java:315)",
+    "Caused by: java.lang.IllegalStateException: Registry already frozen",
+    "\tat net.minecraftforge.registries.ForgeRegistry.add(ForgeRegistry.java:287)",
+    "",
+    "",
+)
+
+
+def build_synthetic_log(target_bytes: int, *, mod_count: int = 250, seed: int = 1) -> str:
+    """Build a latest.log-like text of roughly *target_bytes*."""
+    rng = random.Random(seed)
+    lines = list(_HEADER)
+    for i in range(mod_count):
+        mod_id = "dragonminez" if i == 0 else f"mod_{i}"
+        version = "2.0.1" if i == 0 else f"{rng.randint(1, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 99)}"
+        lines.append(
+            f"[24Jun2023 06:57:43.{i % 1000:03d}] [main/DEBUG] [net.minecraftforge.fml.loading.moddiscovery.ModDiscoverer/SCAN]: "
+            f"Found valid mod file {mod_id}-{version}.jar with {{{mod_id}}} mods - versions {{{version}}}"
+        )
+
+    size = sum(len(line) + 1 for line in lines)
+    n = 0
+    while size < target_bytes:
+        n += 1
+        ts = f"24Jun2023 07:{(n // 60) % 60:02d}:{n % 60:02d}.{n % 1000:03d}"
+        block = _ERROR_BLOCK if n % 2000 == 0 else (rng.choice(_BODY),)
+        for template in block:
+            line = template.format(ts=ts, n=n)
+            lines.append(line)
+            size += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def _time_it(func, text: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _time_legacy_worker(text: str, repeat: int, results: multiprocessing.Queue) -> None:
+    results.put(_time_it(legacy_parse_log, text, repeat))
+
+
+def _time_legacy(text: str, repeat: int, timeout: float) -> float | None:
+    """Time the legacy parser in a child process; None means it hit *timeout*.
+
+    The legacy crash-table regex backtracks across newlines, so large logs
+    can take minutes and must not hang the benchmark.
+    """
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_time_legacy_worker, args=(text, repeat, results))
+    proc.start()
+    proc.join(timeout)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return None
+    return results.get()
+
+
+def _score(report: LogReport, expected: dict) -> tuple[int, list[str]]:
+    wrong = []
+    for name, value in expected.items():
+        if name == "error_count":
+            ok = len(report.errors) == value
+        elif name == "stacktrace_contains":
+            ok = all(part in (report.stacktrace or "") for part in value)
+        else:
+            ok = getattr(report, name) == value
+        if not ok:
+            wrong.append(name)
+    return len(expected) - len(wrong), wrong
+
+
+def run_corpus(corpus_dir: Path, repeat: int) -> None:
+    """Print parse time, peak memory and field accuracy for every corpus file."""
+    expected = json.loads((corpus_dir / "expected.json").read_text(encoding="utf-8"))
+    print(f"{'file':<40}  {'size':>8}  {'parse ms':>9}  {'peak KB':>8}  {'accuracy':>8}  wrong")
+    for filename, case in expected.items():
+        path = corpus_dir / filename
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            report = parse_log_file(str(path))
+            samples.append(time.perf_counter() - start)
+        tracemalloc.start()
+        parse_log_file(str(path))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        correct, wrong = _score(report, case["fields"])
+        print(
+            f"{filename:<40}  {path.stat().st_size / 1024:>6.0f}KB  "
+            f"{statistics.median(samples) * 1000:>9.2f}  {peak / 1024:>8.0f}  "
+            f"{correct:>3}/{len(case['fields']):<4}  {', '.join(wrong) or '-'}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the single-pass log parser against the legacy multi-pass parser."
+    )
+    parser.add_argument(
+        "--sizes-mb",
+        type=float,
+        nargs="+",
+        default=[1, 5, 10],
+        help="Synthetic log sizes to benchmark, in MB.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the median is reported.")
+    parser.add_argument(
+        "--legacy-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds to wait for the legacy parser per size before giving up.",
+    )
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_CORPUS_DIR,
+        help="Report time, peak memory and accuracy per file in a corpus directory instead.",
+    )
+    args = parser.parse_args()
+
+    if args.corpus is not None:
+        run_corpus(args.corpus, args.repeat)
+        return
+
+    # Results must match exactly; check on a sample small enough for the legacy parser.
+    sample = build_synthetic_log(64 * 1024)
+    same = legacy_parse_log(sample) == parse_log(sample)
+    print(f"identical LogReport on 64KB sample: {'yes' if same else 'NO'}")
+
+    print(f"{'size':>8}  {'legacy ms':>10}  {'single-pass ms':>14}  {'speedup':>8}")
+    for size_mb in args.sizes_mb:
+        text = build_synthetic_log(int(size_mb * 1024 * 1024))
+        current = _time_it(parse_log, text, args.repeat)
+        legacy = _time_legacy(text, args.repeat, args.legacy_timeout)
+        if legacy is None:
+            legacy_col = f">{args.legacy_timeout * 1000:.0f}"
+            speedup_col = f">{args.legacy_timeout / current:.0f}x"
+        else:
+            legacy_col = f"{legacy * 1000:.1f}"
+            speedup_col = f"{legacy / current:.2f}x"
+        print(f"{size_mb:>6g}MB  {legacy_col:>10}  {current * 1000:>14.1f}  {speedup_col:>8}")
+
+
+if __name__ == "__main__":
+    main()
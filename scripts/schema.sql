@@ -41,6 +41,8 @@ CREATE TABLE IF NOT EXISTS support_ai_traces (
     reply_text               TEXT,
     input_json               JSONB NOT NULL DEFAULT '[]',
     request_metadata         JSONB NOT NULL DEFAULT '{}',
+    first_token_ms           INTEGER,
+    answer_cache             TEXT,
     created_at               TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 
@@ -65,6 +67,8 @@ ALTER TABLE support_ai_traces ADD COLUMN IF NOT EXISTS reasoning_tokens INTEGER;
 ALTER TABLE support_ai_traces ADD COLUMN IF NOT EXISTS reply_text TEXT;
 ALTER TABLE support_ai_traces ADD COLUMN IF NOT EXISTS input_json JSONB NOT NULL DEFAULT '[]';
 ALTER TABLE support_ai_traces ADD COLUMN IF NOT EXISTS request_metadata JSONB NOT NULL DEFAULT '{}';
+ALTER TABLE support_ai_traces ADD COLUMN IF NOT EXISTS first_token_ms INTEGER;
+ALTER TABLE support_ai_traces ADD COLUMN IF NOT EXISTS answer_cache TEXT;
 ALTER TABLE support_ai_traces ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now();
 
 CREATE INDEX IF NOT EXISTS idx_support_ai_traces_created_at
@@ -212,3 +216,52 @@ CREATE INDEX IF NOT EXISTS idx_bug_reports_status
 
 CREATE INDEX IF NOT EXISTS idx_bug_reports_issue
     ON bug_reports (repo, issue_number);
+
+CREATE TABLE IF NOT EXISTS log_report_cache (
+    content_sha256  TEXT PRIMARY KEY,
+    report          JSONB NOT NULL,
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_log_report_cache_created_at
+    ON log_report_cache (created_at);
+
+CREATE TABLE IF NOT EXISTS github_items (
+    repo        TEXT NOT NULL,
+    number      INTEGER NOT NULL,
+    kind        TEXT NOT NULL,
+    state       TEXT NOT NULL,
+    title       TEXT NOT NULL,
+    data        JSONB NOT NULL,
+    updated_at  TIMESTAMPTZ NOT NULL,
+    synced_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (repo, number),
+    CONSTRAINT github_items_kind_check
+        CHECK (kind IN ('issue', 'pull'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_github_items_listing
+    ON github_items (repo, kind, state, number DESC);
+
+-- Full-text index over titles (weight A) and bodies (weight B) for duplicate lookups.
+ALTER TABLE github_items ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', title), 'A') ||
+        setweight(to_tsvector('english', left(coalesce(data->>'body', ''), 20000)), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_github_items_search
+    ON github_items USING GIN (search_vector);
+
+CREATE TABLE IF NOT EXISTS github_labels (
+    repo  TEXT NOT NULL,
+    name  TEXT NOT NULL,
+    data  JSONB NOT NULL,
+    PRIMARY KEY (repo, name)
+);
+
+CREATE TABLE IF NOT EXISTS github_sync_state (
+    repo          TEXT PRIMARY KEY,
+    items_cursor  TIMESTAMPTZ,
+    synced_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
@@ -8,9 +8,11 @@ from pathlib import Path
 import discord
 from dotenv import load_dotenv
 
-from .config import Settings, load_settings
+from .config import Settings, refresh_settings
 from .database.db import close_db_pool, init_db_pool
+from .github.github_app_auth import close_token_manager
 from .logging_setup import setup_logging
+from .services import http
 from .services.discord_log_forwarding import (
     DiscordLogForwarder,
     install_discord_log_forwarder,
@@ -22,6 +24,7 @@ log = logging.getLogger("bulmaai")
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 RESTART_EMBED_COLOR = discord.Colour.from_rgb(46, 204, 113)
+SETTINGS_WATCH_INTERVAL_SECONDS = 5.0
 
 @dataclass(frozen=True)
 class GitRuntimeInfo:
@@ -120,6 +123,7 @@ class BulmaAI(discord.Bot):
         self.settings = settings
         self._restart_announcement_sent = False
         self._discord_log_forwarder: DiscordLogForwarder | None = None
+        self._settings_watcher: asyncio.Task | None = None
         BulmaAI.instance = self
 
     async def setup_hook(self) -> None:
@@ -135,9 +139,22 @@ class BulmaAI(discord.Bot):
             )
 
     def reload_settings(self) -> Settings:
-        self.settings = load_settings()
+        self.settings = refresh_settings().settings
         return self.settings
 
+    async def _watch_settings_overrides(self) -> None:
+        """Swap in a new settings snapshot when the overrides file changes on disk."""
+        while True:
+            await asyncio.sleep(SETTINGS_WATCH_INTERVAL_SECONDS)
+            try:
+                snapshot = refresh_settings(if_changed=True)
+            except Exception:
+                log.exception("Failed to reload settings overrides")
+                continue
+            if snapshot.settings is not self.settings:
+                log.info("Settings overrides changed on disk; now at version %s", snapshot.version)
+                self.settings = snapshot.settings
+
     def load_pr_extensions(self) -> None:
         for ext in self.settings.initial_extensions:
             try:
@@ -149,6 +166,8 @@ class BulmaAI(discord.Bot):
 
     async def on_ready(self) -> None:
         log.info("Logged in as %s (id=%s)", self.user, getattr(self.user, "id", None))
+        if self._settings_watcher is None:
+            self._settings_watcher = asyncio.create_task(self._watch_settings_overrides())
         if self._restart_announcement_sent:
             return
 
@@ -157,12 +176,17 @@ class BulmaAI(discord.Bot):
 
     async def close(self) -> None:
         """Called when the bot is shutting down."""
+        if self._settings_watcher is not None:
+            self._settings_watcher.cancel()
+            self._settings_watcher = None
         if self._discord_log_forwarder is not None:
             await self._discord_log_forwarder.stop()
             self._discord_log_forwarder = None
         log.info("Closing database pool...")
         await close_db_pool()
         log.info("Database pool closed")
+        await close_token_manager()
+        await http.close_client()
         await super().close()
 
     async def on_application_command_error(
@@ -282,6 +306,21 @@ class BulmaAI(discord.Bot):
         return embed, view
 
 
+def http_client_options(settings: Settings) -> dict[str, object]:
+    """Keyword arguments for the shared :class:`~bulmaai.services.http.HTTPClient`."""
+    return {
+        "max_connections": settings.http_max_connections,
+        "max_connections_per_host": settings.http_max_connections_per_host,
+        "keepalive_seconds": settings.http_keepalive_seconds,
+        "timeout_seconds": settings.http_timeout_seconds,
+        "connect_timeout_seconds": settings.http_connect_timeout_seconds,
+        "max_retries": settings.http_max_retries,
+        "rate_limit_per_second": settings.http_rate_limit_per_second,
+        "rate_limit_burst": settings.http_rate_limit_burst,
+        "max_retry_wait_seconds": settings.http_max_retry_wait_seconds,
+    }
+
+
 def get_bot_instance() -> BulmaAI:
     if BulmaAI.instance is None:
         raise RuntimeError("BulmaAI instance not initialized yet.")
@@ -290,8 +329,10 @@ def get_bot_instance() -> BulmaAI:
 
 def run() -> None:
     load_dotenv()
-    settings = load_settings()
+    settings = refresh_settings().settings
     setup_logging(settings.log_level)
+    # py-cord never calls setup_hook, so the shared client is configured before the bot starts.
+    http.set_client_options(**http_client_options(settings))
 
     bot = BulmaAI(settings)
 
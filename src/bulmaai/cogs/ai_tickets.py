@@ -1,13 +1,17 @@
 import asyncio
+import contextlib
 import logging
+import re
+import time
 from collections import defaultdict
+from collections.abc import Callable
 from typing import Any
 
 import discord
 from discord.ext import commands
 from openai import AsyncOpenAI
 
-from bulmaai.config import load_settings
+from bulmaai.config import current_settings
 from bulmaai.services.openai_client import (
     ConversationMessage,
     is_transient_ai_error,
@@ -22,11 +26,14 @@ from bulmaai.services.support_intent import (
 from bulmaai.utils.permissions import can_use_ai_support, is_staff
 
 log = logging.getLogger(__name__)
-vision_client = AsyncOpenAI(api_key=load_settings().openai_key)
+vision_client = AsyncOpenAI(api_key=current_settings().openai_key)
 
 LOG_ATTACHMENT_EXTENSIONS = (".log", ".txt")
 IMAGE_ATTACHMENT_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif")
 DISCORD_MESSAGE_LIMIT = 1900
+# Streamed replies are edited at most this often; Discord rate-limits message edits.
+STREAM_EDIT_INTERVAL_SECONDS = 1.0
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|\n")
 
 
 def _chunk_discord_message(text: str, limit: int = DISCORD_MESSAGE_LIMIT) -> list[str]:
@@ -52,6 +59,120 @@ def _chunk_discord_message(text: str, limit: int = DISCORD_MESSAGE_LIMIT) -> lis
     return chunks
 
 
+def _last_sentence_end(text: str) -> int | None:
+    ends = [match.end() for match in _SENTENCE_END_RE.finditer(text)]
+    return ends[-1] if ends else None
+
+
+class _StreamingReply:
+    """Posts a support reply to Discord while it is still being generated.
+
+    The first complete sentence is sent as a new message. Later sentences are
+    added by editing it, at most once per ``STREAM_EDIT_INTERVAL_SECONDS``,
+    and the reply continues in a new message once the length limit is hit.
+    Used as an async context manager, it shows typing until the first
+    sentence is posted.
+    """
+
+    def __init__(self, channel: Any, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.channel = channel
+        self._clock = clock
+        self._pending = ""
+        self._message: discord.Message | None = None
+        self._messages: list[discord.Message] = []
+        self._content = ""
+        self._last_post = 0.0
+        self._typing: Any = None
+        self.sent = False
+        self.failed = False
+
+    async def __aenter__(self) -> "_StreamingReply":
+        self._typing = self.channel.typing()
+        await self._typing.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._stop_typing()
+
+    @property
+    def unsent(self) -> str:
+        """Text that did not reach Discord because posting failed."""
+        return self._pending.strip() if self.failed else ""
+
+    async def push(self, delta: str) -> None:
+        self._pending += delta
+        if self.failed:
+            return
+        if len(self._pending) >= DISCORD_MESSAGE_LIMIT:
+            boundary = len(self._pending)
+        else:
+            boundary = _last_sentence_end(self._pending)
+            if boundary is None:
+                return
+            if self._message is not None and self._clock() - self._last_post < STREAM_EDIT_INTERVAL_SECONDS:
+                return
+        text, self._pending = self._pending[:boundary], self._pending[boundary:]
+        await self._post(text)
+
+    async def finish(self) -> bool:
+        """Post whatever is still buffered; return whether any of the reply reached Discord.
+
+        After a failed post the rest of the reply is left in ``unsent``.
+        """
+        await self._stop_typing()
+        if self._pending and not self.failed:
+            text, self._pending = self._pending, ""
+            await self._post(text)
+        return self.sent
+
+    async def discard(self) -> None:
+        """Delete the partial reply, e.g. when a newer message superseded the request."""
+        await self._stop_typing()
+        for message in self._messages:
+            with contextlib.suppress(discord.HTTPException):
+                await message.delete()
+        self._messages.clear()
+        self._message = None
+        self._pending = ""
+        self.sent = False
+
+    async def _stop_typing(self) -> None:
+        typing, self._typing = self._typing, None
+        if typing is not None:
+            await typing.__aexit__(None, None, None)
+
+    async def _post(self, text: str) -> None:
+        content = self._content + text if self._message is not None else text.lstrip()
+        chunks = [chunk for chunk in _chunk_discord_message(content) if chunk.strip()]
+        if not chunks:
+            return
+        await self._stop_typing()
+        allowed_mentions = discord.AllowedMentions.none()
+        unsent = text
+        try:
+            if self._message is None:
+                self._message = await self.channel.send(chunks[0], allowed_mentions=allowed_mentions)
+                self._messages.append(self._message)
+            elif chunks[0] != self._content:
+                await self._message.edit(content=chunks[0], allowed_mentions=allowed_mentions)
+            self._content = chunks[0]
+            self.sent = True
+            for index, chunk in enumerate(chunks[1:], start=1):
+                unsent = "".join(chunks[index:])
+                self._message = await self.channel.send(chunk, allowed_mentions=allowed_mentions)
+                self._messages.append(self._message)
+                self._content = chunk
+        except discord.HTTPException:
+            self.failed = True
+            self._pending = unsent + self._pending
+            log.exception(
+                "Failed to stream AI support response",
+                extra={"event": "ai_support_stream_failed", "channel_id": getattr(self.channel, "id", None)},
+            )
+            return
+        self._last_post = self._clock()
+
+
 def _is_ticket_channel(
     channel: discord.abc.GuildChannel,
     *,
@@ -436,6 +557,7 @@ class AITicketsCog(commands.Cog):
             return
 
         async with self._channel_locks[channel.id]:
+            stream_reply: _StreamingReply | None = None
             try:
                 history = await self._build_history(message, in_ticket=in_ticket)
                 image_context = await self._extract_image_context(message)
@@ -451,22 +573,40 @@ class AITicketsCog(commands.Cog):
                     )
 
                 enabled_tools: list[str] = []
-                result = await run_support_agent(
-                    messages=history,
-                    enabled_tools=enabled_tools,
-                    language_hint=None,
-                    model_override=(
-                        settings.openai_support_model if in_ticket else settings.openai_model
-                    ),
-                    user_id=message.author.id,
-                    channel_id=channel.id,
-                    ticket_conversation=in_ticket,
-                    bot=self.bot,
-                    settings=settings,
+                stream_reply = (
+                    _StreamingReply(channel) if getattr(settings, "ai_support_stream_replies", False) else None
                 )
+                async with stream_reply if stream_reply is not None else contextlib.nullcontext():
+                    result = await run_support_agent(
+                        messages=history,
+                        enabled_tools=enabled_tools,
+                        language_hint=None,
+                        model_override=(
+                            settings.openai_support_model if in_ticket else settings.openai_model
+                        ),
+                        user_id=message.author.id,
+                        channel_id=channel.id,
+                        ticket_conversation=in_ticket,
+                        bot=self.bot,
+                        settings=settings,
+                        on_text_delta=stream_reply.push if stream_reply is not None else None,
+                    )
+                streamed = False
+                if stream_reply is not None:
+                    if _has_user_visible_tool_result(result["tool_results"]):
+                        # A tool already answered the user; drop any streamed preamble.
+                        await stream_reply.discard()
+                    else:
+                        streamed = await stream_reply.finish()
             except asyncio.CancelledError:
+                # A newer message restarted the debounce; its answer replaces this partial one.
+                if stream_reply is not None:
+                    await stream_reply.discard()
                 raise
             except Exception as error:
+                # The error message below replaces a cut-off streamed answer.
+                if stream_reply is not None:
+                    await stream_reply.discard()
                 transient = is_transient_ai_error(error)
                 log.exception(
                     "AI support error: %s",
@@ -513,7 +653,10 @@ class AITicketsCog(commands.Cog):
 
             reply_text = result["reply"].strip()
             if reply_text and reply_text != "(no reply)":
-                outgoing_messages.append(reply_text)
+                if not streamed:
+                    outgoing_messages.append(reply_text)
+                elif stream_reply is not None and stream_reply.unsent:
+                    outgoing_messages.append(stream_reply.unsent)
             else:
                 if in_ticket:
                     outgoing_messages.append(
@@ -5,7 +5,6 @@ import re
 import discord
 from discord.ext import commands, tasks
 from openai import AsyncOpenAI
-from requests import HTTPError
 
 from bulmaai.github.github_app_auth import GitHubAppAuth
 from bulmaai.github.github_service import GitHubService
@@ -22,6 +21,12 @@ from bulmaai.services.bug_reports import (
     set_tracked,
     upsert_triage,
 )
+from bulmaai.services.duplicate_candidates import (
+    local_duplicate_candidates,
+    rank_duplicate_candidates,
+    search_duplicate_candidates,
+)
+from bulmaai.services.github_mirror import shared_github_mirror
 from bulmaai.ui.bug_report_views import BugTriageView, apply_status, build_triage_embed
 from bulmaai.utils.permissions import is_staff
 
@@ -39,6 +44,7 @@ def _get_github_service(settings, repo: str) -> GitHubService:
         owner=settings.GITHUB_OWNER,
         repo=repo,
         base_branch=settings.GITHUB_BASE_BRANCH,
+        mirror=shared_github_mirror,
     )
 
 
@@ -131,6 +137,8 @@ class BugReportsCog(commands.Cog):
         # Forum posts carry the title separately from the body.
         full_text = f"{thread.name}\n\n{report_text}".strip()
 
+        # Duplicate retrieval only needs the raw post, so it overlaps with triage.
+        retrieval = asyncio.create_task(self._retrieve_duplicate_candidates(thread.name, full_text))
         try:
             triage = await analyze_bug_report(
                 self.client,
@@ -140,10 +148,11 @@ class BugReportsCog(commands.Cog):
                 fallback_title=thread.name[:240] or "Bug report",
             )
         except Exception:
+            retrieval.cancel()
             log.exception("Bug-report triage failed for thread %s", thread.id)
             return
 
-        duplicate = await self._assess_duplicate(triage)
+        duplicate = await self._assess_duplicate(triage, retrieval, report_text=full_text)
 
         embed = build_triage_embed(
             triage,
@@ -176,30 +185,46 @@ class BugReportsCog(commands.Cog):
             log.warning("Could not fetch starter message for thread %s", thread.id)
             return None
 
-    async def _assess_duplicate(self, triage: BugTriage) -> DuplicateAssessment | None:
-        """Search existing GitHub issues and ask the AI whether this report duplicates,
-        or is already fixed by, one of them. Suggestion only — never closes anything.
-        Returns None when it can't produce a useful suggestion."""
-        if not triage.is_bug:
-            return None
+    async def _retrieve_duplicate_candidates(self, title: str, report_text: str) -> list[dict]:
         repo = self.settings.bug_report_repo
         if not repo:
-            return None
+            return []
+        try:
+            if await shared_github_mirror.is_synced(repo):
+                return await local_duplicate_candidates(repo, title=title, report_text=report_text)
+        except Exception:
+            log.warning("Local duplicate lookup failed for %r; using GitHub search", title, exc_info=True)
         service = _get_github_service(self.settings, repo)
         try:
-            candidates = await service.search_issues(triage.title, per_page=10)
+            return await search_duplicate_candidates(service, title=title, report_text=report_text)
         except Exception:
-            log.warning("Duplicate search failed for %r", triage.title, exc_info=True)
+            log.warning("Duplicate search failed for %r", title, exc_info=True)
+            return []
+
+    async def _assess_duplicate(
+        self,
+        triage: BugTriage,
+        retrieval: asyncio.Task,
+        *,
+        report_text: str,
+    ) -> DuplicateAssessment | None:
+        """Rank the retrieved issues locally and ask the AI whether this report duplicates,
+        or is already fixed by, one of the best few. Suggestion only — never closes anything.
+        Returns None when it can't produce a useful suggestion."""
+        if not triage.is_bug:
+            retrieval.cancel()
             return None
-        # Exclude pull requests, which the issue-search endpoint also returns.
-        issues = [c for c in candidates if "pull_request" not in c]
+        candidates = await retrieval
+        issues = rank_duplicate_candidates(
+            f"{triage.title}\n{triage.summary}\n{report_text}",
+            candidates,
+        )
         if not issues:
             return None
-        report_text = triage.summary or triage.title
         assessment = await assess_duplicate(
             self.client,
             model=self.settings.openai_bugreport_model,
-            report_text=report_text,
+            report_text=triage.summary or triage.title,
             candidates=issues,
         )
         return assessment if assessment.has_match else None
@@ -455,28 +480,31 @@ class BugReportsCog(commands.Cog):
         await self.bot.wait_until_ready()
 
     async def _poll_once(self) -> None:
+        by_repo: dict[str, list] = {}
         for report in await list_tracked():
-            if not report.repo or report.issue_number is None:
-                continue
-            service = _get_github_service(self.settings, report.repo)
+            if report.repo and report.issue_number is not None:
+                by_repo.setdefault(report.repo, []).append(report)
+
+        for repo, reports in by_repo.items():
+            service = _get_github_service(self.settings, repo)
             try:
-                issue = await service.get_issue(report.issue_number)
-            except HTTPError as error:
-                status_code = getattr(getattr(error, "response", None), "status_code", None)
-                if status_code == 404:
-                    await set_status(report.thread_id, "dismissed")
-                continue
+                states = await service.get_issue_states([report.issue_number for report in reports])
             except Exception:
-                log.exception("Failed to fetch tracked issue #%s", report.issue_number)
+                log.exception("Failed to fetch tracked issue states for %s", repo)
                 continue
 
-            if issue.get("state") != "closed":
-                continue
-            if issue.get("state_reason") == "not_planned":
-                await set_status(report.thread_id, "dismissed")
-                continue
+            for report in reports:
+                issue = states.get(report.issue_number)
+                if issue is None:
+                    await set_status(report.thread_id, "dismissed")
+                    continue
+                if issue["state"] != "closed":
+                    continue
+                if issue["state_reason"] == "not_planned":
+                    await set_status(report.thread_id, "dismissed")
+                    continue
 
-            await self._resolve_report(report)
+                await self._resolve_report(report)
 
     async def _resolve_report(self, report) -> None:
         thread = self.bot.get_channel(report.thread_id)
@@ -1,11 +1,20 @@
+import asyncio
 import logging
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 
-from bulmaai.config import load_settings
+from bulmaai.config import current_settings
 from bulmaai.github.github_app_auth import GitHubAppAuth
 from bulmaai.github.github_service import GitHubService
+from bulmaai.services.github_mirror import (
+    get_github_item,
+    list_github_items,
+    list_github_labels,
+    search_github_items,
+    shared_github_mirror,
+    sync_github_repo,
+)
 from bulmaai.ui.github_views import (
     AddCommentModal,
     CloseReasonModal,
@@ -19,8 +28,10 @@ from bulmaai.ui.github_views import (
 from bulmaai.utils.permissions import is_staff
 
 log = logging.getLogger(__name__)
-settings = load_settings()
+settings = current_settings()
 
+# Discord select menus hold at most 25 options.
+ISSUE_BOARD_SIZE = 25
 
 async def repo_autocomplete(ctx: discord.AutocompleteContext) -> list[str]:
     current = (ctx.value or "").lower()
@@ -41,7 +52,88 @@ def _get_github_service(repo: str | None = None) -> GitHubService:
         repo=target_repo,
         base_branch=settings.GITHUB_BASE_BRANCH,
         whitelist_file_path=whitelist_path,
+        mirror=shared_github_mirror,
+    )
+
+
+async def _read_mirror(repo: str, reader, **kwargs):
+    """Read from the local mirror, or None if it has not synced *repo* yet."""
+    try:
+        if not await shared_github_mirror.is_synced(repo):
+            return None
+        return await reader(repo, **kwargs)
+    except Exception:
+        log.warning("GitHub mirror read failed for %s; falling back to the API", repo, exc_info=True)
+        return None
+
+
+async def _number_choices(ctx: discord.AutocompleteContext, *, kind: str) -> list[discord.OptionChoice]:
+    repo = ctx.options.get("repo") or settings.GITHUB_DEFAULT_REPO
+    items = await _read_mirror(repo, search_github_items, kind=kind, text=str(ctx.value or ""), limit=25)
+    return [
+        discord.OptionChoice(name=f"#{item['number']} {item['title']}"[:100], value=int(item["number"]))
+        for item in items or []
+    ]
+
+
+async def issue_number_autocomplete(ctx: discord.AutocompleteContext) -> list[discord.OptionChoice]:
+    return await _number_choices(ctx, kind="issue")
+
+
+async def pr_number_autocomplete(ctx: discord.AutocompleteContext) -> list[discord.OptionChoice]:
+    return await _number_choices(ctx, kind="pull")
+
+
+async def _collect_issues(service: GitHubService, *, state: str, labels: str | None = None) -> list[dict]:
+    """First ISSUE_BOARD_SIZE real issues, paging past pull requests as needed."""
+    mirrored = await _read_mirror(
+        service.repo,
+        list_github_items,
+        kind="issue",
+        state=state,
+        labels=labels,
+        limit=ISSUE_BOARD_SIZE,
     )
+    if mirrored is not None:
+        return mirrored
+    return [
+        issue
+        async for issue in service.iter_issues(
+            state=state,
+            labels=labels,
+            limit=ISSUE_BOARD_SIZE,
+            include_pull_requests=False,
+        )
+    ]
+
+
+async def _collect_prs(service: GitHubService, *, state: str) -> list[dict]:
+    mirrored = await _read_mirror(service.repo, list_github_items, kind="pull", state=state, limit=ISSUE_BOARD_SIZE)
+    if mirrored is not None:
+        return mirrored
+    return await service.list_prs(state=state)
+
+
+async def _get_issue(service: GitHubService, issue_number: int) -> dict:
+    mirrored = await _read_mirror(service.repo, get_github_item, kind="issue", number=issue_number)
+    if mirrored is not None:
+        return mirrored
+    return await service.get_issue(issue_number)
+
+
+async def _get_pr(service: GitHubService, pr_number: int) -> dict:
+    mirrored = await _read_mirror(service.repo, get_github_item, kind="pull", number=pr_number)
+    # Rows synced from the issues endpoint lack the branch details the PR embed shows.
+    if mirrored is not None and "head" in mirrored and "base" in mirrored:
+        return {"merged": mirrored.get("merged_at") is not None, **mirrored}
+    return await service.get_pr(pr_number)
+
+
+async def _collect_labels(service: GitHubService) -> list[dict]:
+    mirrored = await _read_mirror(service.repo, list_github_labels)
+    if mirrored:
+        return mirrored
+    return await service.get_labels()
 
 
 def _build_issue_embed(issue: dict, owner: str, repo: str) -> discord.Embed:
@@ -153,9 +245,48 @@ class GitHubCog(commands.Cog):
         self.bot = bot
         self.owner = settings.GITHUB_OWNER
         self.default_repo = settings.GITHUB_DEFAULT_REPO
+        self._mirror_sync_started = False
 
     github = discord.SlashCommandGroup("github", "GitHub issue management commands")
 
+    # ==================== mirror sync ====================
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        if self._mirror_sync_started or self.sync_github_mirror.is_running():
+            return
+        if settings.github_mirror_sync_minutes <= 0:
+            log.info("GitHub mirror sync disabled; boards read from the API.")
+            return
+        if not settings.GH_APP_ID or not settings.GH_INSTALLATION_ID or not settings.GH_APP_PRIVATE_KEY_PEM:
+            log.warning("GitHub App credentials missing; the GitHub mirror will not sync.")
+            return
+        self.sync_github_mirror.change_interval(minutes=settings.github_mirror_sync_minutes)
+        self.sync_github_mirror.start()
+        self._mirror_sync_started = True
+        log.info("GitHub mirror sync started every %s minutes.", settings.github_mirror_sync_minutes)
+
+    def cog_unload(self) -> None:
+        self.sync_github_mirror.cancel()
+
+    @tasks.loop(minutes=5)
+    async def sync_github_mirror(self) -> None:
+        for repo in settings.GITHUB_REPOS:
+            try:
+                written = await sync_github_repo(_get_github_service(repo))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("GitHub mirror sync failed for %s", repo)
+                continue
+            shared_github_mirror.mark_synced(repo)
+            if written:
+                log.info("GitHub mirror synced %s item(s) for %s.", written, repo)
+
+    @sync_github_mirror.before_loop
+    async def _before_mirror_sync(self) -> None:
+        await self.bot.wait_until_ready()
+
     async def _load_issue_board_view(
         self,
         *,
@@ -164,8 +295,7 @@ class GitHubCog(commands.Cog):
         issue_state: str,
     ) -> IssueBoardView:
         service = _get_github_service(repo)
-        issues = await service.list_issues(state="all")
-        issues = [issue for issue in issues if "pull_request" not in issue]
+        issues = await _collect_issues(service, state="all")
         return IssueBoardView(
             issues=issues or [{"number": issue_number, "title": f"Issue #{issue_number}", "labels": []}],
             owner=self.owner,
@@ -183,7 +313,7 @@ class GitHubCog(commands.Cog):
         merged: bool,
     ) -> PRBoardView:
         service = _get_github_service(repo)
-        prs = await service.list_prs(state="all")
+        prs = await _collect_prs(service, state="all")
         return PRBoardView(
             prs=prs or [{"number": pr_number, "title": f"PR #{pr_number}", "user": {"login": "unknown"}}],
             owner=self.owner,
@@ -224,7 +354,7 @@ class GitHubCog(commands.Cog):
         service = _get_github_service(target_repo)
 
         try:
-            labels = await service.get_labels()
+            labels = await _collect_labels(service)
         except Exception as error:
             log.exception("Failed to fetch labels")
             return await ctx.followup.send(f"Failed to fetch labels: {error}")
@@ -264,7 +394,7 @@ class GitHubCog(commands.Cog):
         await ctx.followup.send("Issue created successfully.", embed=embed, view=view)
 
     @github.command(name="close", description="Close a GitHub issue")
-    @discord.option("issue_number", description="Issue number to close", required=True)
+    @discord.option("issue_number", description="Issue number to close", autocomplete=issue_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def close_issue(self, ctx: discord.ApplicationContext, issue_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -295,7 +425,7 @@ class GitHubCog(commands.Cog):
         await ctx.followup.send(f"Issue #{issue_number} closed by {ctx.author.mention}.", embed=embed, view=view)
 
     @github.command(name="reopen", description="Reopen a closed GitHub issue")
-    @discord.option("issue_number", description="Issue number to reopen", required=True)
+    @discord.option("issue_number", description="Issue number to reopen", autocomplete=issue_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def reopen_issue(self, ctx: discord.ApplicationContext, issue_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -320,7 +450,7 @@ class GitHubCog(commands.Cog):
         await ctx.followup.send(f"Issue #{issue_number} reopened by {ctx.author.mention}.", embed=embed, view=view)
 
     @github.command(name="view", description="View a GitHub issue")
-    @discord.option("issue_number", description="Issue number to view", required=True)
+    @discord.option("issue_number", description="Issue number to view", autocomplete=issue_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def view_issue(self, ctx: discord.ApplicationContext, issue_number: int, repo: str = None):
         await ctx.defer()
@@ -351,12 +481,11 @@ class GitHubCog(commands.Cog):
         service = _get_github_service(target_repo)
 
         try:
-            issues = await service.list_issues(state=state, labels=label)
+            issues = await _collect_issues(service, state=state, labels=label)
         except Exception as error:
             log.exception("Failed to list issues")
             return await ctx.followup.send(f"Failed to list issues: {error}")
 
-        issues = [issue for issue in issues if "pull_request" not in issue]
         if not issues:
             return await ctx.followup.send(f"No {state} issues found.")
 
@@ -369,7 +498,7 @@ class GitHubCog(commands.Cog):
         )
 
     @github.command(name="comment", description="Add a comment to a GitHub issue")
-    @discord.option("issue_number", description="Issue number", required=True)
+    @discord.option("issue_number", description="Issue number", autocomplete=issue_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def add_comment(self, ctx: discord.ApplicationContext, issue_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -406,7 +535,7 @@ class GitHubCog(commands.Cog):
         service = _get_github_service(target_repo)
 
         try:
-            labels = await service.get_labels()
+            labels = await _collect_labels(service)
         except Exception as error:
             log.exception("Failed to fetch labels")
             return await ctx.followup.send(f"Failed to fetch labels: {error}")
@@ -426,7 +555,7 @@ class GitHubCog(commands.Cog):
         await ctx.followup.send(embed=embed)
 
     @github.command(name="addlabel", description="Add a label to an issue")
-    @discord.option("issue_number", description="Issue number", required=True)
+    @discord.option("issue_number", description="Issue number", autocomplete=issue_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def add_label_to_issue(self, ctx: discord.ApplicationContext, issue_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -437,7 +566,7 @@ class GitHubCog(commands.Cog):
         service = _get_github_service(target_repo)
 
         try:
-            labels = await service.get_labels()
+            labels = await _collect_labels(service)
         except Exception as error:
             return await ctx.followup.send(f"Failed to fetch labels: {error}")
 
@@ -477,7 +606,7 @@ class GitHubCog(commands.Cog):
         service = _get_github_service(target_repo)
 
         try:
-            prs = await service.list_prs(state=state)
+            prs = await _collect_prs(service, state=state)
         except Exception as error:
             log.exception("Failed to list PRs")
             return await ctx.followup.send(f"Failed to list pull requests: {error}")
@@ -494,7 +623,7 @@ class GitHubCog(commands.Cog):
         )
 
     @pr.command(name="view", description="View a pull request")
-    @discord.option("pr_number", description="PR number to view", required=True)
+    @discord.option("pr_number", description="PR number to view", autocomplete=pr_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def view_pr(self, ctx: discord.ApplicationContext, pr_number: int, repo: str = None):
         await ctx.defer()
@@ -517,7 +646,7 @@ class GitHubCog(commands.Cog):
         await ctx.followup.send(embed=embed, view=view)
 
     @pr.command(name="merge", description="Merge a pull request")
-    @discord.option("pr_number", description="PR number to merge", required=True)
+    @discord.option("pr_number", description="PR number to merge", autocomplete=pr_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def merge_pr(self, ctx: discord.ApplicationContext, pr_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -559,7 +688,7 @@ class GitHubCog(commands.Cog):
         )
 
     @pr.command(name="close", description="Close a pull request")
-    @discord.option("pr_number", description="PR number to close", required=True)
+    @discord.option("pr_number", description="PR number to close", autocomplete=pr_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def close_pr(self, ctx: discord.ApplicationContext, pr_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -585,7 +714,7 @@ class GitHubCog(commands.Cog):
         await ctx.followup.send(f"PR #{pr_number} closed by {ctx.author.mention}.", embed=embed, view=view)
 
     @pr.command(name="reopen", description="Reopen a closed pull request")
-    @discord.option("pr_number", description="PR number to reopen", required=True)
+    @discord.option("pr_number", description="PR number to reopen", autocomplete=pr_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def reopen_pr(self, ctx: discord.ApplicationContext, pr_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -611,7 +740,7 @@ class GitHubCog(commands.Cog):
         await ctx.followup.send(f"PR #{pr_number} reopened by {ctx.author.mention}.", embed=embed, view=view)
 
     @pr.command(name="comment", description="Add a comment to a pull request")
-    @discord.option("pr_number", description="PR number", required=True)
+    @discord.option("pr_number", description="PR number", autocomplete=pr_number_autocomplete, required=True)
     @discord.option("repo", description="Repository name", autocomplete=repo_autocomplete, required=False)
     async def comment_pr(self, ctx: discord.ApplicationContext, pr_number: int, repo: str = None):
         if not is_staff(ctx.author):
@@ -672,8 +801,8 @@ class GitHubCog(commands.Cog):
         issue_number = int(interaction.data.get("values", [None])[0])
         service = _get_github_service(repo)
 
-        issue = await service.get_issue(issue_number)
-        issues = [item for item in await service.list_issues(state="all") if "pull_request" not in item]
+        issue = await _get_issue(service, issue_number)
+        issues = await _collect_issues(service, state="all")
         embed = _build_issue_embed(issue, owner, repo)
         view = IssueBoardView(
             issues=issues,
@@ -694,8 +823,8 @@ class GitHubCog(commands.Cog):
         pr_number = int(interaction.data.get("values", [None])[0])
         service = _get_github_service(repo)
 
-        pr = await service.get_pr(pr_number)
-        prs = await service.list_prs(state="all")
+        pr = await _get_pr(service, pr_number)
+        prs = await _collect_prs(service, state="all")
         embed = _build_pr_embed(pr, owner, repo)
         view = PRBoardView(
             prs=prs,
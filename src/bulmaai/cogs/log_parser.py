@@ -1,20 +1,33 @@
 import logging
+import os
 import re
+import tempfile
 
 import discord
 from discord.ext import commands
 
-from bulmaai.utils.log_parser import parse_log, LogReport
+from bulmaai.services.attachment_download import AttachmentDownloader, AttachmentStream
+from bulmaai.services.log_parsing import LogParseQueueFull, LogParseTimeout, LogParsingService
+from bulmaai.services.log_report_cache import LogReportCache, content_digest
+from bulmaai.utils.crash_signatures import default_crash_signature_index
+from bulmaai.utils.log_parser import LogReport
+from bulmaai.utils.mod_compatibility import default_mod_compatibility_index
 from bulmaai.utils.permissions import is_admin
 
 log = logging.getLogger(__name__)
 
 ALLOWED_EXTENSIONS = (".log", ".txt")
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+# Logs are spooled to disk and parsed in chunks, so this only bounds disk use
+# and parse time, not memory.
+MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
 
 # High-confidence filenames that are always auto-parsed without admin approval.
 _AUTO_PARSE_NAMES = {"latest.log", "debug.log", "crash-report.txt"}
 
+# _looks_like_mc_log inspects this many characters; 4 bytes each covers any UTF-8.
+_TRIAGE_CHARS = 8000
+PREVIEW_BYTES = _TRIAGE_CHARS * 4
+
 # Reaction emoji used for admin approval of uncertain log files.
 _APPROVE_EMOJI = "🔍"
 
@@ -69,6 +82,25 @@ def _is_high_confidence_name(filename: str) -> bool:
     return False
 
 
+async def _spool_to_tempfile(download: AttachmentStream) -> tuple[str, str]:
+    """Write *download* to a temporary file; return ``(path, sha256)``."""
+    file = tempfile.NamedTemporaryFile(prefix="bulmaai-log-", suffix=".log", delete=False)
+    try:
+        with file:
+            digest = await download.spool(file)
+    except BaseException:
+        _remove_tempfile(file.name)
+        raise
+    return file.name, digest
+
+
+def _remove_tempfile(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        log.warning("Could not remove temporary log file %s", path)
+
+
 # ── Embed builder ─────────────────────────────────────────────────────────────
 
 def _build_embed(report: LogReport, filename: str) -> discord.Embed:
@@ -158,6 +190,20 @@ def _build_embed(report: LogReport, filename: str) -> discord.Embed:
             inline=False,
         )
 
+    # ── Compatibility ─────────────────────────────────────────────────────────
+    issues = default_mod_compatibility_index().check(report)
+    if issues:
+        issues_text = "\n".join(
+            f"{'🛑' if issue.severity == 'error' else '⚠️'} {issue.message}" for issue in issues[:5]
+        )
+        if len(issues) > 5:
+            issues_text += f"\n*…and **{len(issues) - 5}** more*"
+        embed.add_field(
+            name=f"⚠️ Compatibility ({len(issues)})",
+            value=_truncate(issues_text, 900),
+            inline=False,
+        )
+
     # ── Errors ────────────────────────────────────────────────────────────────
     if report.errors:
         cleaned = [_clean_error_line(e) for e in report.errors[:8]]
@@ -174,6 +220,19 @@ def _build_embed(report: LogReport, filename: str) -> discord.Embed:
             inline=False,
         )
 
+    # ── Known crash signatures ────────────────────────────────────────────────
+    causes = default_crash_signature_index().match_report(report)
+    if causes:
+        causes_text = "\n".join(
+            f"• **{sig.cause}**\n  ↳ {sig.fix}" if sig.fix else f"• **{sig.cause}**"
+            for sig in causes[:3]
+        )
+        embed.add_field(
+            name="💡 Likely cause",
+            value=_truncate(causes_text, 900),
+            inline=False,
+        )
+
     # ── Stacktrace snippet ────────────────────────────────────────────────────
     if report.stacktrace:
         summary = _summarise_stacktrace(report.stacktrace)
@@ -206,6 +265,163 @@ class LogParserCog(commands.Cog):
         # Maps message-id → list of attachment URLs that are pending admin approval.
         # Cleared once the reaction is received or after the message is too old.
         self._pending: dict[int, list[str]] = {}
+        settings = bot.settings
+        self._parser = LogParsingService(
+            max_workers=settings.log_parser_workers,
+            max_queue_size=settings.log_parser_queue_size,
+            timeout_seconds=settings.log_parser_timeout_seconds,
+        )
+        self._cache = LogReportCache(
+            max_entries=settings.log_parser_cache_size,
+            ttl_seconds=settings.log_parser_cache_ttl_seconds,
+            persist=settings.log_parser_cache_persist,
+        )
+        self._downloader = AttachmentDownloader(max_bytes=MAX_FILE_SIZE)
+
+    def cog_unload(self) -> None:
+        self._parser.close()
+        self.bot.loop.create_task(self._downloader.close())
+
+    async def _reply_from_cache(
+        self,
+        message: discord.Message,
+        attachment: discord.Attachment,
+        digest: str,
+    ) -> bool:
+        """Reply with a cached analysis of *digest*; False on a cache miss."""
+        entry = await self._cache.lookup(digest)
+        if entry is None:
+            return False
+
+        if entry.embed is not None and entry.filename == attachment.filename:
+            embed = discord.Embed.from_dict(entry.embed)
+            embed.timestamp = discord.utils.utcnow()
+        else:
+            embed = _build_embed(entry.report, attachment.filename)
+            entry.embed = embed.to_dict()
+            entry.filename = attachment.filename
+
+        log.info(
+            "Served cached log analysis for %s (hits=%d misses=%d)",
+            attachment.filename,
+            self._cache.stats.hits,
+            self._cache.stats.misses,
+            extra={"event": "log_report_cache_hit", "message_id": message.id},
+        )
+        await message.reply(embed=embed, mention_author=False)
+        return True
+
+    async def _reply_with_analysis(
+        self,
+        message: discord.Message,
+        attachment: discord.Attachment,
+        log_path: str,
+        digest: str,
+        *,
+        check_cache: bool = True,
+    ) -> bool:
+        """Parse the spooled log at *log_path* off the event loop and reply.
+
+        Returns False when the parser was too busy, so the caller can keep the
+        attachment around for a later retry.
+        """
+        if check_cache and await self._reply_from_cache(message, attachment, digest):
+            return True
+
+        try:
+            async with message.channel.typing():
+                report = await self._parser.parse_file(log_path)
+                embed = _build_embed(report, attachment.filename)
+        except LogParseQueueFull:
+            log.warning(
+                "Log parser queue full; deferring %s",
+                attachment.filename,
+                extra={"event": "log_parse_rejected", "message_id": message.id},
+            )
+            await message.reply(
+                "⏳ I'm analysing a lot of logs right now. Please try again in a minute.",
+                mention_author=False,
+            )
+            return False
+        except LogParseTimeout:
+            log.warning(
+                "Timed out parsing %s",
+                attachment.filename,
+                extra={"event": "log_parse_timeout", "message_id": message.id},
+            )
+            await message.reply(
+                f"⌛ `{attachment.filename}` took too long to analyse. "
+                "Please share it with staff directly.",
+                mention_author=False,
+            )
+            return True
+        except Exception:
+            log.exception("Failed to parse attachment %s", attachment.filename)
+            return True
+
+        await self._cache.store(
+            digest,
+            report,
+            embed=embed.to_dict(),
+            filename=attachment.filename,
+        )
+        await message.reply(embed=embed, mention_author=False)
+        return True
+
+    # ── /logstats: parser and cache metrics ──────────────────────────────────
+
+    @discord.slash_command(
+        name="logstats",
+        description="Show log parser queue and cache statistics (admin only)",
+    )
+    async def logstats(self, ctx: discord.ApplicationContext) -> None:
+        if not isinstance(ctx.author, discord.Member) or not is_admin(ctx.author):
+            await ctx.respond("Admins only.", ephemeral=True)
+            return
+
+        parse = self._parser.stats
+        cache = self._cache.stats
+        embed = discord.Embed(title="🔍 Log Parser Stats", colour=discord.Colour.blurple())
+        embed.add_field(
+            name="Parsing",
+            value=(
+                f"Completed: **{parse.completed}** / submitted {parse.submitted}\n"
+                f"Rejected (busy): {parse.rejected} · Timed out: {parse.timed_out} · Failed: {parse.failed}\n"
+                f"In flight: {self._parser.in_flight} · Waiting: {self._parser.queue_size}"
+            ),
+            inline=False,
+        )
+        embed.add_field(
+            name="Latency",
+            value=(
+                f"Queue wait: avg {parse.average_queue_wait_ms:.0f} ms · "
+                f"max {parse.queue_wait_seconds_max * 1000:.0f} ms\n"
+                f"Parse: avg {parse.average_parse_ms:.0f} ms · "
+                f"max {parse.parse_seconds_max * 1000:.0f} ms"
+            ),
+            inline=False,
+        )
+        embed.add_field(
+            name="Report cache",
+            value=(
+                f"Hits: **{cache.hits}** · Misses: {cache.misses} · "
+                f"Hit ratio: {cache.hit_ratio:.0%}\n"
+                f"From Postgres: {cache.persistent_hits} · Downloads skipped: {cache.downloads_skipped}\n"
+                f"Entries: {len(self._cache)} · Evictions: {cache.evictions}"
+            ),
+            inline=False,
+        )
+        downloads = self._downloader.stats
+        embed.add_field(
+            name="Downloads",
+            value=(
+                f"Streams: {downloads.streams} · Full downloads: {downloads.full_downloads}\n"
+                f"Downloaded: {downloads.bytes_downloaded / 1024:.0f} KB · "
+                f"Saved by preview triage: **{downloads.bytes_saved / 1024:.0f} KB**"
+            ),
+            inline=False,
+        )
+        await ctx.respond(embed=embed, ephemeral=True)
 
     # ── on_message: detect & triage ───────────────────────────────────────────
 
@@ -230,33 +446,65 @@ class LogParserCog(commands.Cog):
                 )
                 continue
 
-            # Read a small preview to decide if this is a Minecraft log at all.
+            # Stream only a small preview to decide if this is a Minecraft log
+            # at all; the rest is spooled to disk from the same response only
+            # when the file is going to be parsed right away.
+            high_confidence = _is_high_confidence_name(attachment.filename)
+            if high_confidence:
+                known_digest = self._cache.digest_for_attachment(attachment.id)
+                if known_digest is not None and await self._reply_from_cache(message, attachment, known_digest):
+                    self._cache.stats.downloads_skipped += 1
+                    continue
+
+            log_path: str | None = None
+            digest: str | None = None
             try:
-                raw_bytes = await attachment.read()
-                text = raw_bytes.decode("utf-8", errors="replace")
+                async with self._downloader.stream(attachment.url, size=attachment.size) as download:
+                    preview = await download.read_preview(PREVIEW_BYTES)
+                    if not _looks_like_mc_log(preview.decode("utf-8", errors="replace")):
+                        # Not a MC log → ignore completely, even if .log/.txt
+                        continue
+                    preview_digest = content_digest(preview)
+                    if high_confidence:
+                        # A re-upload of a file we already analysed: answer
+                        # from the cache and drop the rest of the download.
+                        known_digest = self._cache.digest_for_preview(attachment.size, preview_digest)
+                        if known_digest is not None and await self._reply_from_cache(
+                            message, attachment, known_digest
+                        ):
+                            self._cache.remember_attachment(attachment.id, known_digest)
+                            self._cache.stats.downloads_skipped += 1
+                            continue
+                        log_path, digest = await _spool_to_tempfile(download)
+                    elif download.complete:
+                        # Small file: the preview already holds all of it.
+                        digest = preview_digest
             except Exception:
                 log.exception("Failed to read attachment %s", attachment.filename)
                 continue
 
-            if not _looks_like_mc_log(text):
-                # Not a MC log → ignore completely, even if .log/.txt
-                continue
+            if digest is not None:
+                self._cache.remember_attachment(attachment.id, digest)
+                self._cache.remember_preview(attachment.size, preview_digest, digest)
 
-            # ── High-confidence name → auto-parse immediately ─────────────
-            if _is_high_confidence_name(attachment.filename):
-                log.info(
-                    "Auto-parsing %s uploaded by %s in #%s",
-                    attachment.filename,
-                    message.author,
-                    getattr(message.channel, "name", "DM"),
-                )
-                async with message.channel.typing():
-                    report = parse_log(text)
-                    embed = _build_embed(report, attachment.filename)
-                await message.reply(embed=embed, mention_author=False)
-            else:
+            if log_path is None or digest is None:
                 # ── Uncertain name → queue for admin approval ─────────────
                 pending_urls.append(attachment.url)
+                continue
+
+            # ── High-confidence name → auto-parse immediately ─────────────
+            log.info(
+                "Auto-parsing %s uploaded by %s in #%s",
+                attachment.filename,
+                message.author,
+                getattr(message.channel, "name", "DM"),
+            )
+            try:
+                if not await self._reply_with_analysis(message, attachment, log_path, digest):
+                    # Parser busy: keep it pending so an admin can retry it.
+                    pending_urls.append(attachment.url)
+            finally:
+                _remove_tempfile(log_path)
 
         # If any attachments need approval, add the reaction and store state.
         if pending_urls:
@@ -291,6 +539,7 @@ class LogParserCog(commands.Cog):
             return
 
         message = reaction.message
+        deferred: list[str] = []
 
         for url in urls:
             # Find the matching attachment by URL.
@@ -300,9 +549,16 @@ class LogParserCog(commands.Cog):
             if attachment is None:
                 continue
 
+            # Already hashed at triage: an identical upload may be cached, so
+            # the file does not need to be downloaded again.
+            known_digest = self._cache.digest_for_attachment(attachment.id)
+            if known_digest is not None and await self._reply_from_cache(message, attachment, known_digest):
+                self._cache.stats.downloads_skipped += 1
+                continue
+
             try:
-                raw_bytes = await attachment.read()
-                text = raw_bytes.decode("utf-8", errors="replace")
+                async with self._downloader.stream(attachment.url, size=attachment.size) as download:
+                    log_path, digest = await _spool_to_tempfile(download)
             except Exception:
                 log.exception("Failed to read attachment %s on approval", attachment.filename)
                 continue
@@ -314,10 +570,21 @@ class LogParserCog(commands.Cog):
                 getattr(message.channel, "name", "DM"),
             )
 
-            async with message.channel.typing():
-                report = parse_log(text)
-                embed = _build_embed(report, attachment.filename)
-            await message.reply(embed=embed, mention_author=False)
+            try:
+                if not await self._reply_with_analysis(
+                    message,
+                    attachment,
+                    log_path,
+                    digest,
+                    check_cache=digest != known_digest,
+                ):
+                    deferred.append(url)
+            finally:
+                _remove_tempfile(log_path)
+
+        # Keep busy-rejected files pending so an admin can react again later.
+        if deferred:
+            self._pending[message.id] = deferred
 
 
 # ── Detection helper ──────────────────────────────────────────────────────────
@@ -336,7 +603,7 @@ def _looks_like_mc_log(text: str) -> bool:
         "[render thread/",
         "[server thread/",
     )
-    lower = text[:8000].lower()
+    lower = text[:_TRIAGE_CHARS].lower()
     return any(ind in lower for ind in indicators)
 
 
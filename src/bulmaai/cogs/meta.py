@@ -5,6 +5,7 @@ import discord
 from discord.ext import commands
 
 from bulmaai.config import (
+    current_settings,
     format_setting_value,
     get_editable_setting_names,
     load_settings,
@@ -144,7 +145,7 @@ class MetaCog(commands.Cog):
         if name not in editable:
             return await ctx.respond("Unknown setting name.", ephemeral=True)
 
-        current = load_settings()
+        current = current_settings()
         defaults = load_settings(include_overrides=False)
         overrides = load_settings_overrides()
 
@@ -221,7 +222,7 @@ class MetaCog(commands.Cog):
         if hasattr(self.bot, "reload_settings"):
             self.bot.reload_settings()
 
-        current = load_settings()
+        current = current_settings()
         await ctx.respond(
             f"Reset override for `{name}`. Current value is now `{format_setting_value(getattr(current, name))}`.",
             ephemeral=True,
@@ -62,6 +62,7 @@ class PatchNotesUpdatesCog(commands.Cog):
         self.gh = self._build_github_service()
         self._poll_lock = asyncio.Lock()
         self._poll_started = False
+        self._last_blob_sha: str | None = None
 
     def _build_github_service(self) -> GitHubService | None:
         settings = self.bot.settings
@@ -109,11 +110,16 @@ class PatchNotesUpdatesCog(commands.Cog):
     async def _poll_once(self) -> None:
         if self.gh is None:
             return
-        content, _blob_sha = await self.gh.get_file(PATCH_NOTES_FILE_PATH, ref=PATCH_NOTES_BRANCH)
+        content, blob_sha = await self.gh.get_file(PATCH_NOTES_FILE_PATH, ref=PATCH_NOTES_BRANCH)
+        # get_file revalidates with If-None-Match, so an unchanged file costs a
+        # 304 and comes back with the blob sha we already processed.
+        if blob_sha == self._last_blob_sha:
+            return
         content_sha = hashlib.sha256(content.encode("utf-8")).hexdigest()
 
         previous = await get_patch_notes_state(PATCH_NOTES_BRANCH, PATCH_NOTES_FILE_PATH)
         if previous is not None and previous.content_sha == content_sha:
+            self._last_blob_sha = blob_sha
             return
 
         await upsert_patch_notes_state(
@@ -127,10 +133,12 @@ class PatchNotesUpdatesCog(commands.Cog):
 
         if previous is None:
             log.info("First patch notes run; seeding state without announcing.")
+            self._last_blob_sha = blob_sha
             return
 
         summary = summarize_patch_notes_update(previous.content, content)
         await self._announce_update(summary)
+        self._last_blob_sha = blob_sha
 
     async def _announce_update(self, summary: str) -> None:
         embed = build_patch_notes_update_embed(
@@ -9,7 +9,6 @@ from urllib.parse import urlparse
 
 import discord
 from discord.ext import commands
-from requests import HTTPError
 
 from bulmaai.github.github_app_auth import GitHubAppAuth
 from bulmaai.github.github_service import GitHubService
@@ -50,6 +49,12 @@ from bulmaai.services.release_webhook import (
     unregister_extra_get_route,
     unregister_extra_raw_webhook_route,
 )
+from bulmaai.services.whitelist_index import WhitelistIndex
+from bulmaai.services.whitelist_queue import (
+    WhitelistChange,
+    WhitelistChangeQueue,
+    WhitelistChangeResult,
+)
 from bulmaai.ui.patreon_views import (
     AdminPRView,
     BetaAccessUsernameModal,
@@ -88,10 +93,6 @@ def _patreon_gift_branch_name(owner_id: int, recipient_id: int) -> str:
     return f"patreon/gift-{owner_id}-{recipient_id}"
 
 
-def _patreon_remove_branch_name(owner_id: int) -> str:
-    return f"patreon/remove-{owner_id}"
-
-
 def _eligible_tier_ids(settings) -> tuple[str, ...]:
     return tuple(str(tier_id) for tier_id in settings.patreon_eligible_tier_ids)
 
@@ -109,16 +110,6 @@ def _is_active_link(link: PatreonLink, settings) -> bool:
     return link.entitlement_active
 
 
-def _github_error_status(exc: HTTPError) -> int | None:
-    response = getattr(exc, "response", None)
-    status_code = getattr(response, "status_code", None)
-    return int(status_code) if isinstance(status_code, int) else None
-
-
-def _is_recoverable_merge_error(exc: HTTPError) -> bool:
-    return _github_error_status(exc) in {405, 409}
-
-
 def _active_self_grant(grants: list[PatreonGrant], member_id: int) -> PatreonGrant | None:
     for grant in grants:
         if (
@@ -218,6 +209,10 @@ class PatreonWhitelistFlowCog(commands.Cog):
         self._beta_access_locks: dict[int, asyncio.Lock] = {}
         self._patreon_oauth_state_locks: dict[str, asyncio.Lock] = {}
         self._processed_patreon_oauth_states: dict[str, float] = {}
+        self._whitelist_changes = WhitelistChangeQueue(
+            self.gh,
+            window_seconds=bot.settings.whitelist_batch_window_seconds,
+        )
 
     def _build_github_service(self) -> GitHubService:
         settings = self.bot.settings
@@ -242,6 +237,23 @@ class PatreonWhitelistFlowCog(commands.Cog):
         if not hasattr(self, "_processed_patreon_oauth_states"):
             self._processed_patreon_oauth_states = {}
 
+    def _whitelist_queue(self) -> WhitelistChangeQueue:
+        if not hasattr(self, "_whitelist_changes"):
+            window = max(float(getattr(self.bot.settings, "whitelist_batch_window_seconds", 0) or 0), 0.0)
+            self._whitelist_changes = WhitelistChangeQueue(self.gh, window_seconds=window)
+        return self._whitelist_changes
+
+    async def _submit_whitelist_change(self, change: WhitelistChange) -> WhitelistChangeResult:
+        return await self._whitelist_queue().submit(change)
+
+    async def _is_whitelisted(self, nickname: str) -> bool:
+        """Check the cached base-branch index; usually answers without a GitHub request.
+
+        The index is re-validated against the file's SHA once its TTL lapses.
+        Writes never rely on it: they re-check a fresh snapshot.
+        """
+        return nickname in await self._whitelist_queue().index.get(self.gh)
+
     def _beta_access_lock(self, member_id: int) -> asyncio.Lock:
         self._ensure_runtime_state()
         key = int(member_id)
@@ -924,25 +936,19 @@ class PatreonWhitelistFlowCog(commands.Cog):
             )
 
     async def _auto_approve_beta_access(self, member: discord.Member, nickname: str) -> AutoApprovalResult:
-        branch = _patreon_branch_name(member.id)
-        pr_data = await self._create_whitelist_add_pr(
-            branch=branch,
-            nickname=nickname,
-            title=f"Add beta tester: {nickname}",
-            commit_message=f"Add beta tester: {nickname}",
-            body=f"Automatically approved through Patreon OAuth for Discord user {member} ({member.id}).",
-        )
-        if pr_data is None:
+        if await self._is_whitelisted(nickname):
             return AutoApprovalResult(pr_url=None, approved=False)
-        pr_number = pr_data["number"]
-        pr_url = pr_data["html_url"]
-        return await self._merge_auto_pr(
+        result = await self._submit_whitelist_change(
+            WhitelistChange.add(
+                nickname,
+                summary=f"Add beta tester: {nickname}",
+                detail=f"Add `{nickname}`: approved through Patreon OAuth for Discord user {member} ({member.id}).",
+            )
+        )
+        return await self._auto_approval_result(
+            result,
             member=member,
             nickname=nickname,
-            branch=branch,
-            pr_number=pr_number,
-            pr_url=pr_url,
-            success_comment=f"Automatically approved through Patreon OAuth for {member} ({member.id}).",
             pending_description="Automatic Patreon approval",
         )
 
@@ -952,70 +958,45 @@ class PatreonWhitelistFlowCog(commands.Cog):
         old_nickname: str,
         new_nickname: str,
     ) -> AutoApprovalResult:
-        branch = _patreon_branch_name(member.id)
-        pr_data = await self._create_whitelist_update_pr(
-            branch=branch,
-            old_nickname=old_nickname,
-            new_nickname=new_nickname,
-            title=f"Update beta tester: {old_nickname} -> {new_nickname}",
-            commit_message=f"Update beta tester: {old_nickname} -> {new_nickname}",
-            body=(
-                f"Automatically updated through Patreon OAuth for Discord user {member} ({member.id}). "
-                f"Replacing `{old_nickname}` with `{new_nickname}`."
-            ),
+        result = await self._submit_whitelist_change(
+            WhitelistChange.update(
+                old_nickname,
+                new_nickname,
+                summary=f"Update beta tester: {old_nickname} -> {new_nickname}",
+                detail=(
+                    f"Replace `{old_nickname}` with `{new_nickname}`: updated through Patreon OAuth "
+                    f"for Discord user {member} ({member.id})."
+                ),
+            )
         )
-        if pr_data is None:
-            return AutoApprovalResult(pr_url=None, approved=False)
-        pr_number = pr_data["number"]
-        pr_url = pr_data["html_url"]
-        return await self._merge_auto_pr(
+        return await self._auto_approval_result(
+            result,
             member=member,
             nickname=new_nickname,
-            branch=branch,
-            pr_number=pr_number,
-            pr_url=pr_url,
-            success_comment=(
-                f"Automatically updated Patreon beta access for {member} ({member.id}): "
-                f"{old_nickname} -> {new_nickname}."
-            ),
             pending_description="Automatic Patreon username update",
         )
 
-    async def _merge_auto_pr(
+    async def _auto_approval_result(
         self,
+        result: WhitelistChangeResult,
         *,
         member: discord.Member,
         nickname: str,
-        branch: str,
-        pr_number: int,
-        pr_url: str,
-        success_comment: str,
         pending_description: str,
     ) -> AutoApprovalResult:
-        try:
-            await self.gh.merge_pr(pr_number)
-        except HTTPError as exc:
-            if not _is_recoverable_merge_error(exc):
-                raise
-            current_pr = await self.gh.get_pr(pr_number)
-            if current_pr.get("merged"):
-                await self.gh.remove_branch(branch)
-                return AutoApprovalResult(pr_url=pr_url, approved=True)
+        if not result.changed:
+            return AutoApprovalResult(pr_url=None, approved=False)
+        if not result.merged:
             await self._record_auto_merge_pending(
                 member=member,
                 nickname=nickname,
-                pr_number=pr_number,
-                pr_url=pr_url,
-                status_code=_github_error_status(exc),
+                pr_number=result.pr_number,
+                pr_url=result.pr_url,
+                status_code=result.merge_status,
                 description=pending_description,
             )
-            return AutoApprovalResult(pr_url=pr_url, approved=False)
-        await self.gh.add_pr_comment(
-            pr_number,
-            success_comment,
-        )
-        await self.gh.remove_branch(branch)
-        return AutoApprovalResult(pr_url=pr_url, approved=True)
+            return AutoApprovalResult(pr_url=result.pr_url, approved=False)
+        return AutoApprovalResult(pr_url=result.pr_url, approved=True)
 
     async def _record_auto_merge_pending(
         self,
@@ -1058,63 +1039,19 @@ class PatreonWhitelistFlowCog(commands.Cog):
         commit_message: str,
         body: str,
     ) -> dict | None:
-        base_text, _base_sha = await self.gh.get_whitelist_file(ref=self.gh.base_branch)
-        base_lines = [ln.strip() for ln in base_text.splitlines() if ln.strip()]
-        if nickname in base_lines:
+        if await self._is_whitelisted(nickname):
             return None
-
-        await self.gh.create_branch(branch, self.gh.base_branch)
-        branch_text, branch_sha = await self.gh.get_whitelist_file(ref=branch)
-        branch_lines = [ln.strip() for ln in branch_text.splitlines() if ln.strip()]
-        if nickname not in branch_lines:
-            branch_lines.append(nickname)
-            await self.gh.put_whitelist_file(
-                branch=branch,
-                new_text="\n".join(branch_lines) + "\n",
-                sha=branch_sha,
-                message=commit_message,
-            )
-        return await self.gh.create_or_get_pr(
-            head_branch=branch,
-            title=title,
-            body=body,
-        )
-
-    async def _create_whitelist_update_pr(
-        self,
-        *,
-        branch: str,
-        old_nickname: str,
-        new_nickname: str,
-        title: str,
-        commit_message: str,
-        body: str,
-    ) -> dict | None:
-        base_text, _base_sha = await self.gh.get_whitelist_file(ref=self.gh.base_branch)
-        base_lines = [ln.strip() for ln in base_text.splitlines() if ln.strip()]
-        old_key = old_nickname.casefold()
-        new_key = new_nickname.casefold()
-        base_has_old = any(line.casefold() == old_key for line in base_lines)
-        base_has_new = any(line.casefold() == new_key for line in base_lines)
-        if not base_has_old and base_has_new:
+        snapshot = await self.gh.get_whitelist_snapshot(branch)
+        base = self._whitelist_queue().index.remember(snapshot.base_text, snapshot.base_blob_oid)
+        if nickname in base:
             return None
 
-        await self.gh.create_branch(branch, self.gh.base_branch)
-        branch_text, branch_sha = await self.gh.get_whitelist_file(ref=branch)
-        branch_lines = [ln.strip() for ln in branch_text.splitlines() if ln.strip()]
-        updated_lines = [line for line in branch_lines if line.casefold() != old_key]
-        if not any(line.casefold() == new_key for line in updated_lines):
-            updated_lines.append(new_nickname)
-        if updated_lines == branch_lines:
-            return None
-        await self.gh.put_whitelist_file(
-            branch=branch,
-            new_text="\n".join(updated_lines) + "\n",
-            sha=branch_sha,
+        branch_whitelist = WhitelistIndex(snapshot.branch_text)
+        new_text = branch_whitelist.text() if branch_whitelist.add(nickname) else None
+        return await self.gh.commit_whitelist_and_open_pr(
+            snapshot,
+            new_text=new_text,
             message=commit_message,
-        )
-        return await self.gh.create_or_get_pr(
-            head_branch=branch,
             title=title,
             body=body,
         )
@@ -1190,14 +1127,12 @@ class PatreonWhitelistFlowCog(commands.Cog):
 
         pr_url: str | None = None
         if nickname_changed:
-            branch = f"patreon/gift-edit-{ctx.author.id}-{target.id}"
             try:
                 approval = await self._auto_update_gift_access(
                     owner=ctx.author,
                     recipient=target,
                     old_nickname=old_nickname,
                     new_nickname=nickname,
-                    branch=branch,
                 )
             except Exception:
                 log.exception(
@@ -1302,34 +1237,22 @@ class PatreonWhitelistFlowCog(commands.Cog):
         recipient: discord.Member,
         old_nickname: str,
         new_nickname: str,
-        branch: str,
     ) -> AutoApprovalResult:
-        pr_data = await self._create_whitelist_update_pr(
-            branch=branch,
-            old_nickname=old_nickname,
-            new_nickname=new_nickname,
-            title=f"Update gifted beta tester: {old_nickname} -> {new_nickname}",
-            commit_message=f"Update gifted beta tester: {old_nickname} -> {new_nickname}",
-            body=(
-                f"Username update requested by Discord user {owner} ({owner.id}) "
-                f"for gift recipient {recipient} ({recipient.id}). "
-                f"Replacing `{old_nickname}` with `{new_nickname}`."
-            ),
+        result = await self._submit_whitelist_change(
+            WhitelistChange.update(
+                old_nickname,
+                new_nickname,
+                summary=f"Update gifted beta tester: {old_nickname} -> {new_nickname}",
+                detail=(
+                    f"Replace `{old_nickname}` with `{new_nickname}`: gift username update by "
+                    f"Discord user {owner} ({owner.id}) for {recipient} ({recipient.id})."
+                ),
+            )
         )
-        if pr_data is None:
-            return AutoApprovalResult(pr_url=None, approved=False)
-        pr_number = pr_data["number"]
-        pr_url = pr_data["html_url"]
-        return await self._merge_auto_pr(
+        return await self._auto_approval_result(
+            result,
             member=owner,
             nickname=new_nickname,
-            branch=branch,
-            pr_number=pr_number,
-            pr_url=pr_url,
-            success_comment=(
-                f"Gift username update by {owner} ({owner.id}): "
-                f"`{old_nickname}` -> `{new_nickname}` for {recipient} ({recipient.id})."
-            ),
             pending_description="Gift username update",
         )
 
@@ -1457,16 +1380,14 @@ class PatreonWhitelistFlowCog(commands.Cog):
             nonlocal nickname
             old_nick = nickname
             branch_text, branch_sha = await self.gh.get_whitelist_file(ref=branch)
-            lines = [ln.strip() for ln in branch_text.splitlines() if ln.strip()]
-            lines = [ln for ln in lines if ln != old_nick]
-            if new_nick not in lines:
-                lines.append(new_nick)
-            await self.gh.put_whitelist_file(
-                branch=branch,
-                new_text="\n".join(lines) + "\n",
-                sha=branch_sha,
-                message=f"Update gifted beta tester: {old_nick} -> {new_nick}",
-            )
+            branch_whitelist = WhitelistIndex(branch_text)
+            if branch_whitelist.replace(old_nick, new_nick):
+                await self.gh.put_whitelist_file(
+                    branch=branch,
+                    new_text=branch_whitelist.text(),
+                    sha=branch_sha,
+                    message=f"Update gifted beta tester: {old_nick} -> {new_nick}",
+                )
             nickname = new_nick
             if admin_view is not None:
                 admin_view.nickname = new_nick
@@ -1687,41 +1608,29 @@ class PatreonWhitelistFlowCog(commands.Cog):
                 f"Patreon access expired for <@{owner_discord_user_id}> with no active whitelist grants to remove."
             )
             return
-        branch = _patreon_remove_branch_name(owner_discord_user_id)
-        base_text, _base_sha = await self.gh.get_whitelist_file(ref=self.gh.base_branch)
-        base_lines = [ln.strip() for ln in base_text.splitlines() if ln.strip()]
-        remaining = [line for line in base_lines if line not in set(nicknames)]
-        if remaining == base_lines:
+        result = await self._submit_whitelist_change(
+            WhitelistChange.remove(
+                nicknames,
+                summary=f"Remove expired Patreon beta access for {owner_discord_user_id}",
+                detail=(
+                    f"Remove `{', '.join(nicknames)}`: Patreon status `{patron_status}` "
+                    f"of <@{owner_discord_user_id}> is no longer active."
+                ),
+            )
+        )
+        if not result.changed:
             await self._log_staff_info(
                 f"Patreon access expired for <@{owner_discord_user_id}>; no matching whitelist lines found for `{', '.join(nicknames)}`."
             )
             return
-        await self.gh.create_branch(branch, self.gh.base_branch)
-        branch_text, branch_sha = await self.gh.get_whitelist_file(ref=branch)
-        branch_lines = [ln.strip() for ln in branch_text.splitlines() if ln.strip()]
-        updated = [line for line in branch_lines if line not in set(nicknames)]
-        await self.gh.put_whitelist_file(
-            branch=branch,
-            new_text=("\n".join(updated) + "\n") if updated else "",
-            sha=branch_sha,
-            message=f"Remove expired Patreon beta access for {owner_discord_user_id}",
-        )
-        pr_data = await self.gh.create_or_get_pr(
-            head_branch=branch,
-            title=f"Remove expired Patreon beta access for {owner_discord_user_id}",
-            body=(
-                f"Patreon status `{patron_status}` is no longer active. "
-                f"Removing whitelist entries: {', '.join(nicknames)}."
-            ),
-        )
-        await self.gh.merge_pr(pr_data["number"])
-        await self.gh.add_pr_comment(
-            pr_data["number"],
-            f"Automatically removed expired Patreon whitelist entries: {', '.join(nicknames)}.",
-        )
-        await self.gh.remove_branch(branch)
+        if not result.merged:
+            await self._log_staff_info(
+                f"Patreon access expired for <@{owner_discord_user_id}>; the PR removing `{', '.join(nicknames)}` "
+                f"could not be auto-merged (HTTP {result.merge_status}).\nPR: {result.pr_url}"
+            )
+            return
         await self._log_staff_info(
-            f"Patreon access expired for <@{owner_discord_user_id}>; removed `{', '.join(nicknames)}`.\nPR: {pr_data['html_url']}"
+            f"Patreon access expired for <@{owner_discord_user_id}>; removed `{', '.join(nicknames)}`.\nPR: {result.pr_url}"
         )
 
     async def _submit_whitelist_request(
@@ -1735,21 +1644,21 @@ class PatreonWhitelistFlowCog(commands.Cog):
         requester = interaction.user
         user_status_message = getattr(interaction, "message", None)
 
-        base_text, _base_sha = await self.gh.get_whitelist_file(ref=self.gh.base_branch)
-        base_lines = [ln.strip() for ln in base_text.splitlines() if ln.strip()]
-
-        if state["nick"] in base_lines:
+        already_whitelisted = await self._is_whitelisted(state["nick"])
+        if not already_whitelisted:
+            snapshot = await self.gh.get_whitelist_snapshot(branch)
+            base = self._whitelist_queue().index.remember(snapshot.base_text, snapshot.base_blob_oid)
+            already_whitelisted = state["nick"] in base
+        if already_whitelisted:
             await _edit_user_interaction_status(
                 interaction,
                 f"`{state['nick']}` is already whitelisted. Nothing to do.",
             )
             return
 
-        await self.gh.create_branch(branch, self.gh.base_branch)
-
-        branch_text, branch_sha = await self.gh.get_whitelist_file(ref=branch)
-        branch_lines = [ln.strip() for ln in branch_text.splitlines() if ln.strip()]
-        if state["nick"] in branch_lines:
+        branch_whitelist = WhitelistIndex(snapshot.branch_text)
+        new_text = None
+        if state["nick"] in branch_whitelist:
             log.info(
                 "Patreon whitelist branch already contains nickname; reusing PR flow",
                 extra={
@@ -1760,17 +1669,13 @@ class PatreonWhitelistFlowCog(commands.Cog):
                 },
             )
         else:
-            branch_lines.append(state["nick"])
-            new_text = "\n".join(branch_lines) + "\n"
-            await self.gh.put_whitelist_file(
-                branch=branch,
-                new_text=new_text,
-                sha=branch_sha,
-                message=f"Add beta tester: {state['nick']}",
-            )
+            branch_whitelist.add(state["nick"])
+            new_text = branch_whitelist.text()
 
-        pr_data = await self.gh.create_or_get_pr(
-            head_branch=branch,
+        pr_data = await self.gh.commit_whitelist_and_open_pr(
+            snapshot,
+            new_text=new_text,
+            message=f"Add beta tester: {state['nick']}",
             title=f"Add beta tester: {state['nick']}",
             body=f"Requested by Discord user {interaction.user} ({interaction.user.id}).",
         )
@@ -1819,18 +1724,14 @@ class PatreonWhitelistFlowCog(commands.Cog):
             old_nick = state["nick"]
 
             branch_text, branch_sha = await self.gh.get_whitelist_file(ref=branch)
-            lines = [ln.strip() for ln in branch_text.splitlines() if ln.strip()]
-            lines = [ln for ln in lines if ln != old_nick]
-            if new_nick not in lines:
-                lines.append(new_nick)
-
-            updated = "\n".join(lines) + "\n"
-            await self.gh.put_whitelist_file(
-                branch=branch,
-                new_text=updated,
-                sha=branch_sha,
-                message=f"Update beta tester: {old_nick} -> {new_nick}",
-            )
+            branch_whitelist = WhitelistIndex(branch_text)
+            if branch_whitelist.replace(old_nick, new_nick):
+                await self.gh.put_whitelist_file(
+                    branch=branch,
+                    new_text=branch_whitelist.text(),
+                    sha=branch_sha,
+                    message=f"Update beta tester: {old_nick} -> {new_nick}",
+                )
 
             state["nick"] = new_nick
             if admin_view is not None:
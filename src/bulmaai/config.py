@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from collections.abc import Sequence as SequenceABC
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -88,6 +89,8 @@ DEFAULT_OPENAI_SUPPORT_MAX_OUTPUT_TOKENS = 1500
 DEFAULT_OPENAI_SUPPORT_VECTOR_STORE_IDS: Sequence[str] = ()
 DEFAULT_OPENAI_SUPPORT_FILE_SEARCH_MAX_RESULTS = 5
 DEFAULT_OPENAI_SUPPORT_STORE_RESPONSES = True
+# Optional: enables paraphrase matches in the support answer cache.
+DEFAULT_OPENAI_SUPPORT_ANSWER_CACHE_EMBEDDING_MODEL: str | None = None
 DEFAULT_OPENAI_FAQ_SUGGESTION_MODEL = "gpt-5.4-mini"
 DEFAULT_OPENAI_FAQ_VECTOR_STORE_ID: str | None = None
 DEFAULT_OPENAI_FAQ_GENERATED_PATH = "data/knowledge/generated/dragonminez-faq.md"
@@ -130,6 +133,7 @@ DEFAULT_PATREON_ELIGIBLE_TIER_IDS: Sequence[str] = (
 DEFAULT_PATREON_OAUTH_REDIRECT_URI = "https://downloads.dragonminez.com/patreon/oauth/callback"
 DEFAULT_DISCORD_OAUTH_REDIRECT_URI = "https://downloads.dragonminez.com/beta-access/discord/callback"
 DEFAULT_DISCORD_OAUTH_CLIENTID = 1336867824815312906
+DEFAULT_WHITELIST_BATCH_WINDOW_SECONDS = 3.0
 
 DEFAULT_AI_SUPPORT_ENABLED = True
 DEFAULT_AI_TICKET_CATEGORY_ID = 1262517992982315110
@@ -141,6 +145,9 @@ DEFAULT_AI_SUPPORT_HISTORY_LIMIT = 12
 DEFAULT_AI_SUPPORT_TIMEOUT_SECONDS = 70
 DEFAULT_AI_SUPPORT_TYPING_LEAD_SECONDS = 0
 DEFAULT_AI_SUPPORT_DEBOUNCE_SECONDS = 1.5
+DEFAULT_AI_SUPPORT_STREAM_REPLIES = True
+# Cached replies are unreviewed model output shared across users, so reuse is opt-in.
+DEFAULT_AI_SUPPORT_ANSWER_CACHE_ENABLED = False
 DEFAULT_MESSAGE_PRESETS_PATH = "data/message_presets.json"
 DEFAULT_ANNOUNCEMENT_SOURCE_CHANNEL_ID = 1260409720733175838
 DEFAULT_ANNOUNCEMENT_SPANISH_CHANNEL_ID = 1280350384992288778
@@ -204,6 +211,23 @@ DEFAULT_BUG_REPORTS_ENABLED = True
 DEFAULT_BUG_REPORT_FORUM_CHANNEL_ID = 1484275827146363061
 DEFAULT_BUG_REPORT_REPO = DEFAULT_GITHUB_DEFAULT_REPO
 DEFAULT_BUG_REPORT_POLL_MINUTES = 10
+DEFAULT_GITHUB_MIRROR_SYNC_MINUTES = 5
+DEFAULT_LOG_PARSER_WORKERS = 2
+DEFAULT_LOG_PARSER_QUEUE_SIZE = 8
+DEFAULT_LOG_PARSER_TIMEOUT_SECONDS = 30
+DEFAULT_LOG_PARSER_CACHE_SIZE = 128
+DEFAULT_LOG_PARSER_CACHE_TTL_SECONDS = 6 * 3600
+DEFAULT_LOG_PARSER_CACHE_PERSIST = False
+
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_HTTP_KEEPALIVE_SECONDS = 30
+DEFAULT_HTTP_TIMEOUT_SECONDS = 30
+DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS = 10
+DEFAULT_HTTP_MAX_RETRIES = 3
+DEFAULT_HTTP_RATE_LIMIT_PER_SECOND = 10
+DEFAULT_HTTP_RATE_LIMIT_BURST = 20
+DEFAULT_HTTP_MAX_RETRY_WAIT_SECONDS = 60
 DEFAULT_SETTINGS_OVERRIDES_PATH = "data/settings_overrides.json"
 
 NON_OVERRIDABLE_SETTINGS = {
@@ -245,6 +269,7 @@ class Settings:
     openai_support_vector_store_ids: Sequence[str]
     openai_support_file_search_max_results: int
     openai_support_store_responses: bool
+    openai_support_answer_cache_embedding_model: str | None
     openai_faq_suggestion_model: str
     openai_faq_vector_store_id: str | None
     openai_faq_generated_path: str
@@ -255,6 +280,7 @@ class Settings:
     bug_report_forum_channel_id: int | None
     bug_report_repo: str
     bug_report_poll_minutes: int
+    github_mirror_sync_minutes: int
 
     POSTGRES_DSN: str | None
     PGHOST: str
@@ -284,6 +310,7 @@ class Settings:
     patreon_oauth_client_secret: str | None
     patreon_oauth_redirect_uri: str
     patreon_webhook_secret: str | None
+    whitelist_batch_window_seconds: float
     bot_restart_channel_id: int | None
     release_webhook_enabled: bool
     release_webhook_host: str
@@ -304,6 +331,8 @@ class Settings:
     ai_support_timeout_seconds: int
     ai_support_typing_lead_seconds: int
     ai_support_debounce_seconds: float
+    ai_support_stream_replies: bool
+    ai_support_answer_cache_enabled: bool
     message_presets_path: str
     announcement_source_channel_id: int | None
     announcement_spanish_channel_id: int | None
@@ -343,6 +372,21 @@ class Settings:
     phishdestroy_safe_ttl_seconds: int
     phishdestroy_threat_ttl_seconds: int
     phishdestroy_recovery_interval_seconds: int
+    log_parser_workers: int
+    log_parser_queue_size: int
+    log_parser_timeout_seconds: int
+    log_parser_cache_size: int
+    log_parser_cache_ttl_seconds: int
+    log_parser_cache_persist: bool
+    http_max_connections: int
+    http_max_connections_per_host: int
+    http_keepalive_seconds: int
+    http_timeout_seconds: int
+    http_connect_timeout_seconds: int
+    http_max_retries: int
+    http_rate_limit_per_second: int
+    http_rate_limit_burst: int
+    http_max_retry_wait_seconds: int
 
     discord_staff_role_ids: Sequence[int] = (1352882775304175668, # DMZ Dev
                                              1309022450671161476, # DMZ Author
@@ -434,6 +478,10 @@ def _build_settings_from_env() -> Settings:
             "OPENAI_SUPPORT_STORE_RESPONSES",
             DEFAULT_OPENAI_SUPPORT_STORE_RESPONSES,
         ),
+        openai_support_answer_cache_embedding_model=_get_env(
+            "OPENAI_SUPPORT_ANSWER_CACHE_EMBEDDING_MODEL",
+            DEFAULT_OPENAI_SUPPORT_ANSWER_CACHE_EMBEDDING_MODEL,
+        ),
         openai_faq_suggestion_model=(
             _get_env("OPENAI_FAQ_SUGGESTION_MODEL", DEFAULT_OPENAI_FAQ_SUGGESTION_MODEL)
             or DEFAULT_OPENAI_FAQ_SUGGESTION_MODEL
@@ -470,6 +518,10 @@ def _build_settings_from_env() -> Settings:
             _get_env_int("BUG_REPORT_POLL_MINUTES", DEFAULT_BUG_REPORT_POLL_MINUTES)
             or DEFAULT_BUG_REPORT_POLL_MINUTES
         ),
+        github_mirror_sync_minutes=_get_env_int(
+            "GITHUB_MIRROR_SYNC_MINUTES",
+            DEFAULT_GITHUB_MIRROR_SYNC_MINUTES,
+        ),
         POSTGRES_DSN=PGDSN,
         PGHOST=DEFAULT_PGHOST,
         PGPORT=DEFAULT_PGPORT,
@@ -514,6 +566,10 @@ def _build_settings_from_env() -> Settings:
         patreon_oauth_client_secret=PATREON_OAUTH_CLIENT_SECRET,
         patreon_oauth_redirect_uri=DEFAULT_PATREON_OAUTH_REDIRECT_URI,
         patreon_webhook_secret=PATREON_WEBHOOK_SECRET,
+        whitelist_batch_window_seconds=_get_env_float_default(
+            "WHITELIST_BATCH_WINDOW_SECONDS",
+            DEFAULT_WHITELIST_BATCH_WINDOW_SECONDS,
+        ),
         bot_restart_channel_id=_get_env_int(
             "BOT_RESTART_CHANNEL_ID",
             DEFAULT_BOT_RESTART_CHANNEL_ID,
@@ -576,6 +632,11 @@ def _build_settings_from_env() -> Settings:
             "AI_SUPPORT_DEBOUNCE_SECONDS",
             DEFAULT_AI_SUPPORT_DEBOUNCE_SECONDS,
         ),
+        ai_support_stream_replies=_get_env_bool("AI_SUPPORT_STREAM_REPLIES", DEFAULT_AI_SUPPORT_STREAM_REPLIES),
+        ai_support_answer_cache_enabled=_get_env_bool(
+            "AI_SUPPORT_ANSWER_CACHE_ENABLED",
+            DEFAULT_AI_SUPPORT_ANSWER_CACHE_ENABLED,
+        ),
         message_presets_path=_get_env("MESSAGE_PRESETS_PATH", DEFAULT_MESSAGE_PRESETS_PATH) or DEFAULT_MESSAGE_PRESETS_PATH,
         announcement_source_channel_id=_get_env_int(
             "ANNOUNCEMENT_SOURCE_CHANNEL_ID",
@@ -744,6 +805,63 @@ def _build_settings_from_env() -> Settings:
             )
             or DEFAULT_PHISHDESTROY_RECOVERY_INTERVAL_SECONDS
         ),
+        log_parser_workers=(
+            _get_env_int("LOG_PARSER_WORKERS", DEFAULT_LOG_PARSER_WORKERS)
+            or DEFAULT_LOG_PARSER_WORKERS
+        ),
+        log_parser_queue_size=_get_env_int(
+            "LOG_PARSER_QUEUE_SIZE",
+            DEFAULT_LOG_PARSER_QUEUE_SIZE,
+        ),
+        log_parser_timeout_seconds=(
+            _get_env_int("LOG_PARSER_TIMEOUT_SECONDS", DEFAULT_LOG_PARSER_TIMEOUT_SECONDS)
+            or DEFAULT_LOG_PARSER_TIMEOUT_SECONDS
+        ),
+        log_parser_cache_size=(
+            _get_env_int("LOG_PARSER_CACHE_SIZE", DEFAULT_LOG_PARSER_CACHE_SIZE)
+            or DEFAULT_LOG_PARSER_CACHE_SIZE
+        ),
+        log_parser_cache_ttl_seconds=(
+            _get_env_int("LOG_PARSER_CACHE_TTL_SECONDS", DEFAULT_LOG_PARSER_CACHE_TTL_SECONDS)
+            or DEFAULT_LOG_PARSER_CACHE_TTL_SECONDS
+        ),
+        log_parser_cache_persist=_get_env_bool(
+            "LOG_PARSER_CACHE_PERSIST",
+            DEFAULT_LOG_PARSER_CACHE_PERSIST,
+        ),
+        http_max_connections=(
+            _get_env_int("HTTP_MAX_CONNECTIONS", DEFAULT_HTTP_MAX_CONNECTIONS)
+            or DEFAULT_HTTP_MAX_CONNECTIONS
+        ),
+        http_max_connections_per_host=(
+            _get_env_int("HTTP_MAX_CONNECTIONS_PER_HOST", DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST)
+            or DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST
+        ),
+        http_keepalive_seconds=_get_env_int(
+            "HTTP_KEEPALIVE_SECONDS",
+            DEFAULT_HTTP_KEEPALIVE_SECONDS,
+        ),
+        http_timeout_seconds=(
+            _get_env_int("HTTP_TIMEOUT_SECONDS", DEFAULT_HTTP_TIMEOUT_SECONDS)
+            or DEFAULT_HTTP_TIMEOUT_SECONDS
+        ),
+        http_connect_timeout_seconds=(
+            _get_env_int("HTTP_CONNECT_TIMEOUT_SECONDS", DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS)
+            or DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS
+        ),
+        http_max_retries=_get_env_int("HTTP_MAX_RETRIES", DEFAULT_HTTP_MAX_RETRIES),
+        http_rate_limit_per_second=(
+            _get_env_int("HTTP_RATE_LIMIT_PER_SECOND", DEFAULT_HTTP_RATE_LIMIT_PER_SECOND)
+            or DEFAULT_HTTP_RATE_LIMIT_PER_SECOND
+        ),
+        http_rate_limit_burst=(
+            _get_env_int("HTTP_RATE_LIMIT_BURST", DEFAULT_HTTP_RATE_LIMIT_BURST)
+            or DEFAULT_HTTP_RATE_LIMIT_BURST
+        ),
+        http_max_retry_wait_seconds=_get_env_int(
+            "HTTP_MAX_RETRY_WAIT_SECONDS",
+            DEFAULT_HTTP_MAX_RETRY_WAIT_SECONDS,
+        ),
     )
 
 
@@ -851,6 +969,7 @@ def set_setting_override(field_name: str, raw_value: str) -> Any:
     overrides = load_settings_overrides()
     overrides[field_name] = _coerce_setting_value(field_name, raw_value)
     save_settings_overrides(overrides)
+    refresh_settings()
     return overrides[field_name]
 
 
@@ -860,6 +979,7 @@ def reset_setting_override(field_name: str) -> None:
     overrides = load_settings_overrides()
     overrides.pop(field_name, None)
     save_settings_overrides(overrides)
+    refresh_settings()
 
 
 def load_settings(*, include_overrides: bool = True) -> Settings:
@@ -873,3 +993,49 @@ def load_settings(*, include_overrides: bool = True) -> Settings:
         if field_name in overrides:
             merged[field_name] = overrides[field_name]
     return Settings(**merged)
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    settings: Settings
+    version: int
+    # (mtime_ns, size) of the overrides file the snapshot was built from; None if absent.
+    overrides_stamp: tuple[int, int] | None
+
+
+_snapshot: SettingsSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def _overrides_stamp() -> tuple[int, int] | None:
+    try:
+        stat = _settings_overrides_path().stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def refresh_settings(*, if_changed: bool = False) -> SettingsSnapshot:
+    """Rebuild settings from the environment and overrides and swap the snapshot in.
+
+    With *if_changed*, the rebuild is skipped while the overrides file is
+    unchanged on disk. Each swap bumps ``version``.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        stamp = _overrides_stamp()
+        if if_changed and _snapshot is not None and _snapshot.overrides_stamp == stamp:
+            return _snapshot
+        version = _snapshot.version + 1 if _snapshot is not None else 1
+        _snapshot = SettingsSnapshot(settings=load_settings(), version=version, overrides_stamp=stamp)
+        return _snapshot
+
+
+def settings_snapshot() -> SettingsSnapshot:
+    snapshot = _snapshot
+    return snapshot if snapshot is not None else refresh_settings()
+
+
+def current_settings() -> Settings:
+    """The in-memory settings snapshot. Unlike :func:`load_settings`, this does no I/O."""
+    return settings_snapshot().settings
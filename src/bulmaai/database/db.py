@@ -4,11 +4,11 @@ import logging
 import asyncpg
 from dotenv import load_dotenv
 
-from bulmaai.config import load_settings
+from bulmaai.config import current_settings
 
 _pool: Optional[asyncpg.Pool] = None
 load_dotenv()
-settings = load_settings()
+settings = current_settings()
 log = logging.getLogger(__name__)
 
 
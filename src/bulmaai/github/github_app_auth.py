@@ -1,4 +1,9 @@
+import asyncio
 import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+
 import jwt
 import logging
 
@@ -6,9 +11,143 @@ from bulmaai.services.http import request
 
 log = logging.getLogger(__name__)
 
+# Installation tokens live an hour; refresh this long before GitHub's expires_at.
+TOKEN_REFRESH_MARGIN_SECONDS = 5 * 60
+# Never hand out a token with less than this left on it.
+TOKEN_MIN_VALIDITY_SECONDS = 60
+# Used only if the response has no usable expires_at.
+FALLBACK_TOKEN_LIFETIME_SECONDS = 45 * 60
+
+TokenKey = tuple[str, str]
+TokenMinter = Callable[[], Awaitable[tuple[str, float]]]
+
+
+def _parse_expires_at(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class _CachedToken:
+    token: str
+    expires_epoch: float
+    used: bool = False
+
+
+class InstallationTokenManager:
+    """Process-wide cache of installation tokens keyed by ``(app_id, installation_id)``.
+
+    Concurrent callers share a single in-flight mint. Once a token is minted a
+    background task refreshes it ``refresh_margin_seconds`` before it expires,
+    so commands normally never wait on GitHub; a token nobody used since the
+    last refresh is left to lapse and minted again on demand.
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_margin_seconds: float = TOKEN_REFRESH_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.refresh_margin_seconds = max(0.0, float(refresh_margin_seconds))
+        self._clock = clock
+        self._tokens: dict[TokenKey, _CachedToken] = {}
+        self._inflight: dict[TokenKey, asyncio.Task] = {}
+        self._refreshers: dict[TokenKey, asyncio.Task] = {}
+        self.mints = 0
+
+    async def get_token(self, key: TokenKey, mint: TokenMinter) -> str:
+        cached = self._tokens.get(key)
+        now = self._clock()
+        if cached is not None and now < cached.expires_epoch - TOKEN_MIN_VALIDITY_SECONDS:
+            cached.used = True
+            if now >= cached.expires_epoch - self.refresh_margin_seconds and not self._has_inflight(key):
+                # The background refresh is late (e.g. the loop was busy); start it without waiting.
+                self._spawn_refresher(key, mint, delay=0)
+            return cached.token
+        return await self._mint(key, mint)
+
+    def _has_inflight(self, key: TokenKey) -> bool:
+        task = self._inflight.get(key)
+        return task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+
+    async def _mint(self, key: TokenKey, mint: TokenMinter) -> str:
+        if not self._has_inflight(key):
+            task = asyncio.get_running_loop().create_task(self._mint_and_store(key, mint))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget_inflight(key, done))
+        # Shield so one cancelled caller does not cancel the mint for everyone else.
+        return await asyncio.shield(self._inflight[key])
+
+    def _forget_inflight(self, key: TokenKey, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; callers already received it
+
+    async def _mint_and_store(self, key: TokenKey, mint: TokenMinter) -> str:
+        token, expires_epoch = await mint()
+        self.mints += 1
+        self._tokens[key] = _CachedToken(token=token, expires_epoch=expires_epoch)
+        delay = expires_epoch - self.refresh_margin_seconds - self._clock()
+        self._spawn_refresher(key, mint, delay=max(0.0, delay))
+        return token
+
+    def _spawn_refresher(self, key: TokenKey, mint: TokenMinter, *, delay: float) -> None:
+        previous = self._refreshers.pop(key, None)
+        if previous is not None and previous is not asyncio.current_task() and not previous.done():
+            previous.cancel()
+        self._refreshers[key] = asyncio.get_running_loop().create_task(self._refresh_later(key, mint, delay))
+
+    async def _refresh_later(self, key: TokenKey, mint: TokenMinter, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._refreshers.get(key) is asyncio.current_task():
+            del self._refreshers[key]
+        cached = self._tokens.get(key)
+        if cached is None or not cached.used:
+            return
+        try:
+            await self._mint(key, mint)
+        except Exception:
+            # The current token may still be valid; the next caller retries once it is not.
+            log.warning("Background refresh of GitHub installation token failed", exc_info=True)
+
+    def invalidate(self, key: TokenKey) -> None:
+        self._tokens.pop(key, None)
+
+    async def close(self) -> None:
+        tasks = [*self._refreshers.values(), *self._inflight.values()]
+        self._refreshers.clear()
+        self._inflight.clear()
+        self._tokens.clear()
+        current_loop = asyncio.get_running_loop()
+        tasks = [task for task in tasks if not task.done() and task.get_loop() is current_loop]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Cogs build their own GitHubAppAuth, so tokens are shared through one manager.
+token_manager = InstallationTokenManager()
+
+
+async def close_token_manager() -> None:
+    await token_manager.close()
+
 
 class GitHubAppAuth:
-    def __init__(self, *, app_id: str, installation_id: str, private_key_pem: str):
+    def __init__(
+        self,
+        *,
+        app_id: str,
+        installation_id: str,
+        private_key_pem: str,
+        tokens: InstallationTokenManager | None = None,
+    ):
         if not app_id or not app_id.strip():
             raise ValueError("app_id cannot be empty")
         if not installation_id or not installation_id.strip():
@@ -19,9 +158,7 @@ class GitHubAppAuth:
         self.app_id = app_id.strip()
         self.installation_id = installation_id.strip()
         self.private_key_pem = private_key_pem
-
-        self._token: str | None = None
-        self._expires_epoch: int = 0
+        self.tokens = tokens if tokens is not None else token_manager
 
         log.info(f"GitHubAppAuth initialized with app_id={self.app_id}, installation_id={self.installation_id}")
 
@@ -35,10 +172,9 @@ class GitHubAppAuth:
         return jwt.encode(payload, self.private_key_pem, algorithm="RS256")
 
     async def get_installation_token(self) -> str:
-        now = int(time.time())
-        if self._token and now < (self._expires_epoch - 60):
-            return self._token
+        return await self.tokens.get_token((self.app_id, self.installation_id), self._mint_installation_token)
 
+    async def _mint_installation_token(self) -> tuple[str, float]:
         gh_jwt = self._make_jwt()
         url = f"https://api.github.com/app/installations/{self.installation_id}/access_tokens"
         headers = {
@@ -53,10 +189,12 @@ class GitHubAppAuth:
             r.raise_for_status()
             data = r.json()
 
-            self._token = data["token"]
-            self._expires_epoch = int(time.time()) + 45 * 60
+            token = data["token"]
+            expires_epoch = _parse_expires_at(data.get("expires_at"))
+            if expires_epoch is None:
+                expires_epoch = time.time() + FALLBACK_TOKEN_LIFETIME_SECONDS
             log.info("Successfully obtained GitHub installation token")
-            return self._token
+            return token, expires_epoch
         except Exception as e:
             # Provide specific error messages for common issues
             error_msg = f"Failed to get GitHub installation token"
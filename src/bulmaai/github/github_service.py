@@ -1,8 +1,83 @@
+import asyncio
 import base64
+import math
+import re
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing, suppress
+from dataclasses import dataclass
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
 from requests import HTTPError
 
 from bulmaai.services.http import request
 from bulmaai.github.github_app_auth import GitHubAppAuth
+from bulmaai.github.graphql import GitHubGraphQLClient, GitHubGraphQLError, GraphQLBatch
+from bulmaai.github.response_cache import GitHubResponseCache, shared_response_cache
+
+GITHUB_PAGE_SIZE = 100
+# Pages fetched ahead of the consumer once the last page number is known.
+GITHUB_PAGE_CONCURRENCY = 4
+# Aliased fields per GraphQL query when reading many issues at once.
+GITHUB_GRAPHQL_ISSUE_BATCH = 100
+
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+
+def _parse_link_header(value: str | None) -> dict[str, str]:
+    """Map rel -> URL for a GitHub ``Link`` pagination header."""
+    return {rel: url for url, rel in _LINK_RE.findall(value or "")}
+
+
+def _page_number(url: str | None) -> int | None:
+    if not url:
+        return None
+    try:
+        return int(parse_qs(urlsplit(url).query)["page"][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def _with_page(url: str, page: int) -> str:
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    query["page"] = [str(page)]
+    return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+
+
+_FILE_SNAPSHOT_QUERY = """
+query($owner: String!, $name: String!, $baseRef: String!, $headRef: String!, $baseFile: String!, $headFile: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    base: ref(qualifiedName: $baseRef) { target { oid } }
+    head: ref(qualifiedName: $headRef) {
+      target { oid }
+      associatedPullRequests(states: OPEN, first: 1) { nodes { number url } }
+    }
+    baseFile: object(expression: $baseFile) { ... on Blob { oid text } }
+    headFile: object(expression: $headFile) { ... on Blob { text } }
+  }
+}
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class FileSnapshot:
+    """One file as seen on the base branch and on a work branch, from one query."""
+
+    path: str
+    branch: str
+    repository_id: str
+    base_oid: str
+    base_text: str
+    branch_exists: bool
+    # Head commit the branch will be built on: the branch tip, or base when missing.
+    head_oid: str
+    # The branch copy of the file, or the base copy when the branch is missing.
+    branch_text: str
+    pull_request: dict | None
+    # Blob SHA of the base copy; matches the ``sha`` the contents API returns.
+    base_blob_oid: str | None = None
 
 
 def _is_ref_already_exists_response(response) -> bool:
@@ -51,13 +126,18 @@ def _is_pull_request_already_exists_response(response) -> bool:
 
 
 class GitHubService:
-    def __init__(self, *, auth: GitHubAppAuth, owner: str, repo: str, base_branch: str = "main", whitelist_file_path: str | None = None):
+    def __init__(self, *, auth: GitHubAppAuth, owner: str, repo: str, base_branch: str = "main", whitelist_file_path: str | None = None,
+                 response_cache: GitHubResponseCache | None = None, mirror=None):
         self.auth = auth
         self.owner = owner
         self.repo = repo
         self.base_branch = base_branch
         self.whitelist_file_path = whitelist_file_path
         self.api = f"https://api.github.com/repos/{owner}/{repo}"
+        self.response_cache = shared_response_cache if response_cache is None else response_cache
+        # Optional write-through recorder (see services.github_mirror.GitHubMirror).
+        self.mirror = mirror
+        self.graphql = GitHubGraphQLClient(self._headers)
 
     async def _headers(self) -> dict[str, str]:
         token = await self.auth.get_installation_token()
@@ -67,6 +147,92 @@ class GitHubService:
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
+    async def _get(self, url: str, *, params: dict | None = None):
+        """GET through the conditional-request cache; a 304 returns the cached response."""
+        key = self.response_cache.key(url, params)
+        cached = self.response_cache.get(key)
+        headers = {**await self._headers(), **self.response_cache.conditional_headers(cached)}
+        r = await request("GET", url, headers=headers, params=params)
+        return self.response_cache.resolve(key, r, cached=cached)
+
+    async def _record(self, item: dict) -> dict:
+        if self.mirror is not None:
+            await self.mirror.record(self.repo, item)
+        return item
+
+    async def _iter_paginated(
+        self,
+        url: str,
+        *,
+        params: dict,
+        items_key: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Yield items across pages, following ``Link`` headers lazily.
+
+        Once the first page reveals the last page number, later pages are
+        fetched up to :data:`GITHUB_PAGE_CONCURRENCY` at a time, never more than
+        *limit* still needs. Pending fetches are cancelled as soon as the
+        caller stops iterating.
+        """
+        if limit is not None and limit <= 0:
+            return
+        per_page = int(params.get("per_page") or GITHUB_PAGE_SIZE)
+        remaining = limit
+
+        def items_of(response) -> list[dict]:
+            payload = response.json()
+            return payload.get(items_key, []) if items_key else payload
+
+        r = await self._get(url, params=params)
+        r.raise_for_status()
+        for item in items_of(r):
+            yield item
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return
+
+        links = _parse_link_header(r.headers.get("Link"))
+        next_url = links.get("next")
+        next_page, last_page = _page_number(next_url), _page_number(links.get("last"))
+        if next_url is None:
+            return
+        if next_page is None or last_page is None:
+            # Cursor-style pagination: each page names the next one.
+            while next_url:
+                r = await self._get(next_url)
+                r.raise_for_status()
+                for item in items_of(r):
+                    yield item
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            return
+                next_url = _parse_link_header(r.headers.get("Link")).get("next")
+            return
+
+        if remaining is not None:
+            last_page = min(last_page, next_page + math.ceil(remaining / per_page) - 1)
+        pending: deque[asyncio.Task] = deque()
+        page = next_page
+        try:
+            while pending or page <= last_page:
+                while page <= last_page and len(pending) < GITHUB_PAGE_CONCURRENCY:
+                    pending.append(asyncio.create_task(self._get(_with_page(next_url, page))))
+                    page += 1
+                r = await pending.popleft()
+                r.raise_for_status()
+                for item in items_of(r):
+                    yield item
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            return
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def dispatch_repository_event(self, *, event_type: str, client_payload: dict) -> None:
         payload = {
             "event_type": event_type,
@@ -77,10 +243,11 @@ class GitHubService:
 
     # ==================== ISSUES ====================
 
+    def iter_labels(self, *, limit: int | None = None) -> AsyncIterator[dict]:
+        return self._iter_paginated(f"{self.api}/labels", params={"per_page": GITHUB_PAGE_SIZE}, limit=limit)
+
     async def get_labels(self) -> list[dict]:
-        r = await request("GET", f"{self.api}/labels", headers=await self._headers(), params={"per_page": 100})
-        r.raise_for_status()
-        return r.json()
+        return [label async for label in self.iter_labels()]
 
     async def create_issue(self, *, title: str, body: str, labels: list[str] | None = None) -> dict:
         payload: dict = {"title": title, "body": body}
@@ -88,24 +255,62 @@ class GitHubService:
             payload["labels"] = labels
         r = await request("POST", f"{self.api}/issues", headers=await self._headers(), json=payload)
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
 
     async def get_issue(self, issue_number: int) -> dict:
-        r = await request("GET", f"{self.api}/issues/{issue_number}", headers=await self._headers())
+        r = await self._get(f"{self.api}/issues/{issue_number}")
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
+
+    async def get_issue_states(self, issue_numbers: list[int]) -> dict[int, dict | None]:
+        """State of many issues with one GraphQL query per 100 numbers.
+
+        Each value is ``{"state": ..., "state_reason": ...}`` in REST spelling
+        (``"closed"``, ``"not_planned"``), or None when GitHub cannot find the
+        issue (deleted, or the number belongs to a pull request).
+        """
+        numbers = list(dict.fromkeys(int(number) for number in issue_numbers))
+        states: dict[int, dict | None] = {}
+        for start in range(0, len(numbers), GITHUB_GRAPHQL_ISSUE_BATCH):
+            chunk = numbers[start:start + GITHUB_GRAPHQL_ISSUE_BATCH]
+            fields = " ".join(f"i{number}: issue(number: {number}) {{ state stateReason }}" for number in chunk)
+            query = (
+                "query($owner: String!, $name: String!) "
+                f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            try:
+                data = await self.graphql.execute(query, {"owner": self.owner, "name": self.repo})
+            except GitHubGraphQLError as exc:
+                # Missing issues come back as NOT_FOUND errors next to the others' data.
+                if exc.data.get("repository") is None or any(
+                    error.get("type") != "NOT_FOUND" for error in exc.errors
+                ):
+                    raise
+                data = exc.data
+            repository = data.get("repository") or {}
+            for number in chunk:
+                issue = repository.get(f"i{number}")
+                states[number] = (
+                    None
+                    if issue is None
+                    else {
+                        "state": str(issue["state"]).lower(),
+                        "state_reason": str(issue["stateReason"]).lower() if issue.get("stateReason") else None,
+                    }
+                )
+        return states
 
     async def close_issue(self, issue_number: int, *, reason: str = "completed") -> dict:
         payload = {"state": "closed", "state_reason": reason}
         r = await request("PATCH", f"{self.api}/issues/{issue_number}", headers=await self._headers(), json=payload)
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
 
     async def reopen_issue(self, issue_number: int) -> dict:
         payload = {"state": "open"}
         r = await request("PATCH", f"{self.api}/issues/{issue_number}", headers=await self._headers(), json=payload)
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
 
     async def add_issue_comment(self, issue_number: int, body: str) -> dict:
         r = await request("POST", f"{self.api}/issues/{issue_number}/comments", headers=await self._headers(), json={"body": body})
@@ -115,42 +320,81 @@ class GitHubService:
     async def add_labels(self, issue_number: int, labels: list[str]) -> list[dict]:
         r = await request("POST", f"{self.api}/issues/{issue_number}/labels", headers=await self._headers(), json={"labels": labels})
         r.raise_for_status()
-        return r.json()
+        current = r.json()
+        if self.mirror is not None:
+            await self.mirror.record_labels(self.repo, issue_number, current)
+        return current
 
     async def remove_label(self, issue_number: int, label: str) -> None:
         r = await request("DELETE", f"{self.api}/issues/{issue_number}/labels/{label}", headers=await self._headers())
         if r.status_code != 404:
             r.raise_for_status()
+            if self.mirror is not None:
+                await self.mirror.record_labels(self.repo, issue_number, r.json())
 
     async def assign_issue(self, issue_number: int, assignees: list[str]) -> dict:
         r = await request("POST", f"{self.api}/issues/{issue_number}/assignees", headers=await self._headers(), json={"assignees": assignees})
         r.raise_for_status()
         return r.json()
 
-    async def list_issues(self, *, state: str = "open", labels: str | None = None, per_page: int = 25) -> list[dict]:
-        params: dict = {"state": state, "per_page": per_page}
+    async def iter_issues(
+        self,
+        *,
+        state: str = "open",
+        labels: str | None = None,
+        per_page: int = GITHUB_PAGE_SIZE,
+        limit: int | None = None,
+        include_pull_requests: bool = True,
+        since: str | None = None,
+        sort: str | None = None,
+        direction: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """Issues newest first. Like the REST endpoint, this includes pull requests
+        unless *include_pull_requests* is false; *limit* counts yielded items."""
+        params: dict = {"state": state, "per_page": per_page, "since": since, "sort": sort, "direction": direction}
         if labels:
             params["labels"] = labels
-        r = await request("GET", f"{self.api}/issues", headers=await self._headers(), params=params)
-        r.raise_for_status()
-        return r.json()
+        pages = self._iter_paginated(
+            f"{self.api}/issues",
+            params=params,
+            limit=limit if include_pull_requests else None,
+        )
+        count = 0
+        async with aclosing(pages):
+            async for issue in pages:
+                if not include_pull_requests and "pull_request" in issue:
+                    continue
+                yield issue
+                count += 1
+                if limit is not None and count >= limit:
+                    return
 
-    async def search_issues(self, text: str, *, per_page: int = 10) -> list[dict]:
+    async def list_issues(self, *, state: str = "open", labels: str | None = None, per_page: int = 25) -> list[dict]:
+        return [issue async for issue in self.iter_issues(state=state, labels=labels, per_page=per_page, limit=per_page)]
+
+    def iter_search_issues(
+        self,
+        text: str,
+        *,
+        per_page: int = GITHUB_PAGE_SIZE,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict]:
         """Full-text search issues (open and closed) in this repo, most relevant first."""
         query = f"repo:{self.owner}/{self.repo} is:issue {text}".strip()
-        r = await request(
-            "GET",
+        return self._iter_paginated(
             "https://api.github.com/search/issues",
-            headers=await self._headers(),
             params={"q": query, "per_page": per_page, "sort": "updated", "order": "desc"},
+            items_key="items",
+            limit=limit,
         )
-        r.raise_for_status()
-        return r.json().get("items", [])
+
+    async def search_issues(self, text: str, *, per_page: int = 10) -> list[dict]:
+        return [issue async for issue in self.iter_search_issues(text, per_page=per_page, limit=per_page)]
 
     # ==================== BRANCHES & REFS ====================
 
     async def get_ref_sha(self, branch: str) -> str:
-        r = await request("GET", f"{self.api}/git/ref/heads/{branch}", headers=await self._headers())
+        r = await self._get(f"{self.api}/git/ref/heads/{branch}")
         r.raise_for_status()
         return r.json()["object"]["sha"]
 
@@ -171,7 +415,7 @@ class GitHubService:
     # ==================== FILE OPERATIONS ====================
 
     async def get_file(self, path: str, ref: str) -> tuple[str, str]:
-        r = await request("GET", f"{self.api}/contents/{path}", headers=await self._headers(), params={"ref": ref})
+        r = await self._get(f"{self.api}/contents/{path}", params={"ref": ref})
         r.raise_for_status()
         j = r.json()
         content = base64.b64decode(j["content"]).decode("utf-8", errors="replace")
@@ -187,26 +431,170 @@ class GitHubService:
         r = await request("PUT", f"{self.api}/contents/{path}", headers=await self._headers(), json=payload)
         r.raise_for_status()
 
+    async def get_file_snapshot(self, path: str, branch: str) -> FileSnapshot:
+        """Read *path* on the base branch and on *branch*, plus any open PR, in one call."""
+        data = await self.graphql.execute(
+            _FILE_SNAPSHOT_QUERY,
+            {
+                "owner": self.owner,
+                "name": self.repo,
+                "baseRef": f"refs/heads/{self.base_branch}",
+                "headRef": f"refs/heads/{branch}",
+                "baseFile": f"{self.base_branch}:{path}",
+                "headFile": f"{branch}:{path}",
+            },
+        )
+        repository = data.get("repository") or {}
+        base, head = repository.get("base"), repository.get("head")
+        base_file = repository.get("baseFile")
+        if base is None or base_file is None or base_file.get("text") is None:
+            raise FileNotFoundError(f"{path} not found on {self.owner}/{self.repo}@{self.base_branch}")
+        base_text = base_file["text"]
+        head_file = repository.get("headFile") or {}
+        pull_requests = ((head or {}).get("associatedPullRequests") or {}).get("nodes") or []
+        pull_request = pull_requests[0] if pull_requests else None
+        return FileSnapshot(
+            path=path,
+            branch=branch,
+            repository_id=repository["id"],
+            base_oid=base["target"]["oid"],
+            base_text=base_text,
+            branch_exists=head is not None,
+            head_oid=head["target"]["oid"] if head is not None else base["target"]["oid"],
+            branch_text=head_file.get("text", base_text) if head is not None else base_text,
+            pull_request=(
+                {"number": pull_request["number"], "html_url": pull_request["url"]} if pull_request else None
+            ),
+            base_blob_oid=base_file.get("oid"),
+        )
+
+    async def commit_file_and_open_pr(
+        self,
+        snapshot: FileSnapshot,
+        *,
+        new_text: str | None,
+        message: str,
+        title: str,
+        body: str,
+    ) -> dict:
+        """Create the branch, commit *new_text* and open the PR in a single GraphQL mutation.
+
+        Steps already done (branch exists, text unchanged when *new_text* is
+        None, PR open) are left out of the batch. ``createCommitOnBranch`` is
+        pinned to ``snapshot.head_oid``, so a branch that moved since the
+        snapshot fails instead of being overwritten.
+        """
+        batch = GraphQLBatch()
+        if not snapshot.branch_exists:
+            batch.add(
+                "branch",
+                "createRef",
+                "ref { name }",
+                {
+                    "input": (
+                        "CreateRefInput!",
+                        {
+                            "repositoryId": snapshot.repository_id,
+                            "name": f"refs/heads/{snapshot.branch}",
+                            "oid": snapshot.base_oid,
+                        },
+                    )
+                },
+            )
+        if new_text is not None:
+            batch.add(
+                "commit",
+                "createCommitOnBranch",
+                "commit { oid }",
+                {
+                    "input": (
+                        "CreateCommitOnBranchInput!",
+                        {
+                            "branch": {
+                                "repositoryNameWithOwner": f"{self.owner}/{self.repo}",
+                                "branchName": snapshot.branch,
+                            },
+                            "message": {"headline": message},
+                            "fileChanges": {
+                                "additions": [
+                                    {
+                                        "path": snapshot.path,
+                                        "contents": base64.b64encode(new_text.encode("utf-8")).decode("ascii"),
+                                    }
+                                ]
+                            },
+                            "expectedHeadOid": snapshot.head_oid,
+                        },
+                    )
+                },
+            )
+        if snapshot.pull_request is None:
+            batch.add(
+                "pr",
+                "createPullRequest",
+                "pullRequest { number url }",
+                {
+                    "input": (
+                        "CreatePullRequestInput!",
+                        {
+                            "repositoryId": snapshot.repository_id,
+                            "baseRefName": self.base_branch,
+                            "headRefName": snapshot.branch,
+                            "title": title,
+                            "body": body,
+                        },
+                    )
+                },
+            )
+        if not batch:
+            return snapshot.pull_request
+
+        try:
+            data = await self.graphql.execute_batch(batch)
+        except GitHubGraphQLError as exc:
+            # Lost a race with another request for the same branch: the PR exists.
+            if "already exists" in str(exc).lower() and (exc.data.get("commit") or new_text is None):
+                existing_pr = await self.get_pr_by_head_branch(snapshot.branch)
+                if existing_pr is not None:
+                    return existing_pr
+            # Don't leave a branch without a PR behind; a retry recreates it from a fresh snapshot.
+            if exc.data.get("branch"):
+                with suppress(Exception):
+                    await self.remove_branch(snapshot.branch)
+            raise
+        if snapshot.pull_request is not None:
+            return snapshot.pull_request
+        pull_request = data["pr"]["pullRequest"]
+        return {"number": pull_request["number"], "html_url": pull_request["url"]}
+
     # ==================== PULL REQUESTS ====================
 
-    async def list_prs(self, *, state: str = "open", per_page: int = 25, head: str | None = None) -> list[dict]:
-        params = {"state": state, "per_page": per_page}
+    def iter_prs(
+        self,
+        *,
+        state: str = "open",
+        head: str | None = None,
+        per_page: int = GITHUB_PAGE_SIZE,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict]:
+        params: dict = {"state": state, "per_page": per_page}
         if head:
             params["head"] = head
-        r = await request("GET", f"{self.api}/pulls", headers=await self._headers(), params=params)
-        r.raise_for_status()
-        return r.json()
+        return self._iter_paginated(f"{self.api}/pulls", params=params, limit=limit)
+
+    async def list_prs(self, *, state: str = "open", per_page: int = 25, head: str | None = None) -> list[dict]:
+        return [pr async for pr in self.iter_prs(state=state, head=head, per_page=per_page, limit=per_page)]
 
     async def get_pr(self, pr_number: int) -> dict:
-        r = await request("GET", f"{self.api}/pulls/{pr_number}", headers=await self._headers())
+        r = await self._get(f"{self.api}/pulls/{pr_number}")
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
 
     async def create_pr(self, *, head_branch: str, title: str, body: str) -> dict:
         payload = {"title": title, "head": head_branch, "base": self.base_branch, "body": body}
         r = await request("POST", f"{self.api}/pulls", headers=await self._headers(), json=payload)
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
 
     async def get_pr_by_head_branch(self, head_branch: str, *, state: str = "open") -> dict | None:
         prs = await self.list_prs(
@@ -238,17 +626,19 @@ class GitHubService:
     async def merge_pr(self, pr_number: int, *, merge_method: str = "squash") -> dict:
         r = await request("PUT", f"{self.api}/pulls/{pr_number}/merge", headers=await self._headers(), json={"merge_method": merge_method})
         r.raise_for_status()
+        if self.mirror is not None:
+            await self.get_pr(pr_number)
         return r.json()
 
     async def close_pr(self, pr_number: int) -> dict:
         r = await request("PATCH", f"{self.api}/pulls/{pr_number}", headers=await self._headers(), json={"state": "closed"})
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
 
     async def reopen_pr(self, pr_number: int) -> dict:
         r = await request("PATCH", f"{self.api}/pulls/{pr_number}", headers=await self._headers(), json={"state": "open"})
         r.raise_for_status()
-        return r.json()
+        return await self._record(r.json())
 
     async def add_pr_comment(self, pr_number: int, comment: str) -> dict:
         r = await request("POST", f"{self.api}/issues/{pr_number}/comments", headers=await self._headers(), json={"body": comment})
@@ -267,3 +657,19 @@ class GitHubService:
             raise ValueError("whitelist_file_path not configured")
         return await self.get_file(self.whitelist_file_path, ref)
 
+    async def get_whitelist_snapshot(self, branch: str) -> FileSnapshot:
+        if not self.whitelist_file_path:
+            raise ValueError("whitelist_file_path not configured")
+        return await self.get_file_snapshot(self.whitelist_file_path, branch)
+
+    async def commit_whitelist_and_open_pr(
+        self,
+        snapshot: FileSnapshot,
+        *,
+        new_text: str | None,
+        message: str,
+        title: str,
+        body: str,
+    ) -> dict:
+        return await self.commit_file_and_open_pr(snapshot, new_text=new_text, message=message, title=title, body=body)
+
@@ -0,0 +1,73 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from bulmaai.services.http import request
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+
+class GitHubGraphQLError(Exception):
+    """GraphQL-level failure; GitHub reports these with HTTP 200."""
+
+    def __init__(self, errors: list[dict], data: dict | None = None):
+        self.errors = errors
+        self.data = data or {}
+        messages = "; ".join(str(error.get("message", error)) for error in errors)
+        super().__init__(messages or "GraphQL request failed")
+
+
+class GraphQLBatch:
+    """Collects several root fields into a single GraphQL operation.
+
+    Each field gets an alias and its own variables, which are namespaced by
+    alias so fields cannot collide. Mutations in one document run in the
+    order they were added.
+    """
+
+    def __init__(self, operation: str = "mutation"):
+        self.operation = operation
+        self._fields: list[str] = []
+        self._declarations: list[str] = []
+        self.variables: dict[str, Any] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._fields)
+
+    def add(self, alias: str, field: str, selection: str, variables: dict[str, tuple[str, Any]]) -> None:
+        """Add ``alias: field(arg: $alias_arg, ...) { selection }``.
+
+        *variables* maps argument name to ``(graphql type, value)``.
+        """
+        arguments = []
+        for name, (type_name, value) in variables.items():
+            variable = f"{alias}_{name}"
+            self._declarations.append(f"${variable}: {type_name}")
+            self.variables[variable] = value
+            arguments.append(f"{name}: ${variable}")
+        args = f"({', '.join(arguments)})" if arguments else ""
+        self._fields.append(f"{alias}: {field}{args} {{ {selection} }}")
+
+    def render(self) -> str:
+        declarations = f"({', '.join(self._declarations)})" if self._declarations else ""
+        return f"{self.operation}{declarations} {{ {' '.join(self._fields)} }}"
+
+
+class GitHubGraphQLClient:
+    def __init__(self, headers: Callable[[], Awaitable[dict[str, str]]]):
+        self._headers = headers
+
+    async def execute(self, query: str, variables: dict[str, Any] | None = None) -> dict:
+        r = await request(
+            "POST",
+            GITHUB_GRAPHQL_URL,
+            headers=await self._headers(),
+            json={"query": query, "variables": variables or {}},
+        )
+        r.raise_for_status()
+        payload = r.json()
+        if payload.get("errors"):
+            raise GitHubGraphQLError(payload["errors"], payload.get("data"))
+        return payload.get("data") or {}
+
+    async def execute_batch(self, batch: GraphQLBatch) -> dict:
+        return await self.execute(batch.render(), batch.variables)
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from typing import Any
+
+DEFAULT_RESPONSE_CACHE_SIZE = 512
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class GitHubResponseCache:
+    """LRU of GitHub GET responses keyed by URL and query, for conditional requests.
+
+    Stored responses are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``; GitHub answers an unchanged resource with a bodiless
+    304 that does not count against the primary rate limit, and the stored
+    response is served instead. Because every read is revalidated, entries are
+    never stale and writes need no invalidation.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RESPONSE_CACHE_SIZE) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[CacheKey, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None = None) -> CacheKey:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None))
+        return url, items
+
+    def get(self, key: CacheKey) -> Any | None:
+        return self._entries.get(key)
+
+    @staticmethod
+    def conditional_headers(cached: Any | None) -> dict[str, str]:
+        """Validators for revalidating *cached*, the response from :meth:`get`."""
+        if cached is None:
+            return {}
+        headers: dict[str, str] = {}
+        etag = cached.headers.get("ETag")
+        last_modified = cached.headers.get("Last-Modified")
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def resolve(self, key: CacheKey, response: Any, *, cached: Any | None = None) -> Any:
+        """Return the response to hand to the caller, updating the cache.
+
+        A 304 is swapped for *cached*, the response the validators came from;
+        it is passed in because the entry may have been evicted by concurrent
+        requests in the meantime. A 200 carrying a validator replaces the entry.
+        """
+        if response.status_code == 304 and cached is not None:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        if response.status_code == 200:
+            headers = getattr(response, "headers", None) or {}
+            if headers.get("ETag") or headers.get("Last-Modified"):
+                self._entries[key] = response
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        elif response.status_code == 404:
+            self._entries.pop(key, None)
+        return response
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Services are built per command, so reads share one process-wide cache.
+shared_response_cache = GitHubResponseCache()
@@ -0,0 +1,138 @@
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+import aiohttp
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_TIMEOUT_SECONDS = 60
+
+
+class AttachmentTooLarge(RuntimeError):
+    pass
+
+
+@dataclass
+class AttachmentDownloadStats:
+    streams: int = 0
+    full_downloads: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+
+class AttachmentStream:
+    """One streamed attachment GET that can stop after the first few KB."""
+
+    def __init__(self, response: Any, *, max_bytes: int, chunk_size: int) -> None:
+        self._response = response
+        self._max_bytes = max_bytes
+        self._chunk_size = chunk_size
+        self._chunks: list[bytes] = []
+        self.bytes_read = 0
+        self.complete = False
+
+    async def _read_chunk(self) -> bool:
+        chunk = await self._response.content.read(self._chunk_size)
+        if not chunk:
+            self.complete = True
+            return False
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self._max_bytes:
+            raise AttachmentTooLarge(f"attachment exceeds {self._max_bytes} bytes")
+        self._chunks.append(chunk)
+        return True
+
+    async def read_preview(self, limit: int) -> bytes:
+        """Return at least the first *limit* bytes (or the whole file if shorter)."""
+        while self.bytes_read < limit and await self._read_chunk():
+            pass
+        return b"".join(self._chunks)[:limit]
+
+    async def read_all(self) -> bytes:
+        while await self._read_chunk():
+            pass
+        data = b"".join(self._chunks)
+        self._chunks = [data]
+        return data
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield the body from the start without keeping it in memory.
+
+        Chunks already buffered by :meth:`read_preview` come first and are
+        released as they are handed out, so the stream cannot be re-read.
+        """
+        while self._chunks:
+            yield self._chunks.pop(0)
+        while await self._read_chunk():
+            yield self._chunks.pop()
+
+    async def spool(self, file: BinaryIO) -> str:
+        """Write the whole body to *file* and return its SHA-256 hex digest."""
+        digest = hashlib.sha256()
+        async for chunk in self.iter_chunks():
+            digest.update(chunk)
+            file.write(chunk)
+        return digest.hexdigest()
+
+
+class AttachmentDownloader:
+    """Streams Discord attachments so triage only pays for the bytes it inspects."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        session_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.timeout_seconds = timeout_seconds
+        self._session_factory = session_factory
+        self._session: Any | None = None
+        self.stats = AttachmentDownloadStats()
+
+    def _get_session(self) -> Any:
+        if self._session is None:
+            if self._session_factory is not None:
+                self._session = self._session_factory()
+            else:
+                self._session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+                )
+        return self._session
+
+    @asynccontextmanager
+    async def stream(self, url: str, *, size: int | None = None) -> AsyncIterator[AttachmentStream]:
+        response = await self._get_session().get(url)
+        stream = AttachmentStream(response, max_bytes=self.max_bytes, chunk_size=self.chunk_size)
+        self.stats.streams += 1
+        try:
+            response.raise_for_status()
+            yield stream
+        finally:
+            self.stats.bytes_downloaded += stream.bytes_read
+            if stream.complete:
+                self.stats.full_downloads += 1
+                response.release()
+            else:
+                # Dropping the connection stops the rest of the body transferring.
+                response.close()
+                if size is not None:
+                    self.stats.bytes_saved += max(0, size - stream.bytes_read)
+
+    async def download(self, url: str, *, size: int | None = None) -> bytes:
+        async with self.stream(url, size=size) as stream:
+            return await stream.read_all()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import math
+import re
+
+from bulmaai.services.github_mirror import search_similar_github_items
+
+log = logging.getLogger(__name__)
+
+DUPLICATE_SEARCH_PER_QUERY = 10
+DUPLICATE_CANDIDATE_LIMIT = 5
+MAX_ERROR_QUERIES = 2
+MAX_LABEL_QUERIES = 2
+MAX_TITLE_TERMS = 6
+LOCAL_SEARCH_LIMIT = 30
+# Issues several queries agree on are likelier matches.
+MULTI_QUERY_BONUS = 0.1
+SHARED_ERROR_BONUS = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9_]{2,}")
+# Java exception class names, e.g. java.lang.NullPointerException or KiBlastError.
+_EXCEPTION_RE = re.compile(r"\b(?:[a-zA-Z_$][\w$]*\.)*([A-Z][\w$]*(?:Exception|Error))\b")
+_QUOTED_RE = re.compile(r"[\"`]([^\"`\n]{8,80})[\"`]")
+_STOPWORDS = frozenset(
+    {
+        "the", "and", "for", "with", "when", "that", "this", "from", "have", "has", "not", "but",
+        "are", "was", "you", "your", "can", "cant", "dont", "does", "doesnt", "after", "before",
+        "into", "then", "there", "what", "while", "will", "just", "still", "also", "get", "got",
+        "bug", "issue", "error", "problem", "game", "mod", "dragonminez", "please", "help",
+    }
+)
+# Labels every issue might carry; they say nothing about the component.
+_GENERIC_LABELS = frozenset(
+    {
+        "bug", "enhancement", "question", "duplicate", "invalid", "wontfix",
+        "help wanted", "good first issue", "documentation", "triage", "needs triage",
+    }
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def error_strings(text: str, *, limit: int = MAX_ERROR_QUERIES) -> list[str]:
+    """Distinctive error text worth an exact-phrase search: exception names, then quoted messages."""
+    found: list[str] = []
+    for match in _EXCEPTION_RE.finditer(text):
+        if match.group(1) not in found:
+            found.append(match.group(1))
+    for match in _QUOTED_RE.finditer(text):
+        phrase = match.group(1).strip()
+        if phrase and phrase not in found:
+            found.append(phrase)
+    return found[:limit]
+
+
+def component_labels(labels: list[dict], text: str, *, limit: int = MAX_LABEL_QUERIES) -> list[str]:
+    """Repository labels whose words all appear in *text*, ignoring generic workflow labels."""
+    tokens = set(tokenize(text))
+    matched = []
+    for label in labels:
+        name = str(label.get("name") or "").strip()
+        if not name or name.casefold() in _GENERIC_LABELS:
+            continue
+        words = tokenize(name)
+        if words and all(word in tokens for word in words):
+            matched.append(name)
+    return matched[:limit]
+
+
+def _title_terms(title: str) -> str:
+    return " ".join(list(dict.fromkeys(tokenize(title)))[:MAX_TITLE_TERMS])
+
+
+def build_queries(title: str, report_text: str) -> list[str]:
+    """Text queries for one report: title keywords, then exact error strings."""
+    title_terms = _title_terms(title)
+    queries = [title_terms] if title_terms else []
+    queries.extend(f'"{phrase}"' for phrase in error_strings(report_text))
+    return list(dict.fromkeys(queries))
+
+
+async def _search(service, query: str) -> list[dict]:
+    try:
+        return await service.search_issues(query, per_page=DUPLICATE_SEARCH_PER_QUERY)
+    except Exception:
+        log.warning("Duplicate search failed for %r", query, exc_info=True)
+        return []
+
+
+async def _label_search(service, title: str, text: str) -> list[list[dict]]:
+    try:
+        labels = component_labels(await service.get_labels(), text)
+    except Exception:
+        log.warning("Could not load labels for duplicate search", exc_info=True)
+        return []
+    title_terms = _title_terms(title)
+    queries = [f'label:"{label}" {title_terms}'.strip() for label in labels]
+    return list(await asyncio.gather(*(_search(service, query) for query in queries)))
+
+
+async def search_duplicate_candidates(service, *, title: str, report_text: str) -> list[dict]:
+    """Run the title, error-string and component-label searches concurrently.
+
+    Hits are merged and deduplicated by issue number. Each returned issue
+    carries ``_query_hits``, the number of queries that found it. Failed
+    queries are skipped, so a partial result is still returned.
+    """
+    searches = [_search(service, query) for query in build_queries(title, report_text)]
+    *text_results, label_results = await asyncio.gather(
+        *searches,
+        _label_search(service, title, f"{title}\n{report_text}"),
+    )
+    result_lists = [*text_results, *label_results]
+
+    merged: dict[int, dict] = {}
+    for issues in result_lists:
+        for issue in issues:
+            # The issue-search endpoint can return pull requests too.
+            if "pull_request" in issue or not issue.get("number"):
+                continue
+            number = int(issue["number"])
+            if number in merged:
+                merged[number]["_query_hits"] += 1
+            else:
+                merged[number] = {**issue, "_query_hits": 1}
+    return list(merged.values())
+
+
+def index_terms(title: str, report_text: str) -> list[str]:
+    """Full-text terms for the mirror index: title words, error words, then the rest of the report."""
+    errors = " ".join(error_strings(report_text))
+    return list(dict.fromkeys([*tokenize(title), *tokenize(errors), *tokenize(report_text)]))
+
+
+async def local_duplicate_candidates(repo: str, *, title: str, report_text: str) -> list[dict]:
+    """Duplicate candidates from the mirrored issues' full-text index; no GitHub quota used."""
+    return await search_similar_github_items(
+        repo,
+        terms=index_terms(title, report_text),
+        kind="issue",
+        limit=LOCAL_SEARCH_LIMIT,
+    )
+
+
+def _similarity(query_tokens: set[str], candidate_tokens: set[str]) -> float:
+    if not query_tokens or not candidate_tokens:
+        return 0.0
+    return len(query_tokens & candidate_tokens) / math.sqrt(len(query_tokens) * len(candidate_tokens))
+
+
+def rank_duplicate_candidates(
+    report_text: str,
+    candidates: list[dict],
+    *,
+    limit: int = DUPLICATE_CANDIDATE_LIMIT,
+) -> list[dict]:
+    """Order candidates by token overlap with the report and keep the best *limit*.
+
+    Title overlap dominates; the body is a weaker signal because it is long
+    and noisy. Sharing an exception name or quoted error adds a fixed bonus.
+    """
+    query_tokens = set(tokenize(report_text))
+    report_errors = {error.casefold() for error in error_strings(report_text, limit=10)}
+    scored = []
+    for index, candidate in enumerate(candidates):
+        title = str(candidate.get("title") or "")
+        body = str(candidate.get("body") or "")[:2000]
+        score = _similarity(query_tokens, set(tokenize(title)))
+        score += 0.5 * _similarity(query_tokens, set(tokenize(body)))
+        candidate_errors = {error.casefold() for error in error_strings(f"{title}\n{body}", limit=10)}
+        if report_errors & candidate_errors:
+            score += SHARED_ERROR_BONUS
+        score += MULTI_QUERY_BONUS * (int(candidate.get("_query_hits", 1)) - 1)
+        scored.append((score, -index, candidate))
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [candidate for score, _index, candidate in scored[:limit] if score > 0]
@@ -0,0 +1,341 @@
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from bulmaai.database.db import get_pool
+
+log = logging.getLogger(__name__)
+
+GITHUB_MIRROR_BATCH_SIZE = 100
+# Full-text queries are OR-ed term lists; more terms only widen the net.
+MAX_FULLTEXT_TERMS = 16
+
+
+@dataclass(slots=True, frozen=True)
+class GitHubSyncState:
+    repo: str
+    items_cursor: datetime | None
+    synced_at: datetime | None
+
+
+def _parse_github_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _format_github_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _item_kind(item: dict) -> str:
+    # The issues endpoint marks PRs with "pull_request"; the pulls endpoint has "head".
+    return "pull" if "pull_request" in item or "head" in item else "issue"
+
+
+def _normalized_item(item: dict) -> dict:
+    data = dict(item)
+    pull_request = data.get("pull_request")
+    if isinstance(pull_request, dict) and "merged_at" not in data:
+        data["merged_at"] = pull_request.get("merged_at")
+    return data
+
+
+def _load_json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+async def upsert_github_items(repo: str, items: list[dict]) -> None:
+    rows = []
+    for item in items:
+        updated_at = _parse_github_time(item.get("updated_at")) or datetime.now(timezone.utc)
+        rows.append(
+            (
+                repo,
+                int(item["number"]),
+                _item_kind(item),
+                str(item.get("state") or "open"),
+                str(item.get("title") or ""),
+                json.dumps(_normalized_item(item), ensure_ascii=False),
+                updated_at,
+            )
+        )
+    if not rows:
+        return
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        await conn.executemany(
+            """
+            INSERT INTO github_items (repo, number, kind, state, title, data, updated_at, synced_at)
+            VALUES ($1, $2, $3, $4, $5, $6::jsonb, $7, now())
+            ON CONFLICT (repo, number) DO UPDATE SET
+                kind = EXCLUDED.kind,
+                state = EXCLUDED.state,
+                title = EXCLUDED.title,
+                data = EXCLUDED.data,
+                updated_at = EXCLUDED.updated_at,
+                synced_at = now()
+            WHERE github_items.updated_at <= EXCLUDED.updated_at
+            """,
+            rows,
+        )
+
+
+async def update_github_item_labels(repo: str, number: int, labels: list[dict]) -> None:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            UPDATE github_items
+            SET data = jsonb_set(data, '{labels}', $3::jsonb), synced_at = now()
+            WHERE repo = $1 AND number = $2
+            """,
+            repo,
+            number,
+            json.dumps(labels, ensure_ascii=False),
+        )
+
+
+async def list_github_items(
+    repo: str,
+    *,
+    kind: str,
+    state: str = "open",
+    labels: str | None = None,
+    limit: int = 25,
+) -> list[dict]:
+    """Mirrored items newest first, filtered like the REST list endpoints."""
+    label_filter = (
+        json.dumps([{"name": name.strip()} for name in labels.split(",") if name.strip()])
+        if labels
+        else None
+    )
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT data
+            FROM github_items
+            WHERE repo = $1
+              AND kind = $2
+              AND ($3 = 'all' OR state = $3)
+              AND ($4::jsonb IS NULL OR data->'labels' @> $4::jsonb)
+            ORDER BY number DESC
+            LIMIT $5
+            """,
+            repo,
+            kind,
+            state,
+            label_filter,
+            limit,
+        )
+    return [_load_json(row["data"]) for row in rows]
+
+
+def _escape_like(text: str) -> str:
+    """*text* as a literal inside a LIKE pattern using ``ESCAPE '\\'``."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def get_github_item(repo: str, *, kind: str, number: int) -> dict | None:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            "SELECT data FROM github_items WHERE repo = $1 AND kind = $2 AND number = $3",
+            repo,
+            kind,
+            number,
+        )
+    return _load_json(row["data"]) if row is not None else None
+
+
+async def search_github_items(repo: str, *, kind: str, text: str, limit: int = 25) -> list[dict]:
+    """Items whose number or title matches *text*, for autocomplete."""
+    text = _escape_like(text.strip().lstrip("#"))
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            r"""
+            SELECT data
+            FROM github_items
+            WHERE repo = $1
+              AND kind = $2
+              AND (
+                $3 = ''
+                OR number::text LIKE $3 || '%' ESCAPE '\'
+                OR title ILIKE '%' || $3 || '%' ESCAPE '\'
+              )
+            ORDER BY (state = 'open') DESC, number DESC
+            LIMIT $4
+            """,
+            repo,
+            kind,
+            text,
+            limit,
+        )
+    return [_load_json(row["data"]) for row in rows]
+
+
+async def search_similar_github_items(
+    repo: str,
+    *,
+    terms: list[str],
+    kind: str = "issue",
+    limit: int = 25,
+) -> list[dict]:
+    """Items matching any of *terms*, best full-text match first.
+
+    Backed by the ``search_vector`` GIN index, which Postgres keeps current
+    on every mirror upsert. Titles weigh more than bodies. Each returned
+    item carries ``_rank``, its ``ts_rank_cd`` score.
+    """
+    terms = list(dict.fromkeys(term.strip() for term in terms if term.strip()))[:MAX_FULLTEXT_TERMS]
+    if not terms:
+        return []
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT data, ts_rank_cd(search_vector, query) AS rank
+            FROM github_items, websearch_to_tsquery('english', $3) AS query
+            WHERE repo = $1
+              AND kind = $2
+              AND search_vector @@ query
+            ORDER BY rank DESC, number DESC
+            LIMIT $4
+            """,
+            repo,
+            kind,
+            " or ".join(terms),
+            limit,
+        )
+    return [{**_load_json(row["data"]), "_rank": float(row["rank"])} for row in rows]
+
+
+async def replace_github_labels(repo: str, labels: list[dict]) -> None:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("DELETE FROM github_labels WHERE repo = $1", repo)
+            await conn.executemany(
+                "INSERT INTO github_labels (repo, name, data) VALUES ($1, $2, $3::jsonb)",
+                [(repo, label["name"], json.dumps(label, ensure_ascii=False)) for label in labels],
+            )
+
+
+async def list_github_labels(repo: str) -> list[dict]:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            "SELECT data FROM github_labels WHERE repo = $1 ORDER BY lower(name)",
+            repo,
+        )
+    return [_load_json(row["data"]) for row in rows]
+
+
+async def get_github_sync_state(repo: str) -> GitHubSyncState | None:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            "SELECT repo, items_cursor, synced_at FROM github_sync_state WHERE repo = $1",
+            repo,
+        )
+    if row is None:
+        return None
+    return GitHubSyncState(repo=row["repo"], items_cursor=row["items_cursor"], synced_at=row["synced_at"])
+
+
+async def set_github_sync_state(repo: str, *, items_cursor: datetime | None) -> None:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO github_sync_state (repo, items_cursor, synced_at)
+            VALUES ($1, $2, now())
+            ON CONFLICT (repo) DO UPDATE SET
+                items_cursor = EXCLUDED.items_cursor,
+                synced_at = now()
+            """,
+            repo,
+            items_cursor,
+        )
+
+
+async def sync_github_repo(service) -> int:
+    """Pull issues, PRs and labels changed since the last sync into the mirror.
+
+    The issues endpoint returns pull requests too, so one ``since=`` walk in
+    ascending ``updated`` order covers both. The cursor is saved only after a
+    complete pass, so boards never read from a half-filled first sync.
+    Returns the number of items written.
+    """
+    repo = service.repo
+    state = await get_github_sync_state(repo)
+    cursor = state.items_cursor if state is not None else None
+    written = 0
+    batch: list[dict] = []
+
+    async def flush() -> None:
+        nonlocal cursor, written
+        if not batch:
+            return
+        items = list(batch)
+        batch.clear()
+        await upsert_github_items(repo, items)
+        times = [t for t in (_parse_github_time(item.get("updated_at")) for item in items) if t is not None]
+        if times and (cursor is None or max(times) > cursor):
+            cursor = max(times)
+        written += len(items)
+
+    async for item in service.iter_issues(
+        state="all",
+        since=_format_github_time(cursor) if cursor is not None else None,
+        sort="updated",
+        direction="asc",
+    ):
+        batch.append(item)
+        if len(batch) >= GITHUB_MIRROR_BATCH_SIZE:
+            await flush()
+    await flush()
+
+    await replace_github_labels(repo, await service.get_labels())
+    await set_github_sync_state(repo, items_cursor=cursor)
+    return written
+
+
+class GitHubMirror:
+    """Write-through hook for :class:`GitHubService`.
+
+    Objects GitHub returns from reads and writes are recorded so the mirror
+    reflects bot actions immediately instead of at the next sync. Failures
+    are logged and never fail the GitHub call itself.
+    """
+
+    def __init__(self) -> None:
+        self._synced: set[str] = set()
+
+    def mark_synced(self, repo: str) -> None:
+        self._synced.add(repo)
+
+    async def is_synced(self, repo: str) -> bool:
+        """Whether *repo* has completed a full sync and can serve reads."""
+        if repo not in self._synced and await get_github_sync_state(repo) is not None:
+            self._synced.add(repo)
+        return repo in self._synced
+
+    async def record(self, repo: str, item: dict) -> None:
+        try:
+            await upsert_github_items(repo, [item])
+        except Exception:
+            log.warning("Failed to mirror %s#%s", repo, item.get("number"), exc_info=True)
+
+    async def record_labels(self, repo: str, number: int, labels: list[dict]) -> None:
+        try:
+            await update_github_item_labels(repo, number, labels)
+        except Exception:
+            log.warning("Failed to mirror labels for %s#%s", repo, number, exc_info=True)
+
+
+shared_github_mirror = GitHubMirror()
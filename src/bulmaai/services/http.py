@@ -1,20 +1,467 @@
 import asyncio
+import json as jsonlib
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
 import requests
+from requests.structures import CaseInsensitiveDict
 
-from typing import Any
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_KEEPALIVE_SECONDS = 30
+DEFAULT_TIMEOUT_SECONDS = 30
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RATE_LIMIT_PER_SECOND = 10.0
+DEFAULT_RATE_LIMIT_BURST = 20
+# Longest Retry-After / rate-limit reset the client will wait out. Longer
+# waits are not slept through: the limited response is returned instead.
+DEFAULT_MAX_RETRY_WAIT_SECONDS = 60.0
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 8.0
+# GitHub asks for a minute's pause after a secondary rate limit without Retry-After.
+SECONDARY_RATE_LIMIT_WAIT_SECONDS = 60.0
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class HostLimits:
+    rate_per_second: float
+    burst: int
+    # Extra bucket for mutating methods, for APIs that limit writes separately.
+    write_rate_per_second: float | None = None
+    write_burst: int = 1
+
+
+# GitHub's secondary limits cap content-creating requests at roughly one per second.
+HOST_LIMITS: dict[str, HostLimits] = {
+    "api.github.com": HostLimits(rate_per_second=10.0, burst=20, write_rate_per_second=1.0, write_burst=5),
+}
+
+
+class HTTPResponse:
+    """A fully read response exposing the parts of ``requests.Response`` callers use.
+
+    ``raise_for_status`` raises :class:`requests.HTTPError` with ``response``
+    set, so existing ``except HTTPError`` handlers keep working.
+    """
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        url: str,
+        status_code: int,
+        reason: str | None,
+        headers: CaseInsensitiveDict,
+        content: bytes,
+        encoding: str | None = None,
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason or ""
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    def __repr__(self) -> str:
+        return f"<HTTPResponse [{self.status_code}]>"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self, **kwargs: Any) -> Any:
+        return jsonlib.loads(self.text, **kwargs)
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code < 500:
+            kind = "Client Error"
+        elif 500 <= self.status_code < 600:
+            kind = "Server Error"
+        else:
+            return
+        raise requests.HTTPError(
+            f"{self.status_code} {kind}: {self.reason} for url: {self.url}",
+            response=self,
+        )
+
+
+@dataclass
+class HTTPClientStats:
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    throttle_wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """Async token bucket; callers queue in FIFO order for the next token.
+
+    :meth:`block_until` pauses the bucket entirely, which is how server
+    ``Retry-After`` and rate-limit reset hints are applied to every request
+    for the host, not just the one that received them.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.rate_per_second = max(0.001, float(rate_per_second))
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def block_until(self, deadline: float) -> None:
+        self._blocked_until = max(self._blocked_until, deadline)
+
+    async def acquire(self) -> float:
+        """Take one token, returning how long the caller had to wait."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_second)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self.rate_per_second
+                waited += delay
+                await self._sleep(delay)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_wait(response: "HTTPResponse") -> tuple[bool, float | None]:
+    """Return (rejected by a rate limit, seconds until the limit lifts)."""
+    headers = response.headers
+    retry_after = _parse_retry_after(headers.get("Retry-After"))
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset_wait: float | None = None
+    if remaining == "0":
+        try:
+            reset_wait = max(0.0, float(headers.get("X-RateLimit-Reset", "")) - time.time())
+        except ValueError:
+            reset_wait = None
+
+    rejected = response.status_code == 429 or (
+        response.status_code == 403
+        and (retry_after is not None or remaining == "0" or b"rate limit" in response.content.lower())
+    )
+    if retry_after is not None:
+        return rejected, retry_after
+    if reset_wait is not None:
+        return rejected, reset_wait
+    if rejected and response.status_code == 403:
+        return rejected, SECONDARY_RATE_LIMIT_WAIT_SECONDS
+    return rejected, None
+
+
+def _normalize_params(params: dict[str, Any] | None) -> list[tuple[str, str]] | None:
+    """Encode params the way requests does: drop None, repeat list values."""
+    if params is None:
+        return None
+    items: list[tuple[str, str]] = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is not None:
+                items.append((str(key), str(item)))
+    return items
+
+
+class HTTPClient:
+    """Shared aiohttp session with pooled keep-alive connections.
+
+    The connector caps open connections overall and per host, so a burst of
+    calls to one API queues for a pooled connection instead of opening new
+    sockets. The session is bound to the event loop it was created on and is
+    recreated if used from another loop.
+
+    Every request first takes a token from its host's bucket (see
+    :data:`HOST_LIMITS`). ``Retry-After`` and exhausted ``X-RateLimit-*``
+    headers pause the host's bucket until the limit lifts. Rate-limited
+    responses are retried for any method because the server rejected them
+    unprocessed; 5xx responses and connection errors are retried, with
+    jittered exponential backoff, only for idempotent methods.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        connect_timeout_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rate_limit_per_second: float = DEFAULT_RATE_LIMIT_PER_SECOND,
+        rate_limit_burst: int = DEFAULT_RATE_LIMIT_BURST,
+        max_retry_wait_seconds: float = DEFAULT_MAX_RETRY_WAIT_SECONDS,
+        host_limits: dict[str, HostLimits] | None = None,
+        session_factory: Callable[[], Any] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.max_connections = max(1, int(max_connections))
+        self.max_connections_per_host = max(1, int(max_connections_per_host))
+        self.keepalive_seconds = max(0.0, float(keepalive_seconds))
+        self.timeout_seconds = max(1.0, float(timeout_seconds))
+        self.connect_timeout_seconds = max(1.0, float(connect_timeout_seconds))
+        self.max_retries = max(0, int(max_retries))
+        self.max_retry_wait_seconds = max(0.0, float(max_retry_wait_seconds))
+        self.default_limits = HostLimits(rate_per_second=rate_limit_per_second, burst=rate_limit_burst)
+        self.host_limits = dict(HOST_LIMITS if host_limits is None else host_limits)
+        self._session_factory = session_factory
+        self._session: Any | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._buckets_loop: asyncio.AbstractEventLoop | None = None
+        self.stats = HTTPClientStats()
+
+    def _new_session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_seconds,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=self.timeout_seconds,
+                connect=self.connect_timeout_seconds,
+            ),
+        )
+
+    def _get_session(self) -> Any:
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is None or getattr(session, "closed", False) or self._session_loop is not loop:
+            self._session = self._new_session()
+            self._session_loop = loop
+        return self._session
+
+    def _bucket(self, host: str, kind: str) -> TokenBucket | None:
+        loop = asyncio.get_running_loop()
+        if self._buckets_loop is not loop:
+            # Bucket locks belong to the loop they were created on.
+            self._buckets.clear()
+            self._buckets_loop = loop
+        key = (host, kind)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limits = self.host_limits.get(host, self.default_limits)
+            if kind == "write":
+                if limits.write_rate_per_second is None:
+                    return None
+                rate, burst = limits.write_rate_per_second, limits.write_burst
+            else:
+                rate, burst = limits.rate_per_second, limits.burst
+            bucket = TokenBucket(rate, burst, clock=self._clock, sleep=self._sleep)
+            self._buckets[key] = bucket
+        return bucket
+
+    async def _throttle(self, host: str, method: str) -> None:
+        kinds = ("host",) if method in IDEMPOTENT_METHODS else ("host", "write")
+        for kind in kinds:
+            bucket = self._bucket(host, kind)
+            if bucket is not None:
+                self.stats.throttle_wait_seconds += await bucket.acquire()
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: spreads retries from concurrent callers apart.
+        return random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        data: Any | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+        max_retry_wait: float | None = None,
+    ) -> HTTPResponse:
+        """Send a request, retrying as described on the class.
+
+        *retries* and *max_retry_wait* override ``max_retries`` and
+        ``max_retry_wait_seconds`` for this call; callers with their own
+        deadline or failure handling pass 0 for both.
+        """
+        max_retries = self.max_retries if retries is None else max(0, int(retries))
+        max_wait = self.max_retry_wait_seconds if max_retry_wait is None else max(0.0, float(max_retry_wait))
+        kwargs: dict[str, Any] = {
+            "headers": headers,
+            "params": _normalize_params(params),
+        }
+        if data is not None:
+            kwargs["data"] = data
+        elif json is not None:
+            kwargs["json"] = json
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(
+                total=float(timeout),
+                connect=min(float(timeout), self.connect_timeout_seconds),
+            )
+
+        method = method.upper()
+        host = (urlsplit(url).hostname or "").lower()
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            await self._throttle(host, method)
+            self.stats.requests += 1
+            try:
+                response = await self._send(method, url, kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                if not idempotent or attempt >= max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                log.warning("%s %s failed (%s); retrying in %.1fs", method, url, error, delay)
+            else:
+                rate_limited, wait = _rate_limit_wait(response)
+                if wait is not None and wait <= max_wait:
+                    self._bucket(host, "host").block_until(self._clock() + wait)
+                if rate_limited:
+                    self.stats.rate_limited += 1
+                    retry = wait is None or wait <= max_wait
+                else:
+                    retry = idempotent and response.status_code in RETRYABLE_STATUSES
+                if not retry or attempt >= max_retries:
+                    return response
+                delay = self._backoff(attempt)
+                log.warning(
+                    "%s %s returned %d; retrying in %.1fs%s",
+                    method,
+                    url,
+                    response.status_code,
+                    delay,
+                    f" after a {wait:.0f}s rate-limit pause" if rate_limited and wait else "",
+                )
+            self.stats.retries += 1
+            attempt += 1
+            await self._sleep(delay)
+
+    async def _send(self, method: str, url: str, kwargs: dict[str, Any]) -> HTTPResponse:
+        async with self._get_session().request(method, url, **kwargs) as response:
+            content = await response.read()
+            return HTTPResponse(
+                method=method,
+                url=str(response.url),
+                status_code=response.status,
+                reason=response.reason,
+                headers=CaseInsensitiveDict(response.headers),
+                content=content,
+                encoding=response.charset,
+            )
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None and not getattr(session, "closed", False):
+            await session.close()
+
+
+_client: HTTPClient | None = None
+_client_options: dict[str, Any] = {}
+
+
+def get_client() -> HTTPClient:
+    global _client
+    if _client is None:
+        _client = HTTPClient(**_client_options)
+    return _client
+
+
+def set_client_options(**options: Any) -> None:
+    """Build the shared client from *options* (see :class:`HTTPClient`).
+
+    Meant to be called once at startup, before any request. A client that
+    already exists is replaced; it holds no session until used on a loop.
+    """
+    global _client, _client_options
+    _client_options = dict(options)
+    if _client is not None:
+        if _client._session is not None:
+            raise RuntimeError("the shared HTTP client is already in use; call configure_client() instead")
+        _client = None
+
+
+async def configure_client(**options: Any) -> HTTPClient:
+    """Replace the shared client with one built from *options* (see :class:`HTTPClient`)."""
+    global _client
+    previous, _client = _client, HTTPClient(**options)
+    if previous is not None:
+        await previous.close()
+    return _client
+
+
+async def close_client() -> None:
+    if _client is not None:
+        await _client.close()
 
 
 async def request(method: str, url: str, *, headers: dict[str, str] | None = None,
                   params: dict[str, Any] | None = None, json: Any | None = None,
                   data: Any | None = None,
-                  timeout: int = 30) -> requests.Response:
-    def _do():
-        return requests.request(
-            method, url,
-            headers=headers,
-            params=params,
-            json=json,
-            data=data,
-            timeout=timeout,
-        )
-    return await asyncio.to_thread(_do)
+                  timeout: float | None = None,
+                  retries: int | None = None,
+                  max_retry_wait: float | None = None) -> HTTPResponse:
+    return await get_client().request(
+        method, url,
+        headers=headers,
+        params=params,
+        json=json,
+        data=data,
+        timeout=timeout,
+        retries=retries,
+        max_retry_wait=max_retry_wait,
+    )
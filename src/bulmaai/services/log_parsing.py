@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from bulmaai.utils.log_parser import LogReport, parse_log, parse_log_file
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_QUEUE_SIZE = 8
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+class LogParseQueueFull(RuntimeError):
+    pass
+
+
+class LogParseTimeout(RuntimeError):
+    pass
+
+
+@dataclass
+class LogParseStats:
+    submitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    failed: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+    parse_seconds_total: float = 0.0
+    parse_seconds_max: float = 0.0
+
+    def record(self, *, queue_wait_seconds: float, parse_seconds: float) -> None:
+        self.completed += 1
+        self.queue_wait_seconds_total += queue_wait_seconds
+        self.queue_wait_seconds_max = max(self.queue_wait_seconds_max, queue_wait_seconds)
+        self.parse_seconds_total += parse_seconds
+        self.parse_seconds_max = max(self.parse_seconds_max, parse_seconds)
+
+    @property
+    def average_queue_wait_ms(self) -> float:
+        return self.queue_wait_seconds_total * 1000 / self.completed if self.completed else 0.0
+
+    @property
+    def average_parse_ms(self) -> float:
+        return self.parse_seconds_total * 1000 / self.completed if self.completed else 0.0
+
+
+def _timed_parse(parse_func: Callable[[str], LogReport], source: str) -> tuple[LogReport, float]:
+    start = time.perf_counter()
+    report = parse_func(source)
+    return report, time.perf_counter() - start
+
+
+def _single_process_executor() -> Executor:
+    # Spawned children start clean instead of inheriting the bot's event loop
+    # and gateway threads through fork().
+    return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _discard_executor(executor: Executor) -> None:
+    """Shut *executor* down without waiting, killing any job still running in it."""
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+class LogParsingService:
+    """Runs :func:`parse_log` off the event loop on a bounded set of worker processes.
+
+    Each worker is its own single-process executor so a job that times out or
+    is cancelled can be killed and replaced without touching the others. At
+    most ``max_workers`` jobs run at once and ``max_queue_size`` more may wait;
+    anything beyond that is rejected with :class:`LogParseQueueFull`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        parse_func: Callable[[str], LogReport] = parse_log,
+        parse_file_func: Callable[[str], LogReport] = parse_log_file,
+        executor_factory: Callable[[], Executor] = _single_process_executor,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must not be negative")
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.timeout_seconds = max(0.1, float(timeout_seconds))
+        self._parse_func = parse_func
+        self._parse_file_func = parse_file_func
+        self._executor_factory = executor_factory
+        # None is a wake-up sentinel put there by close().
+        self._idle: asyncio.Queue[Executor | None] | None = None
+        self._executors: set[Executor] = set()
+        self._in_flight = 0
+        self._closed = False
+        self.stats = LogParseStats()
+
+    @property
+    def queue_size(self) -> int:
+        """Jobs accepted but still waiting for a worker."""
+        return max(0, self._in_flight - self.max_workers)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _idle_executors(self) -> asyncio.Queue[Executor | None]:
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self.max_workers):
+                self._idle.put_nowait(self._new_executor())
+        return self._idle
+
+    def _new_executor(self) -> Executor:
+        executor = self._executor_factory()
+        self._executors.add(executor)
+        return executor
+
+    def _replace_executor(self, executor: Executor) -> Executor:
+        self._executors.discard(executor)
+        _discard_executor(executor)
+        if self._closed:
+            return executor
+        return self._new_executor()
+
+    async def parse(self, text: str) -> LogReport:
+        return await self._submit(self._parse_func, text, f"{len(text)} chars")
+
+    async def parse_file(self, path: str) -> LogReport:
+        """Parse the log at *path* in a worker, which streams it in chunks.
+
+        Only the path crosses the process boundary, so neither process holds
+        the whole log in memory.
+        """
+        return await self._submit(self._parse_file_func, path, os.path.basename(path))
+
+    async def _submit(
+        self,
+        parse_func: Callable[[str], LogReport],
+        source: str,
+        description: str,
+    ) -> LogReport:
+        if self._closed:
+            raise RuntimeError("LogParsingService is closed")
+        if self._in_flight >= self.max_workers + self.max_queue_size:
+            self.stats.rejected += 1
+            raise LogParseQueueFull(
+                f"{self._in_flight} log parse jobs already in flight"
+            )
+
+        self._in_flight += 1
+        self.stats.submitted += 1
+        enqueued_at = time.perf_counter()
+        try:
+            idle = self._idle_executors()
+            executor = await idle.get()
+            if executor is None:
+                raise RuntimeError("log parsing service closed")
+            queue_wait = time.perf_counter() - enqueued_at
+            try:
+                future = asyncio.get_running_loop().run_in_executor(
+                    executor, _timed_parse, parse_func, source
+                )
+                report, parse_seconds = await asyncio.wait_for(future, timeout=self.timeout_seconds)
+            except asyncio.TimeoutError as error:
+                self.stats.timed_out += 1
+                executor = self._replace_executor(executor)
+                raise LogParseTimeout(
+                    f"log parse exceeded {self.timeout_seconds:.0f}s"
+                ) from error
+            except asyncio.CancelledError:
+                # The worker may still be busy with this job; recycle it.
+                executor = self._replace_executor(executor)
+                raise
+            except Exception:
+                self.stats.failed += 1
+                executor = self._replace_executor(executor)
+                raise
+            finally:
+                if not self._closed:
+                    idle.put_nowait(executor)
+        finally:
+            self._in_flight -= 1
+
+        self.stats.record(queue_wait_seconds=queue_wait, parse_seconds=parse_seconds)
+        log.info(
+            "Parsed log %s (queue wait %.0f ms, parse %.0f ms)",
+            description,
+            queue_wait * 1000,
+            parse_seconds * 1000,
+            extra={
+                "event": "log_parse_completed",
+                "queue_wait_ms": round(queue_wait * 1000),
+                "parse_ms": round(parse_seconds * 1000),
+                "in_flight": self._in_flight,
+            },
+        )
+        return report
+
+    def close(self) -> None:
+        """Cancel queued jobs and stop every worker process.
+
+        Jobs still waiting for a worker fail with ``RuntimeError``.
+        """
+        self._closed = True
+        for executor in list(self._executors):
+            _discard_executor(executor)
+        self._executors.clear()
+        idle, self._idle = self._idle, None
+        if idle is not None:
+            for _ in range(self._in_flight):
+                idle.put_nowait(None)
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from bulmaai.database.db import get_pool
+from bulmaai.utils.log_parser import LogReport
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_TTL_SECONDS = 6 * 3600
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def report_to_dict(report: LogReport) -> dict[str, Any]:
+    return asdict(report)
+
+
+def report_from_dict(data: dict[str, Any]) -> LogReport:
+    known = LogReport.__dataclass_fields__
+    return LogReport(**{key: value for key, value in data.items() if key in known})
+
+
+@dataclass
+class CachedLogReport:
+    report: LogReport
+    embed: dict[str, Any] | None = None
+    filename: str | None = None
+    expires_at: float = 0.0
+
+
+@dataclass
+class LogReportCacheStats:
+    hits: int = 0
+    misses: int = 0
+    persistent_hits: int = 0
+    downloads_skipped: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LogReportCache:
+    """LRU + TTL cache of parsed log reports keyed by attachment content hash.
+
+    Attachment IDs are also remembered against their content hash so a file
+    that was already downloaded once (e.g. at triage) can be answered again
+    without another download. Re-uploads get a new attachment ID, so the
+    content hash is also remembered by file size and the hash of its first
+    bytes, which lets a repeat upload be answered from the triage preview
+    alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        persist: bool = False,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = max(1, int(ttl_seconds))
+        self.persist = persist
+        self.stats = LogReportCacheStats()
+        self._entries: OrderedDict[str, CachedLogReport] = OrderedDict()
+        self._attachments: OrderedDict[int, str] = OrderedDict()
+        self._previews: OrderedDict[tuple[int, str], str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def remember_attachment(self, attachment_id: int, digest: str) -> None:
+        self._attachments[attachment_id] = digest
+        self._attachments.move_to_end(attachment_id)
+        # Aliases are tiny, but keep them bounded alongside the entries.
+        while len(self._attachments) > self.max_entries * 4:
+            self._attachments.popitem(last=False)
+
+    def digest_for_attachment(self, attachment_id: int) -> str | None:
+        return self._attachments.get(attachment_id)
+
+    def remember_preview(self, size: int, preview_digest: str, digest: str) -> None:
+        key = (size, preview_digest)
+        self._previews[key] = digest
+        self._previews.move_to_end(key)
+        while len(self._previews) > self.max_entries * 4:
+            self._previews.popitem(last=False)
+
+    def digest_for_preview(self, size: int, preview_digest: str) -> str | None:
+        return self._previews.get((size, preview_digest))
+
+    def get(self, digest: str) -> CachedLogReport | None:
+        entry = self._entries.get(digest)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[digest]
+            entry = None
+        if entry is None:
+            return None
+        self._entries.move_to_end(digest)
+        return entry
+
+    def put(
+        self,
+        digest: str,
+        report: LogReport,
+        *,
+        embed: dict[str, Any] | None = None,
+        filename: str | None = None,
+    ) -> CachedLogReport:
+        entry = CachedLogReport(
+            report=report,
+            embed=embed,
+            filename=filename,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._entries[digest] = entry
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        return entry
+
+    async def lookup(self, digest: str) -> CachedLogReport | None:
+        """Return the cached entry for *digest*, falling back to Postgres when enabled."""
+        entry = self.get(digest)
+        if entry is not None:
+            self.stats.hits += 1
+            return entry
+
+        if self.persist:
+            try:
+                report = await load_persisted_log_report(digest, max_age_seconds=self.ttl_seconds)
+            except Exception:
+                log.exception("Failed to load persisted log report %s", digest[:12])
+                report = None
+            if report is not None:
+                self.stats.hits += 1
+                self.stats.persistent_hits += 1
+                return self.put(digest, report)
+
+        self.stats.misses += 1
+        return None
+
+    async def store(
+        self,
+        digest: str,
+        report: LogReport,
+        *,
+        embed: dict[str, Any] | None = None,
+        filename: str | None = None,
+    ) -> None:
+        self.put(digest, report, embed=embed, filename=filename)
+        if not self.persist:
+            return
+        try:
+            await store_persisted_log_report(digest, report)
+        except Exception:
+            log.exception("Failed to persist log report %s", digest[:12])
+
+
+async def load_persisted_log_report(digest: str, *, max_age_seconds: int) -> LogReport | None:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            """
+            SELECT report
+            FROM log_report_cache
+            WHERE content_sha256 = $1
+              AND created_at > now() - make_interval(secs => $2)
+            """,
+            digest,
+            float(max_age_seconds),
+        )
+    if row is None:
+        return None
+    data = row["report"]
+    if isinstance(data, str):
+        data = json.loads(data)
+    return report_from_dict(data) if isinstance(data, dict) else None
+
+
+async def store_persisted_log_report(digest: str, report: LogReport) -> None:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO log_report_cache (content_sha256, report, created_at)
+            VALUES ($1, $2::jsonb, now())
+            ON CONFLICT (content_sha256)
+            DO UPDATE SET
+                report = EXCLUDED.report,
+                created_at = now()
+            """,
+            digest,
+            json.dumps(report_to_dict(report), ensure_ascii=False),
+        )
@@ -3,9 +3,9 @@ from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
-from bulmaai.config import load_settings
+from bulmaai.config import current_settings
 
-settings = load_settings()
+settings = current_settings()
 
 
 DEFAULT_MESSAGE_PRESETS: dict[str, Any] = {
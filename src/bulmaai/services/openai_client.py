@@ -4,6 +4,7 @@ import importlib.resources as pkg_resources
 import json
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any, Optional, TypedDict
 
 from openai import (
@@ -15,7 +16,12 @@ from openai import (
     RateLimitError,
 )
 
-from bulmaai.config import Settings, load_settings
+from bulmaai.config import Settings, current_settings
+from bulmaai.services.support_answer_cache import (
+    MAX_CACHEABLE_QUESTION_CHARS,
+    normalize_question,
+    support_answer_cache,
+)
 from bulmaai.services.support_traces import (
     SupportAITrace,
     get_support_session,
@@ -25,8 +31,18 @@ from bulmaai.services.support_traces import (
 from bulmaai.utils.language import detect_language_from_text
 from bulmaai.utils import tools_registry
 
-client = AsyncOpenAI(api_key=load_settings().openai_key)
+client = AsyncOpenAI(api_key=current_settings().openai_key)
 log = logging.getLogger(__name__)
+
+# Per-call limits for function tools the model requests in one turn.
+TOOL_CALL_TIMEOUT_SECONDS = 20
+TOOL_CALL_CONCURRENCY = 4
+# Tool rounds per reply before the agent stops calling tools and answers with what it has.
+MAX_TOOL_ROUNDS = 4
+# Stream events that carry the finished response object.
+_FINAL_STREAM_EVENTS = frozenset({"response.completed", "response.incomplete"})
+
+
 class ConversationMessage(TypedDict, total=False):
     role: str
     content: str
@@ -110,6 +126,20 @@ def _append_tool_output(
     )
 
 
+def _function_call_outputs(
+    function_calls: list[dict[str, Any]],
+    results: list[ToolCallResult],
+) -> list[dict[str, str]]:
+    return [
+        {
+            "type": "function_call_output",
+            "call_id": call["call_id"],
+            "output": json.dumps(result["output"], ensure_ascii=False),
+        }
+        for call, result in zip(function_calls, results)
+    ]
+
+
 def _latest_user_message(
     messages: list[ConversationMessage],
     *,
@@ -128,6 +158,31 @@ def _latest_user_message(
     return None
 
 
+def _standalone_question(
+    messages: list[ConversationMessage],
+    *,
+    target_speaker_id: str,
+) -> str | None:
+    """The requester's question when it is the whole conversation, else None.
+
+    Only such questions can share an answer with other users; anything with
+    earlier turns or other speakers depends on its context.
+    """
+    if any(message.get("role") == "assistant" for message in messages):
+        return None
+    user_messages = [
+        message
+        for message in messages
+        if message.get("role") == "user" and (message.get("content") or "").strip()
+    ]
+    if len(user_messages) != 1 or user_messages[0].get("speaker_id") != target_speaker_id:
+        return None
+    question = user_messages[0]["content"].strip()
+    if len(question) > MAX_CACHEABLE_QUESTION_CHARS or not normalize_question(question):
+        return None
+    return question
+
+
 def _load_system_prompt(lang: str) -> str:
     filename = "support_system_en.txt"
     try:
@@ -151,6 +206,7 @@ def _extract_function_calls(response: Any) -> list[dict[str, Any]]:
             {
                 "name": item.name,
                 "arguments": getattr(item, "arguments", "{}"),
+                "call_id": getattr(item, "call_id", None),
             }
         )
     return calls
@@ -182,6 +238,55 @@ def _hydrate_tool_args(
     return dict(args)
 
 
+def _parse_tool_args(raw_args: Any) -> dict[str, Any]:
+    try:
+        args = json.loads(raw_args) if isinstance(raw_args, str) else raw_args
+    except json.JSONDecodeError:
+        args = {}
+    return args if isinstance(args, dict) else {}
+
+
+async def _run_tool_call(
+    call: dict[str, Any],
+    *,
+    semaphore: asyncio.Semaphore,
+    lang: str,
+    user_id: int,
+    channel_id: int,
+    bot: Any = None,
+) -> ToolCallResult:
+    """Run one function call; failures and timeouts become an ``{"error": ...}`` output."""
+    name = call["name"]
+    args = _hydrate_tool_args(
+        name=name,
+        args=_parse_tool_args(call["arguments"]),
+        lang=lang,
+        user_id=user_id,
+        channel_id=channel_id,
+    )
+    try:
+        func = tools_registry.get_func(name, bot_context=bot)
+        async with semaphore:
+            output = await asyncio.wait_for(func(**args), timeout=TOOL_CALL_TIMEOUT_SECONDS)
+    except asyncio.CancelledError:
+        raise
+    except asyncio.TimeoutError:
+        log.warning(
+            "Support tool %s timed out",
+            name,
+            extra={"event": "support_tool_timeout", "tool": name, "channel_id": channel_id},
+        )
+        output = {"error": f"Tool {name} timed out after {TOOL_CALL_TIMEOUT_SECONDS} seconds."}
+    except Exception as error:
+        log.exception(
+            "Support tool %s failed",
+            name,
+            extra={"event": "support_tool_failed", "tool": name, "channel_id": channel_id},
+        )
+        output = {"error": f"Tool {name} failed: {type(error).__name__}"}
+    return ToolCallResult(name=name, arguments=args, output=output)
+
+
 def _select_reasoning_effort(settings: Any, *, high_confidence: bool = False) -> str:
     default_effort = getattr(settings, "openai_support_reasoning_effort", "medium")
     fast_effort = getattr(settings, "openai_support_fast_reasoning_effort", default_effort)
@@ -218,17 +323,101 @@ def _build_prompt_cache_key(*, model: str, tools: list[dict[str, Any]]) -> str:
     return f"support:{model}:{tool_signature}"
 
 
-async def _create_response(*, timeout_seconds: int, **kwargs: Any) -> Any:
-    return await asyncio.wait_for(
-        client.responses.create(**kwargs),
-        timeout=timeout_seconds,
-    )
+class _ReplyStream:
+    """Forwards output-text deltas to *on_text* and keeps the text it forwarded.
+
+    Every response of a tool loop streams into the same reply, so text from a
+    later round starts a new paragraph instead of running on from a preamble.
+    """
+
+    def __init__(self, on_text: Callable[[str], Awaitable[None]]) -> None:
+        self.on_text = on_text
+        self.first_token_at: float | None = None
+        self._parts: list[str] = []
+        self._new_round = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def start_round(self) -> None:
+        self._new_round = bool(self._parts)
+
+    async def push(self, delta: str) -> None:
+        if not delta:
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        if self._new_round:
+            self._new_round = False
+            delta = "\n\n" + delta
+        self._parts.append(delta)
+        await self.on_text(delta)
+
+
+async def _consume_response_stream(reply_stream: _ReplyStream, **kwargs: Any) -> Any:
+    reply_stream.start_round()
+    events = await client.responses.create(stream=True, **kwargs)
+    response = None
+    async for event in events:
+        event_type = getattr(event, "type", None)
+        if event_type == "response.output_text.delta":
+            await reply_stream.push(getattr(event, "delta", ""))
+        elif event_type in _FINAL_STREAM_EVENTS:
+            response = event.response
+        elif event_type == "response.failed":
+            error = getattr(getattr(event, "response", None), "error", None)
+            raise RuntimeError(f"OpenAI response failed: {getattr(error, 'message', error)}")
+        elif event_type == "error":
+            raise RuntimeError(f"OpenAI response stream error: {getattr(event, 'message', event)}")
+    if response is None:
+        raise RuntimeError("OpenAI response stream ended without a final response")
+    return response
+
+
+async def _create_response(
+    *,
+    timeout_seconds: int,
+    reply_stream: _ReplyStream | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Create a response; with *reply_stream*, stream it and forward text as it arrives.
+
+    Either way the finished response object is returned.
+    """
+    if reply_stream is None:
+        request = client.responses.create(**kwargs)
+    else:
+        request = _consume_response_stream(reply_stream, **kwargs)
+    return await asyncio.wait_for(request, timeout=timeout_seconds)
 
 
 async def _create_conversation() -> Any:
     return await client.conversations.create()
 
 
+async def _answer_cache_scope(settings: Any, *, model: str, language: str) -> str | None:
+    if not getattr(settings, "ai_support_answer_cache_enabled", False):
+        return None
+    version = await support_answer_cache.knowledge_version(
+        client,
+        list(getattr(settings, "openai_support_vector_store_ids", ()) or ()),
+    )
+    return f"{model}|{language}|{version}" if version else None
+
+
+async def _question_embedding(settings: Any, question: str) -> list[float] | None:
+    embedding_model = getattr(settings, "openai_support_answer_cache_embedding_model", None)
+    if not embedding_model:
+        return None
+    try:
+        response = await client.embeddings.create(model=embedding_model, input=normalize_question(question))
+        return list(response.data[0].embedding)
+    except Exception:
+        log.warning("Failed to embed support question for the answer cache", exc_info=True)
+        return None
+
+
 def is_transient_ai_error(error: BaseException) -> bool:
     if isinstance(error, (asyncio.TimeoutError, APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)):
         return True
@@ -323,8 +512,14 @@ async def run_support_agent(
     ticket_conversation: bool = False,
     bot: Any = None,
     settings: Settings | None = None,
+    on_text_delta: Callable[[str], Awaitable[None]] | None = None,
 ) -> AgentResult:
-    runtime_settings = settings or load_settings()
+    """Answer the latest support message, running any requested tools.
+
+    With *on_text_delta*, replies are streamed and each output-text delta is
+    passed to it as it arrives; the returned result is the same either way.
+    """
+    runtime_settings = settings or current_settings()
     model = model_override or runtime_settings.openai_support_model or runtime_settings.openai_model
     target_speaker_id = str(user_id)
     last_user = _latest_user_message(messages, target_speaker_id=target_speaker_id)
@@ -335,6 +530,34 @@ async def run_support_agent(
     else:
         language = "en"
 
+    started_at = time.perf_counter()
+    question = _standalone_question(messages, target_speaker_id=target_speaker_id)
+    cache_scope = (
+        await _answer_cache_scope(runtime_settings, model=model, language=language)
+        if question is not None
+        else None
+    )
+    question_embedding: list[float] | None = None
+    if cache_scope is not None:
+        question_embedding = await _question_embedding(runtime_settings, question)
+        hit = support_answer_cache.get(cache_scope, question, embedding=question_embedding)
+        if hit is not None:
+            await _record_cached_answer_trace(
+                hit.reply,
+                answer_cache=hit.kind,
+                model=model,
+                language=language,
+                channel_id=channel_id,
+                user_id=user_id,
+                latency_ms=int((time.perf_counter() - started_at) * 1000),
+            )
+            return AgentResult(
+                reply=hit.reply,
+                language=language,
+                tool_results=[],
+                suggested_close=False,
+            )
+
     openai_conversation_id: str | None = None
     conversation_already_exists = False
     if ticket_conversation:
@@ -401,9 +624,10 @@ async def run_support_agent(
             "summary": "auto",
         }
 
-    started_at = time.perf_counter()
+    reply_stream = _ReplyStream(on_text_delta) if on_text_delta is not None else None
     response = await _create_response(
         timeout_seconds=runtime_settings.ai_support_timeout_seconds,
+        reply_stream=reply_stream,
         **request_kwargs,
     )
     result = await _handle_tools_and_final_reply(
@@ -417,6 +641,8 @@ async def run_support_agent(
         bot=bot,
         user_id=user_id,
         channel_id=channel_id,
+        tools=tools,
+        reply_stream=reply_stream,
         trace_context={
             "started_at": started_at,
             "workflow": "support_question",
@@ -431,6 +657,25 @@ async def run_support_agent(
             "previous_response_id": None,
         },
     )
+    # Only knowledge-backed answers that needed no tools are reused for other users.
+    if (
+        cache_scope is not None
+        and file_search_enabled
+        and not result["tool_results"]
+        and not result["suggested_close"]
+        and result["reply"] not in ("", "(no reply)")
+    ):
+        support_answer_cache.put(
+            cache_scope,
+            question,
+            result["reply"],
+            embedding=question_embedding,
+            requester_names=[
+                message["speaker_name"]
+                for message in messages
+                if message.get("speaker_id") == target_speaker_id and message.get("speaker_name")
+            ],
+        )
     if openai_conversation_id:
         try:
             await upsert_support_session(
@@ -450,6 +695,50 @@ async def run_support_agent(
     return result
 
 
+async def _record_cached_answer_trace(
+    reply: str,
+    *,
+    answer_cache: str,
+    model: str,
+    language: str,
+    channel_id: int,
+    user_id: int,
+    latency_ms: int,
+) -> None:
+    try:
+        await record_support_ai_trace(
+            SupportAITrace(
+                workflow="support_question",
+                response_id=None,
+                openai_conversation_id=None,
+                previous_response_id=None,
+                model=model,
+                language=language,
+                channel_id=channel_id,
+                user_id=user_id,
+                prompt_cache_key=None,
+                file_search_enabled=False,
+                vector_store_ids=[],
+                tool_names=[],
+                latency_ms=latency_ms,
+                input_tokens=None,
+                output_tokens=None,
+                total_tokens=None,
+                cached_tokens=None,
+                reasoning_tokens=None,
+                reply_text=reply,
+                input_json=[],
+                request_metadata={},
+                answer_cache=answer_cache,
+            )
+        )
+    except Exception:
+        log.exception(
+            "Failed to record OpenAI support trace",
+            extra={"event": "support_trace_record_failed", "channel_id": channel_id},
+        )
+
+
 async def _handle_tools_and_final_reply(
     *,
     response: Any,
@@ -462,35 +751,49 @@ async def _handle_tools_and_final_reply(
     user_id: int,
     channel_id: int,
     bot: Any = None,
+    tools: list[dict[str, Any]] | None = None,
+    reply_stream: _ReplyStream | None = None,
     trace_context: dict[str, Any] | None = None,
 ) -> AgentResult:
+    """Run the tool calls *response* asks for, round after round, and build the final result.
+
+    Each follow-up sends only the new ``function_call_output`` items: inside
+    the ticket conversation when there is one, otherwise chained to the
+    previous response with ``previous_response_id``. Unstored responses
+    cannot be chained, so the full input is resent instead. At most
+    ``MAX_TOOL_ROUNDS`` rounds run.
+    """
     tool_results: list[ToolCallResult] = list(base_tool_results or [])
+    openai_conversation_id = (trace_context or {}).get("openai_conversation_id")
+    store = bool(getattr(settings, "openai_support_store_responses", True))
+    stateless_input = list(base_input)
+    semaphore = asyncio.Semaphore(TOOL_CALL_CONCURRENCY)
+    rounds = 0
     function_calls = _extract_function_calls(response)
 
-    if function_calls:
-        followup_input = list(base_input)
-        for call in function_calls:
-            name = call["name"]
-            raw_args = call["arguments"]
-            try:
-                args = json.loads(raw_args) if isinstance(raw_args, str) else raw_args
-            except json.JSONDecodeError:
-                args = {}
-            if not isinstance(args, dict):
-                args = {}
-
-            args = _hydrate_tool_args(
-                name=name,
-                args=args,
-                lang=lang,
-                user_id=user_id,
-                channel_id=channel_id,
+    while function_calls:
+        if rounds >= MAX_TOOL_ROUNDS:
+            log.warning(
+                "Support agent hit the tool round limit",
+                extra={"event": "support_tool_round_limit", "channel_id": channel_id, "rounds": rounds},
             )
-
-            func = tools_registry.get_func(name, bot_context=bot)
-            output = await func(**args)
-            tool_results.append(ToolCallResult(name=name, arguments=args, output=output))
-            _append_tool_output(followup_input, name=name, output=output)
+            break
+        rounds += 1
+        call_results = await asyncio.gather(
+            *(
+                _run_tool_call(
+                    call,
+                    semaphore=semaphore,
+                    lang=lang,
+                    user_id=user_id,
+                    channel_id=channel_id,
+                    bot=bot,
+                )
+                for call in function_calls
+            )
+        )
+        # gather keeps call order, so tool outputs reach the model in the order it asked.
+        tool_results.extend(call_results)
 
         if any(
             isinstance(result.get("output"), dict)
@@ -507,7 +810,6 @@ async def _handle_tools_and_final_reply(
         followup_kwargs: dict[str, Any] = {
             "model": model,
             "instructions": system_prompt,
-            "input": followup_input,
             "max_output_tokens": settings.openai_support_max_output_tokens,
             "metadata": _build_openai_metadata(
                 workflow="support_tool_followup",
@@ -515,16 +817,32 @@ async def _handle_tools_and_final_reply(
                 channel_id=channel_id,
                 user_id=user_id,
                 file_search_enabled=bool((trace_context or {}).get("file_search_enabled")),
-                ticket_conversation=bool((trace_context or {}).get("openai_conversation_id")),
+                ticket_conversation=bool(openai_conversation_id),
             ),
             "prompt_cache_key": f"support:{model}:post-tool",
             "safety_identifier": _build_safety_identifier(user_id),
-            "store": bool(getattr(settings, "openai_support_store_responses", True)),
+            "store": store,
             "text": {"verbosity": "medium"},
         }
-        openai_conversation_id = (trace_context or {}).get("openai_conversation_id")
-        if openai_conversation_id:
+        previous_response_id = getattr(response, "id", None)
+        can_chain = all(call.get("call_id") for call in function_calls)
+        if can_chain and openai_conversation_id:
             followup_kwargs["conversation"] = openai_conversation_id
+            followup_kwargs["input"] = _function_call_outputs(function_calls, call_results)
+        elif can_chain and store and previous_response_id:
+            followup_kwargs["previous_response_id"] = previous_response_id
+            followup_kwargs["input"] = _function_call_outputs(function_calls, call_results)
+            if trace_context is not None:
+                trace_context = {**trace_context, "previous_response_id": previous_response_id}
+        else:
+            for call_result in call_results:
+                _append_tool_output(stateless_input, name=call_result["name"], output=call_result["output"])
+            followup_kwargs["input"] = list(stateless_input)
+            if openai_conversation_id:
+                followup_kwargs["conversation"] = openai_conversation_id
+        if tools:
+            followup_kwargs["tools"] = tools
+            followup_kwargs["tool_choice"] = "auto"
         if model.startswith("gpt-5"):
             followup_kwargs["reasoning"] = {
                 "effort": settings.openai_support_reasoning_effort,
@@ -532,10 +850,14 @@ async def _handle_tools_and_final_reply(
             }
         response = await _create_response(
             timeout_seconds=settings.ai_support_timeout_seconds,
+            reply_stream=reply_stream,
             **followup_kwargs,
         )
+        function_calls = _extract_function_calls(response)
 
-    reply_text = _extract_output_text(response) or "(no reply)"
+    # A streamed reply is recorded as posted, including text from earlier rounds.
+    streamed_text = reply_stream.text.strip() if reply_stream is not None else ""
+    reply_text = streamed_text or _extract_output_text(response) or "(no reply)"
     lowered = reply_text.lower()
     suggested_close = any(
         phrase in lowered
@@ -550,6 +872,11 @@ async def _handle_tools_and_final_reply(
     if trace_context is not None:
         usage = _extract_response_usage(response)
         latency_ms = int((time.perf_counter() - trace_context["started_at"]) * 1000)
+        first_token_ms = (
+            int((reply_stream.first_token_at - trace_context["started_at"]) * 1000)
+            if reply_stream is not None and reply_stream.first_token_at is not None
+            else None
+        )
         try:
             await record_support_ai_trace(
                 SupportAITrace(
@@ -569,6 +896,7 @@ async def _handle_tools_and_final_reply(
                         tool_results,
                     ),
                     latency_ms=latency_ms,
+                    first_token_ms=first_token_ms,
                     input_tokens=usage["input_tokens"],
                     output_tokens=usage["output_tokens"],
                     total_tokens=usage["total_tokens"],
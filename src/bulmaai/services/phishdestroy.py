@@ -92,6 +92,9 @@ class PhishDestroyClient:
                     params={"domain": domain},
                     headers={"User-Agent": "BulmaAI Discord moderation"},
                     timeout=self.timeout_seconds,
+                    # 429/5xx mark the API down below; retries would hold the message past its budget.
+                    retries=0,
+                    max_retry_wait=0,
                 )
             except Exception as error:
                 raise PhishDestroyUnavailable(str(error)) from error
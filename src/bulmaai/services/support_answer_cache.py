@@ -0,0 +1,223 @@
+import hashlib
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 6 * 3600
+# How long a knowledge-base fingerprint is trusted before the vector stores are re-read.
+KNOWLEDGE_VERSION_REFRESH_SECONDS = 600
+# Cosine similarity a paraphrase needs to reuse another question's answer.
+SEMANTIC_HIT_THRESHOLD = 0.92
+# Long messages are usually specific (logs, setups) rather than a repeated FAQ.
+MAX_CACHEABLE_QUESTION_CHARS = 400
+
+_MENTION_RE = re.compile(r"<[@#][!&]?\d+>")
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+_SPACE_BEFORE_PUNCTUATION_RE = re.compile(r"[ \t]+([,.!?;:])")
+_LEADING_PUNCTUATION_RE = re.compile(r"^[ \t]*[,;:][ \t]*", re.MULTILINE)
+_DANGLING_PUNCTUATION_RE = re.compile(r"[,;:]+(?=[,.!?;:])")
+_REPEATED_SPACES_RE = re.compile(r"[ \t]{2,}")
+# Shorter names are too likely to be ordinary words.
+MIN_SCRUBBED_NAME_CHARS = 3
+
+
+def normalize_question(text: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a support question."""
+    text = _MENTION_RE.sub(" ", text).casefold()
+    return " ".join(_PUNCTUATION_RE.sub(" ", text).split())
+
+
+def scrub_requester(reply: str, names: Iterable[str] = ()) -> str:
+    """*reply* without Discord mentions or the requester's *names*, so any user can be shown it."""
+    text = _MENTION_RE.sub("", reply)
+    for name in sorted({name.strip() for name in names}, key=len, reverse=True):
+        if len(name) >= MIN_SCRUBBED_NAME_CHARS:
+            text = re.sub(rf"(?<!\w){re.escape(name)}(?!\w)", "", text, flags=re.IGNORECASE)
+    text = _SPACE_BEFORE_PUNCTUATION_RE.sub(r"\1", text)
+    text = _DANGLING_PUNCTUATION_RE.sub("", text)
+    text = _LEADING_PUNCTUATION_RE.sub("", text)
+    return _REPEATED_SPACES_RE.sub(" ", text).strip()
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
+
+
+@dataclass
+class CachedAnswer:
+    reply: str
+    embedding: tuple[float, ...] | None = None
+    expires_at: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class AnswerCacheHit:
+    reply: str
+    kind: str  # "exact" or "semantic"
+    similarity: float = 1.0
+
+
+@dataclass
+class SupportAnswerCacheStats:
+    hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SupportAnswerCache:
+    """LRU + TTL cache of model-generated support replies.
+
+    Replies are not reviewed by staff: callers only store knowledge-backed
+    answers to standalone questions, and stored replies are scrubbed of the
+    requester's name and mentions.
+
+    Entries are keyed by a *scope* (model, language and knowledge-base
+    version) plus the normalized question. A lookup matches the exact
+    question first; when an embedding is given, it then falls back to the
+    most similar question in the same scope above ``SEMANTIC_HIT_THRESHOLD``.
+    A new knowledge-base version drops every entry.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = max(1, int(ttl_seconds))
+        self.stats = SupportAnswerCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], CachedAnswer] = OrderedDict()
+        self._versions: dict[tuple[str, ...], tuple[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        scope: str,
+        question: str,
+        *,
+        embedding: Sequence[float] | None = None,
+    ) -> AnswerCacheHit | None:
+        now = self._clock()
+        key = (scope, normalize_question(question))
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > now:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return AnswerCacheHit(reply=entry.reply, kind="exact")
+
+        if embedding is not None:
+            best_key, best_similarity = None, 0.0
+            for other_key, other in self._entries.items():
+                if other_key[0] != scope or other.embedding is None or other.expires_at <= now:
+                    continue
+                similarity = _cosine(embedding, other.embedding)
+                if similarity > best_similarity:
+                    best_key, best_similarity = other_key, similarity
+            if best_key is not None and best_similarity >= SEMANTIC_HIT_THRESHOLD:
+                self._entries.move_to_end(best_key)
+                self.stats.hits += 1
+                self.stats.semantic_hits += 1
+                return AnswerCacheHit(
+                    reply=self._entries[best_key].reply,
+                    kind="semantic",
+                    similarity=best_similarity,
+                )
+
+        self.stats.misses += 1
+        return None
+
+    def put(
+        self,
+        scope: str,
+        question: str,
+        reply: str,
+        *,
+        embedding: Sequence[float] | None = None,
+        requester_names: Iterable[str] = (),
+    ) -> None:
+        key = (scope, normalize_question(question))
+        self._entries[key] = CachedAnswer(
+            reply=scrub_requester(reply, requester_names),
+            embedding=tuple(embedding) if embedding is not None else None,
+            expires_at=self._clock() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        self.stats.invalidations += 1
+
+    async def knowledge_version(self, openai_client: Any, vector_store_ids: Sequence[str]) -> str | None:
+        """Fingerprint of the vector stores' files, re-read every ``KNOWLEDGE_VERSION_REFRESH_SECONDS``.
+
+        Built from each file's ID and creation time: OpenAI files are
+        immutable, so any edit to the knowledge base shows up as a new file.
+        Returns None when there is no knowledge base or it cannot be read;
+        such answers are not cached. A changed fingerprint invalidates the cache.
+        """
+        ids = tuple(sorted(vector_store_id for vector_store_id in vector_store_ids if vector_store_id))
+        if not ids:
+            return None
+        now = self._clock()
+        known = self._versions.get(ids)
+        if known is not None and now - known[1] < KNOWLEDGE_VERSION_REFRESH_SECONDS:
+            return known[0]
+
+        parts = []
+        try:
+            for vector_store_id in ids:
+                async for store_file in openai_client.vector_stores.files.list(
+                    vector_store_id=vector_store_id,
+                    limit=100,
+                ):
+                    parts.append(
+                        ":".join(
+                            str(value)
+                            for value in (
+                                vector_store_id,
+                                getattr(store_file, "id", None),
+                                getattr(store_file, "created_at", None),
+                                getattr(store_file, "status", None),
+                            )
+                        )
+                    )
+        except Exception:
+            log.warning("Could not read support vector stores for the answer cache", exc_info=True)
+            return None
+
+        parts.sort()
+        version = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+        if known is not None and known[0] != version:
+            log.info(
+                "Support knowledge base changed; clearing answer cache",
+                extra={"event": "support_answer_cache_invalidated", "entries": len(self._entries)},
+            )
+            self.invalidate()
+        self._versions[ids] = (version, now)
+        return version
+
+
+support_answer_cache = SupportAnswerCache()
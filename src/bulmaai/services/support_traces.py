@@ -37,6 +37,10 @@ class SupportAITrace:
     reply_text: str
     input_json: Any
     request_metadata: dict[str, Any]
+    # Time to the first streamed output-text delta; None for non-streamed replies.
+    first_token_ms: int | None = None
+    # "exact" or "semantic" when the answer cache replied instead of the model.
+    answer_cache: str | None = None
 
 
 async def get_support_session(
@@ -125,12 +129,14 @@ async def record_support_ai_trace(
                 reply_text,
                 input_json,
                 request_metadata,
+                first_token_ms,
+                answer_cache,
                 created_at
             )
             VALUES (
                 $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
                 $11, $12, $13, $14, $15, $16, $17, $18,
-                $19, $20::jsonb, $21::jsonb, now()
+                $19, $20::jsonb, $21::jsonb, $22, $23, now()
             )
             """,
             trace.workflow,
@@ -154,6 +160,8 @@ async def record_support_ai_trace(
             trace.reply_text,
             json.dumps(trace.input_json, ensure_ascii=False),
             json.dumps(trace.request_metadata, ensure_ascii=False, sort_keys=True),
+            trace.first_token_ms,
+            trace.answer_cache,
         )
 
 
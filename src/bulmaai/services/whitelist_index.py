@@ -0,0 +1,138 @@
+import time
+from collections.abc import Callable, Iterable
+
+WHITELIST_INDEX_TTL_SECONDS = 60.0
+
+
+def _key(nickname: str) -> str:
+    # Minecraft usernames are case-insensitive.
+    return nickname.strip().casefold()
+
+
+class WhitelistIndex:
+    """Case-normalized, editable view of the whitelist file at one commit.
+
+    Membership checks are O(1). Edits touch only the affected lines and keep
+    everything else (order, blank lines, spacing) as it was, so the rendered
+    text diffs minimally against the original.
+    """
+
+    def __init__(self, text: str, *, sha: str | None = None) -> None:
+        self.sha = sha
+        self._lines = text.splitlines()
+        self._counts: dict[str, int] = {}
+        for line in self._lines:
+            if line.strip():
+                self._count(_key(line), 1)
+
+    def _count(self, key: str, delta: int) -> None:
+        count = self._counts.get(key, 0) + delta
+        if count > 0:
+            self._counts[key] = count
+        else:
+            self._counts.pop(key, None)
+
+    def __contains__(self, nickname: object) -> bool:
+        return isinstance(nickname, str) and _key(nickname) in self._counts
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    def copy(self) -> "WhitelistIndex":
+        clone = WhitelistIndex.__new__(WhitelistIndex)
+        clone.sha = self.sha
+        clone._lines = list(self._lines)
+        clone._counts = dict(self._counts)
+        return clone
+
+    def add(self, nickname: str) -> bool:
+        if nickname in self:
+            return False
+        self._lines.append(nickname.strip())
+        self._count(_key(nickname), 1)
+        return True
+
+    def remove(self, nicknames: Iterable[str]) -> bool:
+        keys = {_key(nickname) for nickname in nicknames} & self._counts.keys()
+        if not keys:
+            return False
+        self._lines = [line for line in self._lines if _key(line) not in keys or not line.strip()]
+        for key in keys:
+            self._counts.pop(key, None)
+        return True
+
+    def replace(self, old_nickname: str, new_nickname: str) -> bool:
+        """Swap *old_nickname* for *new_nickname* in place.
+
+        Appends *new_nickname* when *old_nickname* is absent; returns False
+        when the file already reflects the change.
+        """
+        old_key = _key(old_nickname)
+        new_key = _key(new_nickname)
+        if old_key not in self._counts:
+            return self.add(new_nickname)
+        if old_key == new_key:
+            # Case-only rename: rewrite the matching lines with the new spelling.
+            renamed = [
+                new_nickname.strip() if line.strip() and _key(line) == old_key else line
+                for line in self._lines
+            ]
+            changed = renamed != self._lines
+            self._lines = renamed
+            return changed
+
+        keep_new = new_key not in self._counts
+        lines: list[str] = []
+        for line in self._lines:
+            if line.strip() and _key(line) == old_key:
+                if keep_new:
+                    lines.append(new_nickname.strip())
+                    keep_new = False
+                continue
+            lines.append(line)
+        self._lines = lines
+        self._counts.pop(old_key, None)
+        self._counts.setdefault(new_key, 1)
+        return True
+
+    def text(self) -> str:
+        if not self._counts:
+            return ""
+        return "\n".join(self._lines) + "\n"
+
+
+class WhitelistIndexCache:
+    """Process-wide :class:`WhitelistIndex` of the base branch, rebuilt only when its SHA changes.
+
+    A recently checked index is served without any GitHub request; after
+    ``ttl_seconds`` the file is re-read (a cheap conditional GET) and only
+    re-parsed if the blob SHA moved.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = WHITELIST_INDEX_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._clock = clock
+        self._index: WhitelistIndex | None = None
+        self._checked_at = 0.0
+
+    async def get(self, gh) -> WhitelistIndex:
+        now = self._clock()
+        if self._index is not None and now - self._checked_at < self.ttl_seconds:
+            return self._index
+        text, sha = await gh.get_whitelist_file(ref=gh.base_branch)
+        return self.remember(text, sha)
+
+    def remember(self, text: str, sha: str | None) -> WhitelistIndex:
+        """Index *text* at *sha*, reusing the current index if the SHA is unchanged."""
+        if self._index is None or sha is None or self._index.sha != sha:
+            self._index = WhitelistIndex(text, sha=sha)
+        self._checked_at = self._clock()
+        return self._index
+
+    def invalidate(self) -> None:
+        self._index = None
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+
+from requests import HTTPError
+
+from bulmaai.services.whitelist_index import WhitelistIndex, WhitelistIndexCache
+
+log = logging.getLogger(__name__)
+
+WHITELIST_BATCH_MAX_CHANGES = 50
+WHITELIST_BATCH_BRANCH_PREFIX = "patreon/whitelist-batch"
+# GitHub answers 405/409 when branch protection or a conflict blocks the merge.
+RECOVERABLE_MERGE_STATUSES = frozenset({405, 409})
+
+
+class WhitelistChangeKind(StrEnum):
+    ADD = "add"
+    UPDATE = "update"
+    REMOVE = "remove"
+
+
+@dataclass(frozen=True, slots=True)
+class WhitelistChange:
+    kind: WhitelistChangeKind
+    nicknames: tuple[str, ...]
+    summary: str
+    detail: str
+    old_nickname: str | None = None
+
+    @classmethod
+    def add(cls, nickname: str, *, summary: str, detail: str) -> "WhitelistChange":
+        return cls(WhitelistChangeKind.ADD, (nickname,), summary, detail)
+
+    @classmethod
+    def update(cls, old_nickname: str, new_nickname: str, *, summary: str, detail: str) -> "WhitelistChange":
+        return cls(WhitelistChangeKind.UPDATE, (new_nickname,), summary, detail, old_nickname=old_nickname)
+
+    @classmethod
+    def remove(cls, nicknames: list[str] | tuple[str, ...], *, summary: str, detail: str) -> "WhitelistChange":
+        return cls(WhitelistChangeKind.REMOVE, tuple(nicknames), summary, detail)
+
+
+@dataclass(frozen=True, slots=True)
+class WhitelistChangeResult:
+    """Outcome of one queued change.
+
+    ``changed`` is false when the whitelist already matched the request. A
+    changed result always carries the batch PR; ``merged`` is false when
+    GitHub refused the merge with ``merge_status`` and staff must finish it.
+    """
+
+    changed: bool
+    pr_number: int | None = None
+    pr_url: str | None = None
+    merged: bool = False
+    merge_status: int | None = None
+
+
+UNCHANGED = WhitelistChangeResult(changed=False)
+
+
+def _apply_change(index: WhitelistIndex, change: WhitelistChange) -> bool:
+    """Apply *change* to *index* in place; return whether anything changed."""
+    if change.kind == WhitelistChangeKind.ADD:
+        return index.add(change.nicknames[0])
+    if change.kind == WhitelistChangeKind.UPDATE:
+        return index.replace(change.old_nickname or "", change.nicknames[0])
+    return index.remove(change.nicknames)
+
+
+def _merge_error_status(exc: HTTPError) -> int | None:
+    status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    return int(status_code) if isinstance(status_code, int) else None
+
+
+class WhitelistChangeQueue:
+    """Coalesces whitelist adds, updates and removes into one commit and PR.
+
+    Changes submitted within ``window_seconds`` of each other are applied to
+    the base whitelist in submission order, committed on a fresh branch and
+    merged as a single PR. Each submitter gets its own result. Batches run one
+    at a time, so consecutive batches never conflict with each other.
+    """
+
+    def __init__(
+        self,
+        gh,
+        *,
+        window_seconds: float,
+        max_batch: int = WHITELIST_BATCH_MAX_CHANGES,
+        index: WhitelistIndexCache | None = None,
+    ) -> None:
+        self.gh = gh
+        self.index = index if index is not None else WhitelistIndexCache()
+        self.window_seconds = max(0.0, float(window_seconds))
+        self.max_batch = max(1, int(max_batch))
+        self._pending: list[tuple[WhitelistChange, asyncio.Future]] = []
+        self._flusher: asyncio.Task | None = None
+        self._batches = 0
+
+    async def submit(self, change: WhitelistChange) -> WhitelistChangeResult:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((change, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.window_seconds)
+            batch = self._pending[: self.max_batch]
+            del self._pending[: self.max_batch]
+            outcomes = await self._apply(batch)
+            for (_change, future), outcome in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+    async def _apply(
+        self,
+        batch: list[tuple[WhitelistChange, asyncio.Future]],
+    ) -> list[WhitelistChangeResult | BaseException]:
+        changes = [change for change, _future in batch]
+        self._batches += 1
+        branch = f"{WHITELIST_BATCH_BRANCH_PREFIX}-{int(time.time())}-{self._batches}"
+        try:
+            snapshot = await self.gh.get_whitelist_snapshot(branch)
+        except Exception as exc:
+            log.exception("Failed to read whitelist for batch", extra={"event": "patreon_whitelist_batch_failed"})
+            return [exc] * len(changes)
+
+        whitelist = self.index.remember(snapshot.base_text, snapshot.base_blob_oid).copy()
+        applied = [_apply_change(whitelist, change) for change in changes]
+        effective = [change for change, changed in zip(changes, applied) if changed]
+        if not effective:
+            return [UNCHANGED] * len(changes)
+
+        title = (
+            effective[0].summary
+            if len(effective) == 1
+            else f"Update Patreon beta whitelist ({len(effective)} changes)"
+        )
+        try:
+            pr_data = await self.gh.commit_whitelist_and_open_pr(
+                snapshot,
+                new_text=whitelist.text(),
+                message=title,
+                title=title,
+                body="\n".join(f"- {change.detail}" for change in effective),
+            )
+            result = await self._merge(pr_data, branch, len(effective))
+        except Exception as exc:
+            self.index.invalidate()
+            log.exception(
+                "Failed to submit whitelist batch",
+                extra={"event": "patreon_whitelist_batch_failed", "branch": branch, "changes": len(effective)},
+            )
+            return [exc if changed else UNCHANGED for changed in applied]
+
+        if result.merged:
+            self.index.invalidate()
+        log.info(
+            "Submitted whitelist batch",
+            extra={
+                "event": "patreon_whitelist_batch_submitted",
+                "branch": branch,
+                "changes": len(effective),
+                "pr_number": result.pr_number,
+                "merged": result.merged,
+            },
+        )
+        return [result if changed else UNCHANGED for changed in applied]
+
+    async def _merge(self, pr_data: dict, branch: str, change_count: int) -> WhitelistChangeResult:
+        pr_number = pr_data["number"]
+        pr_url = pr_data["html_url"]
+        try:
+            await self.gh.merge_pr(pr_number)
+        except HTTPError as exc:
+            status = _merge_error_status(exc)
+            if status not in RECOVERABLE_MERGE_STATUSES:
+                raise
+            current_pr = await self.gh.get_pr(pr_number)
+            if not current_pr.get("merged"):
+                return WhitelistChangeResult(
+                    changed=True,
+                    pr_number=pr_number,
+                    pr_url=pr_url,
+                    merged=False,
+                    merge_status=status,
+                )
+        else:
+            await self.gh.add_pr_comment(
+                pr_number,
+                f"Automatically merged {change_count} Patreon whitelist change(s).",
+            )
+        await self.gh.remove_branch(branch)
+        return WhitelistChangeResult(changed=True, pr_number=pr_number, pr_url=pr_url, merged=True)
@@ -0,0 +1,108 @@
+import importlib.resources as pkg_resources
+import json
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from bulmaai.utils.log_parser import LogReport
+
+
+log = logging.getLogger(__name__)
+
+SIGNATURES_PACKAGE = "bulmaai.configs"
+SIGNATURES_FILENAME = "crash_signatures.json"
+
+
+@dataclass(frozen=True)
+class CrashSignature:
+    id: str
+    cause: str
+    fix: str
+    patterns: tuple[str, ...]
+
+
+class CrashSignatureIndex:
+    """All signature patterns compiled into one case-insensitive matcher.
+
+    Patterns are plain literals. They are joined longest-first into a single
+    alternation inside a lookahead, so one scan of the text finds the longest
+    pattern starting at every offset. Each pattern is also credited with every
+    shorter pattern it contains, so overlapping signatures are not shadowed.
+    """
+
+    def __init__(self, signatures: Iterable[CrashSignature]) -> None:
+        self.signatures = tuple(signatures)
+        owners: dict[str, set[int]] = {}
+        for position, signature in enumerate(self.signatures):
+            for pattern in signature.patterns:
+                literal = pattern.lower()
+                if literal:
+                    owners.setdefault(literal, set()).add(position)
+
+        self._owners: dict[str, tuple[int, ...]] = {
+            literal: tuple(
+                sorted(set().union(*(owners[other] for other in owners if other in literal)))
+            )
+            for literal in owners
+        }
+        self._matcher: re.Pattern[str] | None = None
+        if owners:
+            alternation = "|".join(re.escape(literal) for literal in sorted(owners, key=len, reverse=True))
+            self._matcher = re.compile(f"(?=({alternation}))")
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def match(self, text: str) -> list[CrashSignature]:
+        """Return the signatures found in *text*, in database order."""
+        if self._matcher is None or not text:
+            return []
+        hits: set[int] = set()
+        for found in self._matcher.finditer(text.lower()):
+            hits.update(self._owners[found.group(1)])
+            if len(hits) == len(self.signatures):
+                break
+        return [self.signatures[position] for position in sorted(hits)]
+
+    def match_report(self, report: LogReport) -> list[CrashSignature]:
+        """Match against the error lines and stacktrace of *report*."""
+        return self.match("\n".join([*report.errors, report.stacktrace or ""]))
+
+
+def signatures_from_dict(data: dict[str, Any]) -> list[CrashSignature]:
+    signatures: list[CrashSignature] = []
+    seen: set[str] = set()
+    for entry in data.get("signatures", []):
+        signature_id = str(entry.get("id") or "").strip()
+        patterns = tuple(str(p) for p in entry.get("patterns", []) if str(p).strip())
+        if not signature_id or not patterns:
+            raise ValueError(f"crash signature {signature_id or '?'} needs an id and at least one pattern")
+        if signature_id in seen:
+            raise ValueError(f"duplicate crash signature id {signature_id}")
+        seen.add(signature_id)
+        signatures.append(
+            CrashSignature(
+                id=signature_id,
+                cause=str(entry.get("cause") or "").strip(),
+                fix=str(entry.get("fix") or "").strip(),
+                patterns=patterns,
+            )
+        )
+    return signatures
+
+
+@lru_cache(maxsize=1)
+def default_crash_signature_index() -> CrashSignatureIndex:
+    """Load and compile the bundled signature database once per process."""
+    try:
+        with pkg_resources.files(SIGNATURES_PACKAGE).joinpath(SIGNATURES_FILENAME).open(
+            "r", encoding="utf-8"
+        ) as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        log.warning("Crash signature database %s not found", SIGNATURES_FILENAME)
+        return CrashSignatureIndex([])
+    return CrashSignatureIndex(signatures_from_dict(data))
@@ -1,4 +1,6 @@
+import codecs
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 
 # ── Java version ─────────────────────────────────────────────────────────────
@@ -56,8 +58,10 @@ _RE_MOD_DISCOVERY = re.compile(
 # 1. Crash Report Table (found in crash-*.txt files)
 # Format: Filename | Name | Mod ID | Version | Status | Manifest
 # Example: xenon.jar | Xenon | xenon | 0.3.31 | DONE | ...
+# The first two columns are plain [^|]+: wrapping them in \s* as well lets
+# the quantifiers trade whitespace and backtrack polynomially on long lines.
 _RE_MOD_CRASH_REPORT_TABLE = re.compile(
-    r"^\s*[^|]+\s*\|\s*[^|]+\s*\|\s*([a-z0-9_\-]+)\s*\|\s*([0-9][\w.\-+]+)",
+    r"^[^|]+\|[^|]+\|\s*([a-z0-9_\-]+)\s*\|\s*([0-9][\w.\-+]+)",
     re.MULTILINE | re.IGNORECASE,
 )
 
@@ -69,8 +73,10 @@ _RE_MOD_LOG_TABLE = re.compile(
 )
 
 # 3. "Mod ID: 'modid', ... Version: 'x.x.x'" style
+# The gap before "Version:" is bounded: an unbounded .*? rescans the rest of
+# the line from every "Loading"/"Mod ID:" that has no Version after it.
 _RE_MOD_ENTRY = re.compile(
-    r"(?:Mod ID:\s*'?|Loading\s+)([a-z_][a-z0-9_]*)'?.*?Version:\s*'?([^'\";\n]+)",
+    r"(?:Mod ID:\s*'?|Loading\s+)([a-z_][a-z0-9_]*)'?.{0,256}?Version:\s*'?([^'\";\n]+)",
     re.IGNORECASE,
 )
 
@@ -109,7 +115,7 @@ _RE_STACKTRACE_START = re.compile(
 _RE_OS = re.compile(r"Operating System:\s*(.+)", re.IGNORECASE)
 # ModLauncher startup line: "... java version 17.0.3 by Microsoft; OS Windows 10 arch amd64 ..."
 _RE_OS_ALT = re.compile(
-    r";\s*OS\s+(.+?)\s+arch",
+    r";\s*OS\s+(.{1,128}?)\s+arch",
     re.IGNORECASE,
 )
 _RE_MEMORY = re.compile(r"Memory:\s*(.+)", re.IGNORECASE)
@@ -133,149 +139,313 @@ class LogReport:
     is_forge: bool = False
 
 
-def parse_log(text: str) -> LogReport:
-    """Parse a Minecraft Forge latest.log OR crash report."""
-    report = LogReport()
-
-    # ── Java version ──────────────────────────────────────────────────────────
-    for pat in (_RE_JAVA_VERSION, _RE_JAVA_VERSION_ALT, _RE_JAVA_VERSION_PROP):
-        m = pat.search(text)
-        if m:
-            report.java_version = m.group(1).strip()
-            break
-
-    # ── Forge version ─────────────────────────────────────────────────────────
-    m = _RE_FORGE_VERSION.search(text)
-    if m:
-        report.forge_version = m.group(1).strip()
-    else:
-        m = _RE_FORGE_VERSION_ALT.search(text)
-        if m:
-            report.forge_version = m.group(1).strip()
-
-    # ── MC version ────────────────────────────────────────────────────────────
-    m = _RE_MC_VERSION.search(text)
-    if m:
-        report.mc_version = m.group(1).strip()
-    else:
-        m = _RE_MC_VERSION_ALT.search(text)
-        if m:
-            report.mc_version = m.group(1).strip()
-
-    # ── Forge detection ───────────────────────────────────────────────────────
-    if _RE_MODLOADER.search(text):
-        report.is_forge = True
-    # If it's a crash report with "Forge" mentioned in the stacktrace or headers
-    if "forge" in text.lower() and "minecraft crash report" in text.lower():
-        report.is_forge = True
-
-    # ── OS ────────────────────────────────────────────────────────────────────
-    m = _RE_OS.search(text)
-    if m:
-        report.operating_system = m.group(1).strip()
-    else:
-        m = _RE_OS_ALT.search(text)
-        if m:
-            report.operating_system = m.group(1).strip()
-
-    # ── Memory ────────────────────────────────────────────────────────────────
-    m = _RE_MEMORY.search(text)
-    if m:
-        report.memory = m.group(1).strip()
-
-    # ── Mods ──────────────────────────────────────────────────────────────────
-    # 1. Primary: Forge LOADING debug discovery lines (most reliable in latest.log)
-    for m in _RE_MOD_DISCOVERY.finditer(text):
-        mod_id = m.group(1).strip().lower()
-        version = m.group(2).strip()
-        report.mods[mod_id] = version
-
-    # 2. Crash Report Table (found in crash-*.txt files)
-    # Captures 3rd column (Mod ID) and 4th column (Version)
-    for m in _RE_MOD_CRASH_REPORT_TABLE.finditer(text):
-        mod_id = m.group(1).strip().lower()
-        version = m.group(2).strip()
-        if mod_id not in report.mods and mod_id not in ("mod id", "modid"):
-            report.mods[mod_id] = version
-
-    # 3. Log Table (found in latest.log, usually starts with |)
-    for m in _RE_MOD_LOG_TABLE.finditer(text):
-        mod_id = m.group(1).strip().lower()
-        version = m.group(2).strip()
-        if mod_id not in report.mods:
-            report.mods[mod_id] = version
-
-    # 4. "Mod ID: / Loading " style
-    for m in _RE_MOD_ENTRY.finditer(text):
-        mod_id = m.group(1).strip().lower()
-        version = m.group(2).strip()
-        if mod_id not in report.mods:
-            report.mods[mod_id] = version
-
-    # 5. Simple indented list
-    for m in _RE_MOD_SIMPLE.finditer(text):
-        mod_id = m.group(1).strip().lower()
-        version = m.group(2).strip()
-        if mod_id not in report.mods:
-            report.mods[mod_id] = version
-
-    # ── DragonMineZ version ───────────────────────────────────────────────────
-    dmz = report.mods.get("dragonminez")
-    if dmz:
-        report.dragonminez_version = dmz
-    else:
-        m = _RE_DRAGONMINEZ_VERSION.search(text)
-        if m:
-            report.dragonminez_version = m.group(1).strip()
-
-    # ── Errors & stacktrace ───────────────────────────────────────────────────
-    lines = text.splitlines()
-    error_lines: list[str] = []
-    trace_lines: list[str] = []
-    in_trace = False
-    consecutive_blanks = 0
+# ── Single-pass engine ───────────────────────────────────────────────────────
+# Header fields: (LogReport attribute, candidates in priority order). Each
+# candidate pairs lower-case literals that any regex hit must contain with the
+# regex itself, so most lines are rejected by a cheap substring check. A field
+# stops being scanned once its top-priority candidate has matched.
+_HEADER_RULES: tuple[tuple[str, tuple[tuple[tuple[str, ...], re.Pattern[str]], ...]], ...] = (
+    ("java_version", (
+        (("java version",), _RE_JAVA_VERSION),
+        (("java version:",), _RE_JAVA_VERSION_ALT),
+        (("java.version",), _RE_JAVA_VERSION_PROP),
+    )),
+    ("forge_version", (
+        (("forge mod loading", "minecraftforge"), _RE_FORGE_VERSION),
+        (("--fml.forgeversion",), _RE_FORGE_VERSION_ALT),
+    )),
+    ("mc_version", (
+        (("for mc",), _RE_MC_VERSION),
+        (("--fml.mcversion",), _RE_MC_VERSION_ALT),
+    )),
+    ("operating_system", (
+        (("operating system:",), _RE_OS),
+        (("arch",), _RE_OS_ALT),
+    )),
+    ("memory", (
+        (("memory:",), _RE_MEMORY),
+    )),
+)
 
-    # CRASH REPORT SPECIAL: If the file starts with "---- Minecraft Crash Report",
-    # the entire top section (Description + Stacktrace) is the error.
-    is_crash_report = "---- Minecraft Crash Report ----" in text
+_CRASH_REPORT_HEADER = "---- Minecraft Crash Report ----"
+MAX_ERROR_LINES = 15
+# Longer lines are cut before matching. This bounds memory while a huge
+# newline-free chunk is buffered, and keeps regex work per line bounded.
+MAX_LINE_CHARS = 64 * 1024
+# Bytes read per chunk by parse_log_file() and when splitting a bytes input.
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class _LogParseEngine:
+    """Line-at-a-time parser state behind :func:`parse_log`.
+
+    Every line is visited once and dispatched to the extractors that can still
+    change the result: header fields drop out once resolved, and errors and
+    the stacktrace stop collecting once they hit their report limits.
+    """
+
+    def __init__(self) -> None:
+        # attribute -> (priority rank, value); rank 0 means final.
+        self._header: dict[str, tuple[int, str]] = {}
+        self._pending_header = list(_HEADER_RULES)
+        self._is_forge = False
+        self._saw_forge = False
+        self._saw_crash_banner = False
+        self._dmz_fallback: str | None = None
+
+        # One dict per mod source so precedence can be applied in finish().
+        self._discovered_mods: dict[str, str] = {}
+        self._crash_table_mods: dict[str, str] = {}
+        self._log_table_mods: dict[str, str] = {}
+        self._entry_mods: dict[str, str] = {}
+        self._simple_mods: dict[str, str] = {}
+
+        self._is_crash_report = False
+        self._errors: list[str] = []
+        self._trace: list[str] = []
+        self._trace_len = 0
+        self._in_trace = False
+        self._blanks = 0
+
+    # ── Feeding ───────────────────────────────────────────────────────────────
+
+    def feed(self, line: str) -> None:
+        if len(line) > MAX_LINE_CHARS:
+            line = line[:MAX_LINE_CHARS]
+        if line.endswith("\r"):
+            line = line[:-1]
+        lower = line.lower()
+
+        if self._pending_header:
+            self._scan_header(line, lower)
+        self._scan_flags(line, lower)
+        self._scan_mods(line, lower)
+        self._scan_errors(line)
+
+    def _scan_header(self, line: str, lower: str) -> None:
+        still_pending = []
+        for attr, candidates in self._pending_header:
+            best = self._header.get(attr)
+            limit = best[0] if best else len(candidates)
+            for rank, (literals, pattern) in enumerate(candidates[:limit]):
+                if not any(lit in lower for lit in literals):
+                    continue
+                m = pattern.search(line)
+                if m:
+                    best = (rank, m.group(1).strip())
+                    self._header[attr] = best
+                    break
+            if best is None or best[0] != 0:
+                still_pending.append((attr, candidates))
+        self._pending_header = still_pending
+
+    def _scan_flags(self, line: str, lower: str) -> None:
+        if not self._is_forge:
+            if "modlauncher running" in lower and _RE_MODLOADER.search(line):
+                self._is_forge = True
+            else:
+                self._saw_forge = self._saw_forge or "forge" in lower
+                self._saw_crash_banner = self._saw_crash_banner or "minecraft crash report" in lower
+                if self._saw_forge and self._saw_crash_banner:
+                    self._is_forge = True
+
+        if self._dmz_fallback is None and "dragonminez" in lower:
+            m = _RE_DRAGONMINEZ_VERSION.search(line)
+            if m:
+                self._dmz_fallback = m.group(1).strip()
+
+        if not self._is_crash_report and _CRASH_REPORT_HEADER in line:
+            self._is_crash_report = True
+
+    def _scan_mods(self, line: str, lower: str) -> None:
+        # 1. Forge LOADING discovery lines (later lines win, like the old dict update)
+        if "found valid mod file" in lower:
+            for m in _RE_MOD_DISCOVERY.finditer(line):
+                self._discovered_mods[m.group(1).strip().lower()] = m.group(2).strip()
+
+        if "|" in line:
+            # 2. Crash report table
+            m = _RE_MOD_CRASH_REPORT_TABLE.match(line)
+            if m:
+                mod_id = m.group(1).strip().lower()
+                if mod_id not in ("mod id", "modid"):
+                    self._crash_table_mods.setdefault(mod_id, m.group(2).strip())
+            # 3. Forge log table
+            m = _RE_MOD_LOG_TABLE.match(line)
+            if m:
+                self._log_table_mods.setdefault(m.group(1).strip().lower(), m.group(2).strip())
+
+        # 4. "Mod ID: / Loading " style
+        if "version:" in lower and ("mod id:" in lower or "loading" in lower):
+            for m in _RE_MOD_ENTRY.finditer(line):
+                self._entry_mods.setdefault(m.group(1).strip().lower(), m.group(2).strip())
+
+        # 5. Simple indented list
+        if line[:2].isspace() and len(line) >= 2:
+            m = _RE_MOD_SIMPLE.match(line)
+            if m:
+                self._simple_mods.setdefault(m.group(1).strip().lower(), m.group(2).strip())
+
+    def _scan_errors(self, line: str) -> None:
+        trace_full = self._trace_len > MAX_STACKTRACE_LEN
+        if trace_full and len(self._errors) >= MAX_ERROR_LINES:
+            return
 
-    for line in lines:
         # Standard log error line
-        if _RE_ERROR_LINE.match(line):
-            error_lines.append(line.strip())
-            in_trace = True
-            consecutive_blanks = 0
-            trace_lines.append(line.strip())
-            continue
-
-        # Crash report "Description" line
-        if is_crash_report and line.strip().startswith("Description:"):
-            error_lines.append(line.strip())
-            # Start collecting trace immediately after description in crash reports
-            in_trace = True
-            continue
-
-        if _RE_STACKTRACE_START.search(line):
-            in_trace = True
-            consecutive_blanks = 0
-
-        if in_trace:
+        if line.startswith("[") and ("/ERROR]" in line or "/FATAL]" in line) and _RE_ERROR_LINE.match(line):
             stripped = line.strip()
+            self._add_error(stripped)
+            self._in_trace = True
+            self._blanks = 0
+            self._add_trace(stripped)
+            return
+
+        stripped = line.strip()
+
+        # Crash report "Description" line; the trace starts right after it.
+        if self._is_crash_report and stripped.startswith("Description:"):
+            self._add_error(stripped)
+            self._in_trace = True
+            return
+
+        if not self._in_trace and trace_full:
+            return
+
+        if (
+            ("Exception" in line or "Error" in line or "Caused by:" in line or "--- " in line)
+            and _RE_STACKTRACE_START.search(line)
+        ):
+            self._in_trace = True
+            self._blanks = 0
+
+        if self._in_trace:
             if stripped:
-                consecutive_blanks = 0
-                trace_lines.append(stripped)
+                self._blanks = 0
+                self._add_trace(stripped)
             else:
-                consecutive_blanks += 1
-                if consecutive_blanks >= 2:
-                    in_trace = False
-                    consecutive_blanks = 0
-
-    report.errors = error_lines[:15]
+                self._blanks += 1
+                if self._blanks >= 2:
+                    self._in_trace = False
+                    self._blanks = 0
+
+    def _add_error(self, line: str) -> None:
+        if len(self._errors) < MAX_ERROR_LINES:
+            self._errors.append(line)
+
+    def _add_trace(self, line: str) -> None:
+        # Only the first MAX_STACKTRACE_LEN characters are ever reported.
+        if self._trace_len <= MAX_STACKTRACE_LEN:
+            self._trace.append(line)
+            self._trace_len += len(line) + (1 if len(self._trace) > 1 else 0)
+
+    # ── Result ────────────────────────────────────────────────────────────────
+
+    def finish(self) -> LogReport:
+        report = LogReport()
+        for attr, (_, value) in self._header.items():
+            setattr(report, attr, value)
+        report.is_forge = self._is_forge
+
+        mods = dict(self._discovered_mods)
+        for source in (self._crash_table_mods, self._log_table_mods, self._entry_mods, self._simple_mods):
+            for mod_id, version in source.items():
+                mods.setdefault(mod_id, version)
+        report.mods = mods
+
+        report.dragonminez_version = mods.get("dragonminez") or self._dmz_fallback
+
+        report.errors = list(self._errors)
+        if self._trace:
+            full_trace = "\n".join(self._trace)
+            if len(full_trace) > MAX_STACKTRACE_LEN:
+                full_trace = full_trace[:MAX_STACKTRACE_LEN] + "\n... (truncated)"
+            report.stacktrace = full_trace
+        return report
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _iter_chunk_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode UTF-8 *chunks* incrementally and yield complete lines.
+
+    Only the unfinished last line is buffered between chunks. Once it grows past
+    MAX_LINE_CHARS, its prefix is yielded and the rest is dropped up to the
+    next newline.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    overflowed = False
+
+    def split(piece: str) -> Iterator[str]:
+        nonlocal tail, overflowed
+        if overflowed:
+            newline = piece.find("\n")
+            if newline == -1:
+                return
+            piece = piece[newline + 1:]
+            overflowed = False
+        start = 0
+        while True:
+            end = piece.find("\n", start)
+            if end == -1:
+                break
+            if start == 0 and tail:
+                yield tail + piece[:end]
+                tail = ""
+            else:
+                yield piece[start:end]
+            start = end + 1
+        tail += piece[start:]
+        if len(tail) > MAX_LINE_CHARS:
+            yield tail[:MAX_LINE_CHARS]
+            tail = ""
+            overflowed = True
+
+    for chunk in chunks:
+        if chunk:
+            yield from split(decoder.decode(chunk))
+    yield from split(decoder.decode(b"", final=True))
+    if tail:
+        yield tail
+
+
+def _iter_byte_chunks(data: bytes | bytearray | memoryview) -> Iterator[bytes]:
+    view = memoryview(data)
+    for start in range(0, len(view), READ_CHUNK_SIZE):
+        yield bytes(view[start:start + READ_CHUNK_SIZE])
+
+
+def parse_log(source: str | bytes | Iterable[bytes]) -> LogReport:
+    """Parse a Minecraft Forge latest.log OR crash report in a single pass.
+
+    *source* is either the decoded text, the raw bytes, or an iterable of
+    byte chunks (e.g. an attachment stream or an open file). Bytes are decoded
+    as UTF-8 incrementally, so memory stays bounded by the chunk size and the
+    report limits rather than the size of the log.
+    """
+    engine = _LogParseEngine()
+    if isinstance(source, str):
+        lines = _iter_lines(source)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        lines = _iter_chunk_lines(_iter_byte_chunks(source))
+    else:
+        lines = _iter_chunk_lines(source)
+    for line in lines:
+        engine.feed(line)
+    return engine.finish()
 
-    if trace_lines:
-        full_trace = "\n".join(trace_lines)
-        if len(full_trace) > MAX_STACKTRACE_LEN:
-            full_trace = full_trace[:MAX_STACKTRACE_LEN] + "\n... (truncated)"
-        report.stacktrace = full_trace
 
-    return report
+def parse_log_file(path: str, *, chunk_size: int = READ_CHUNK_SIZE) -> LogReport:
+    """Parse the log stored at *path*, reading it *chunk_size* bytes at a time."""
+    with open(path, "rb") as file:
+        return parse_log(iter(lambda: file.read(chunk_size), b""))
@@ -0,0 +1,243 @@
+import importlib.resources as pkg_resources
+import json
+import logging
+import operator
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from bulmaai.utils.log_parser import LogReport
+
+
+log = logging.getLogger(__name__)
+
+COMPATIBILITY_PACKAGE = "bulmaai.configs"
+COMPATIBILITY_FILENAME = "mod_compatibility.json"
+
+Version = tuple[int, ...]
+
+# The leading dotted number of a version string: "47.2.0", "17.0.8_372", "4.4.7-beta".
+_RE_VERSION = re.compile(r"\d+(?:[._]\d+)*")
+_RE_CLAUSE = re.compile(r"^\s*(>=|<=|==|!=|>|<)?\s*([\w.+-]+)\s*$")
+
+_OPERATORS: dict[str, Callable[[Version, Version], bool]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
+def parse_version(text: str | None) -> Version | None:
+    """Return the numeric components of *text*, or None if it has none."""
+    if not text:
+        return None
+    found = _RE_VERSION.search(text)
+    if found is None:
+        return None
+    parts = [int(part) for part in re.split(r"[._]", found.group(0))]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+@dataclass(frozen=True)
+class VersionRange:
+    """A comma-separated list of ``op version`` clauses, all of which must hold."""
+
+    text: str
+    clauses: tuple[tuple[Callable[[Version, Version], bool], Version], ...] = ()
+
+    @classmethod
+    def parse(cls, text: str) -> "VersionRange":
+        text = (text or "*").strip()
+        if text == "*":
+            return cls(text)
+        clauses = []
+        for raw in text.split(","):
+            found = _RE_CLAUSE.match(raw)
+            bound = parse_version(found.group(2)) if found else None
+            if found is None or bound is None:
+                raise ValueError(f"invalid version range {text!r}")
+            clauses.append((_OPERATORS[found.group(1) or "=="], bound))
+        return cls(text, tuple(clauses))
+
+    def contains(self, version: Version) -> bool:
+        # Versions are zero-trimmed, so 1.20 == 1.20.0.
+        return all(compare(version, bound) for compare, bound in self.clauses)
+
+    def __str__(self) -> str:
+        return self.text
+
+
+@dataclass(frozen=True)
+class ReleaseRequirements:
+    dragonminez: VersionRange
+    minecraft: VersionRange | None = None
+    forge: VersionRange | None = None
+    java: VersionRange | None = None
+    mods: tuple[tuple[str, VersionRange], ...] = ()
+
+
+@dataclass(frozen=True)
+class Incompatibility:
+    mods: tuple[tuple[str, VersionRange], ...]
+    reason: str
+
+
+@dataclass(frozen=True)
+class CompatibilityIssue:
+    severity: str  # "error" or "warning"
+    message: str
+    mod_ids: tuple[str, ...] = ()
+
+
+def _check_range(version: Version | None, allowed: VersionRange) -> bool | None:
+    """True/False for a known version, None when it could not be parsed."""
+    if not allowed.clauses:
+        return True
+    if version is None:
+        return None
+    return allowed.contains(version)
+
+
+class ModCompatibilityIndex:
+    """Precomputed lookups over the compatibility database.
+
+    Incompatibility rules are indexed by every mod ID they mention, so a
+    report is checked by looking up only the mods it actually contains rather
+    than scanning every rule for every mod.
+    """
+
+    def __init__(
+        self,
+        releases: Iterable[ReleaseRequirements] = (),
+        incompatibilities: Iterable[Incompatibility] = (),
+    ) -> None:
+        self.releases = tuple(releases)
+        self.incompatibilities = tuple(incompatibilities)
+        self._rules_by_mod: dict[str, list[int]] = {}
+        for position, rule in enumerate(self.incompatibilities):
+            for mod_id, _ in rule.mods:
+                self._rules_by_mod.setdefault(mod_id, []).append(position)
+
+    def release_for(self, dragonminez_version: str | None) -> ReleaseRequirements | None:
+        version = parse_version(dragonminez_version)
+        if version is None:
+            return None
+        for release in self.releases:
+            if release.dragonminez.contains(version):
+                return release
+        return None
+
+    def check(self, report: LogReport) -> list[CompatibilityIssue]:
+        mods = {mod_id.lower(): version for mod_id, version in report.mods.items()}
+        versions: dict[str, Version | None] = {}
+
+        def mod_version(mod_id: str) -> Version | None:
+            if mod_id not in versions:
+                versions[mod_id] = parse_version(mods.get(mod_id))
+            return versions[mod_id]
+
+        issues: list[CompatibilityIssue] = []
+        candidates = sorted({p for mod_id in mods for p in self._rules_by_mod.get(mod_id, ())})
+        for position in candidates:
+            rule = self.incompatibilities[position]
+            if all(
+                mod_id in mods and _check_range(mod_version(mod_id), allowed) is True
+                for mod_id, allowed in rule.mods
+            ):
+                ids = tuple(mod_id for mod_id, _ in rule.mods)
+                issues.append(CompatibilityIssue("error", rule.reason, ids))
+
+        release = self.release_for(report.dragonminez_version)
+        if release is None:
+            return issues
+
+        platform = (
+            ("Minecraft", report.mc_version, release.minecraft),
+            ("Forge", report.forge_version, release.forge),
+            ("Java", report.java_version, release.java),
+        )
+        for label, actual, allowed in platform:
+            if allowed is not None and actual and _check_range(parse_version(actual), allowed) is False:
+                issues.append(
+                    CompatibilityIssue(
+                        "error",
+                        f"DragonMineZ {report.dragonminez_version} needs {label} {allowed}, found {actual}.",
+                    )
+                )
+
+        # Without a parsed mod list (truncated logs, crash reports without a mod
+        # table) absence proves nothing, so dependencies are only checked when
+        # the list was read and includes DragonMineZ itself.
+        if not mods or "dragonminez" not in mods:
+            return issues
+        for mod_id, allowed in release.mods:
+            in_range = _check_range(mod_version(mod_id), allowed) if mod_id in mods else None
+            if in_range is None:
+                # Forge lists mods that failed to load with versions like "[MISSING]".
+                issues.append(
+                    CompatibilityIssue(
+                        "error",
+                        f"DragonMineZ {report.dragonminez_version} requires `{mod_id}` {allowed}, which is not installed.",
+                        (mod_id,),
+                    )
+                )
+            elif in_range is False:
+                issues.append(
+                    CompatibilityIssue(
+                        "warning",
+                        f"`{mod_id}` {mods[mod_id]} is outside the supported range {allowed}.",
+                        (mod_id,),
+                    )
+                )
+        return issues
+
+
+def _optional_range(value: Any) -> VersionRange | None:
+    return VersionRange.parse(str(value)) if value else None
+
+
+def _mod_ranges(value: Any) -> tuple[tuple[str, VersionRange], ...]:
+    if not isinstance(value, dict):
+        raise ValueError("mods must be an object of mod id -> version range")
+    return tuple((str(mod_id).lower(), VersionRange.parse(str(spec))) for mod_id, spec in value.items())
+
+
+def compatibility_from_dict(data: dict[str, Any]) -> ModCompatibilityIndex:
+    releases = [
+        ReleaseRequirements(
+            dragonminez=VersionRange.parse(str(entry["dragonminez"])),
+            minecraft=_optional_range(entry.get("minecraft")),
+            forge=_optional_range(entry.get("forge")),
+            java=_optional_range(entry.get("java")),
+            mods=_mod_ranges(entry.get("mods", {})),
+        )
+        for entry in data.get("releases", [])
+    ]
+    incompatibilities = []
+    for entry in data.get("incompatible", []):
+        mods = _mod_ranges(entry.get("mods"))
+        if not mods:
+            raise ValueError("incompatibility rule needs at least one mod")
+        incompatibilities.append(Incompatibility(mods=mods, reason=str(entry.get("reason") or "").strip()))
+    return ModCompatibilityIndex(releases, incompatibilities)
+
+
+@lru_cache(maxsize=1)
+def default_mod_compatibility_index() -> ModCompatibilityIndex:
+    """Load and index the bundled compatibility database once per process."""
+    try:
+        with pkg_resources.files(COMPATIBILITY_PACKAGE).joinpath(COMPATIBILITY_FILENAME).open(
+            "r", encoding="utf-8"
+        ) as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        log.warning("Mod compatibility database %s not found", COMPATIBILITY_FILENAME)
+        return ModCompatibilityIndex()
+    return compatibility_from_dict(data)
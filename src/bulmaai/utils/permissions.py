@@ -2,7 +2,7 @@ from collections.abc import Sequence
 
 import discord
 
-from bulmaai.config import Settings, load_settings
+from bulmaai.config import Settings, current_settings
 
 
 def is_admin(member: discord.Member) -> bool:
@@ -15,7 +15,7 @@ def has_any_allowed_role(member: discord.Member, role_ids: Sequence[int]) -> boo
 
 
 def is_staff(member: discord.Member, *, settings: Settings | None = None) -> bool:
-    active_settings = settings or load_settings()
+    active_settings = settings or current_settings()
     staff_roles = set(active_settings.discord_staff_role_ids)
     for role in getattr(member, "roles", []):
         if role.id in staff_roles:
@@ -28,7 +28,7 @@ def has_patreon_access_role(
     *,
     settings: Settings | None = None,
 ) -> bool:
-    active_settings = settings or load_settings()
+    active_settings = settings or current_settings()
     return has_any_allowed_role(member, active_settings.patreon_access_role_ids)
 
 
@@ -41,7 +41,7 @@ def can_use_ai_support(
     *,
     settings: Settings | None = None,
 ) -> bool:
-    active_settings = settings or load_settings()
+    active_settings = settings or current_settings()
     return (
         is_bruno(member)
         or is_staff(member, settings=active_settings)
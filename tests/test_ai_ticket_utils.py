@@ -4,6 +4,8 @@ import unittest
 import asyncio
 from unittest.mock import AsyncMock, patch
 
+import discord
+
 
 os.environ.setdefault("DISCORD_TOKEN", "dummy-discord-token")
 os.environ.setdefault("OPENAI_KEY", "dummy-openai-key")
@@ -11,6 +13,7 @@ os.environ.setdefault("GH_APP_PRIVATE_KEY_PEM", "dummy-github-key")
 
 from bulmaai.cogs.ai_tickets import (
     AITicketsCog,
+    _StreamingReply,
     _beta_access_command_hint,
     _chunk_discord_message,
     _has_user_visible_tool_result,
@@ -112,6 +115,228 @@ class DiscordMessageChunkTests(unittest.TestCase):
         self.assertTrue(_is_pinging_bot(message, bot_user))
 
 
+class _Typing:
+    def __init__(self, channel: "_StreamChannel") -> None:
+        self.channel = channel
+
+    async def __aenter__(self) -> None:
+        self.channel.typing_active = True
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.channel.typing_active = False
+
+
+class _StreamChannel:
+    id = 456
+
+    def __init__(self, *, fail_after: int | None = None) -> None:
+        self.messages: list[types.SimpleNamespace] = []
+        self.deleted: list[str] = []
+        self.typing_active = False
+        self.typing_when_sent: list[bool] = []
+        self.fail_after = fail_after
+
+    def typing(self) -> _Typing:
+        return _Typing(self)
+
+    async def send(self, content: str, **kwargs):
+        if self.fail_after is not None and len(self.messages) >= self.fail_after:
+            raise discord.HTTPException(types.SimpleNamespace(status=500, reason="error"), "boom")
+        self.typing_when_sent.append(self.typing_active)
+        message = types.SimpleNamespace(content=content, edits=[])
+
+        async def edit(*, content: str, **kwargs) -> None:
+            message.content = content
+            message.edits.append(content)
+
+        async def delete() -> None:
+            self.deleted.append(message.content)
+
+        message.edit = edit
+        message.delete = delete
+        self.messages.append(message)
+        return message
+
+
+class StreamingReplyTests(unittest.IsolatedAsyncioTestCase):
+    async def test_posts_first_sentence_then_edits_at_throttled_sentence_boundaries(self) -> None:
+        now = [0.0]
+        channel = _StreamChannel()
+        reply = _StreamingReply(channel, clock=lambda: now[0])
+
+        await reply.push("  Open the")
+        self.assertEqual(channel.messages, [])
+        await reply.push(" config. Then set")
+        self.assertEqual([m.content for m in channel.messages], ["Open the config."])
+
+        await reply.push(" the key. And")
+        self.assertEqual(channel.messages[0].edits, [])
+        now[0] = 5.0
+        await reply.push(" restart. Done")
+        self.assertEqual(channel.messages[0].edits, ["Open the config. Then set the key. And restart."])
+
+        self.assertTrue(await reply.finish())
+        self.assertEqual(len(channel.messages), 1)
+        self.assertEqual(channel.messages[0].content, "Open the config. Then set the key. And restart. Done")
+
+    async def test_long_replies_continue_in_a_new_message(self) -> None:
+        channel = _StreamChannel()
+        reply = _StreamingReply(channel, clock=lambda: 100.0)
+
+        await reply.push("First sentence. ")
+        await reply.push("word " * 500)
+        await reply.finish()
+
+        self.assertGreater(len(channel.messages), 1)
+        self.assertTrue(all(len(m.content) <= 2000 for m in channel.messages))
+        self.assertEqual("".join(m.content for m in channel.messages), "First sentence. " + "word " * 500)
+
+    async def test_nothing_sent_reports_false(self) -> None:
+        reply = _StreamingReply(_StreamChannel())
+        await reply.push("   ")
+        self.assertFalse(await reply.finish())
+
+
+    async def test_typing_stops_once_the_first_sentence_is_posted(self) -> None:
+        channel = _StreamChannel()
+
+        async with _StreamingReply(channel) as reply:
+            self.assertTrue(channel.typing_active)
+            await reply.push("Open the config. ")
+            self.assertFalse(channel.typing_active)
+
+        self.assertEqual(channel.typing_when_sent, [False])
+
+    async def test_failed_stream_keeps_the_unsent_remainder(self) -> None:
+        channel = _StreamChannel(fail_after=1)
+        reply = _StreamingReply(channel, clock=lambda: 100.0)
+
+        await reply.push("First sentence. ")
+        await reply.push("word " * 500)
+        await reply.push("Last sentence.")
+
+        self.assertTrue(await reply.finish())
+        self.assertTrue(reply.failed)
+        posted = "".join(m.content for m in channel.messages)
+        self.assertEqual(
+            (posted + " " + reply.unsent).split(),
+            ("First sentence. " + "word " * 500 + "Last sentence.").split(),
+        )
+
+    async def test_discard_deletes_the_partial_reply(self) -> None:
+        channel = _StreamChannel()
+        reply = _StreamingReply(channel)
+        await reply.push("Open the config. Then")
+
+        await reply.discard()
+
+        self.assertEqual(channel.deleted, ["Open the config."])
+        self.assertFalse(await reply.finish())
+
+
+class StreamingSupportMessageTests(unittest.IsolatedAsyncioTestCase):
+    def _cog(self) -> AITicketsCog:
+        settings = types.SimpleNamespace(
+            ai_support_stream_replies=True,
+            openai_support_model="gpt-test",
+            openai_model="gpt-test",
+            ai_support_typing_lead_seconds=0,
+        )
+        cog = AITicketsCog(types.SimpleNamespace(settings=settings, user=None))
+        cog._can_use_support_from_message = AsyncMock(return_value=True)
+        cog._build_history = AsyncMock(return_value=[])
+        cog._extract_image_context = AsyncMock(return_value="")
+        return cog
+
+    def _message(self, channel: _StreamChannel) -> types.SimpleNamespace:
+        author = types.SimpleNamespace(id=1, name="user", mention="<@1>")
+        return types.SimpleNamespace(id=2, channel=channel, author=author, guild=None)
+
+    def _patches(self, run_support_agent):
+        return (
+            patch("bulmaai.cogs.ai_tickets._is_pinging_bot", return_value=True),
+            patch("bulmaai.cogs.ai_tickets._has_support_request_content", return_value=True),
+            patch("bulmaai.cogs.ai_tickets._message_support_intent", return_value=SUPPORT_INTENT_SUPPORT_QUESTION),
+            patch("bulmaai.cogs.ai_tickets.run_support_agent", side_effect=run_support_agent),
+        )
+
+    async def test_cancelled_request_deletes_its_partial_reply(self) -> None:
+        channel = _StreamChannel()
+        cog = self._cog()
+        posted = asyncio.Event()
+
+        async def run_support_agent(**kwargs):
+            await kwargs["on_text_delta"]("Open the config. ")
+            posted.set()
+            await asyncio.Event().wait()
+
+        patches = self._patches(run_support_agent)
+        with patches[0], patches[1], patches[2], patches[3]:
+            task = asyncio.create_task(cog._process_support_message(self._message(channel)))
+            await asyncio.wait_for(posted.wait(), timeout=1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.assertEqual(channel.deleted, ["Open the config."])
+        self.assertFalse(channel.typing_active)
+
+    async def test_agent_error_deletes_the_partial_reply(self) -> None:
+        channel = _StreamChannel()
+        cog = self._cog()
+
+        async def run_support_agent(**kwargs):
+            await kwargs["on_text_delta"]("Open the config. ")
+            raise RuntimeError("boom")
+
+        patches = self._patches(run_support_agent)
+        with patches[0], patches[1], patches[2], patches[3]:
+            await cog._process_support_message(self._message(channel))
+
+        self.assertEqual(channel.deleted, ["Open the config."])
+        self.assertIn("ran into an error", channel.messages[-1].content)
+
+    async def test_suppressed_reply_deletes_the_streamed_preamble(self) -> None:
+        channel = _StreamChannel()
+        cog = self._cog()
+
+        async def run_support_agent(**kwargs):
+            await kwargs["on_text_delta"]("Let me check that. ")
+            return {
+                "reply": "(no reply)",
+                "tool_results": [{"name": "tool", "output": {"suppress_ai_reply": True}}],
+                "suggested_close": False,
+            }
+
+        patches = self._patches(run_support_agent)
+        with patches[0], patches[1], patches[2], patches[3]:
+            await cog._process_support_message(self._message(channel))
+
+        self.assertEqual(channel.deleted, ["Let me check that."])
+        self.assertEqual(len(channel.messages), 1)
+
+    async def test_failed_stream_sends_the_rest_of_the_reply(self) -> None:
+        channel = _StreamChannel()
+        cog = self._cog()
+
+        async def run_support_agent(**kwargs):
+            await kwargs["on_text_delta"]("Open the config. ")
+            channel.fail_after = 1
+            await kwargs["on_text_delta"]("word " * 500)
+            channel.fail_after = None
+            return {"reply": "Open the config. " + "word " * 500, "tool_results": [], "suggested_close": False}
+
+        patches = self._patches(run_support_agent)
+        with patches[0], patches[1], patches[2], patches[3]:
+            await cog._process_support_message(self._message(channel))
+
+        self.assertEqual(len(channel.messages), 2)
+        self.assertEqual(
+            " ".join(m.content for m in channel.messages).split(),
+            ("Open the config. " + "word " * 500).split(),
+        )
+
+
 class ImageContextLatencyTests(unittest.IsolatedAsyncioTestCase):
     async def test_extracts_multiple_image_contexts_concurrently(self) -> None:
         asyncio.get_running_loop().slow_callback_duration = 10
@@ -0,0 +1,116 @@
+import hashlib
+import io
+import unittest
+
+from bulmaai.services.attachment_download import AttachmentDownloader, AttachmentTooLarge
+
+
+class _FakeContent:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._pos = 0
+
+    async def read(self, n: int) -> bytes:
+        chunk = self._data[self._pos : self._pos + n]
+        self._pos += len(chunk)
+        return chunk
+
+
+class _FakeResponse:
+    def __init__(self, data: bytes) -> None:
+        self.content = _FakeContent(data)
+        self.closed = False
+        self.released = False
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+    def release(self) -> None:
+        self.released = True
+
+
+class _FakeSession:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self.responses: list[_FakeResponse] = []
+
+    async def get(self, url: str) -> _FakeResponse:
+        response = _FakeResponse(self._data)
+        self.responses.append(response)
+        return response
+
+    async def close(self) -> None:
+        return None
+
+
+class AttachmentDownloaderTests(unittest.IsolatedAsyncioTestCase):
+    def _downloader(self, data: bytes, *, max_bytes: int = 10_000) -> tuple[AttachmentDownloader, _FakeSession]:
+        session = _FakeSession(data)
+        downloader = AttachmentDownloader(
+            max_bytes=max_bytes,
+            chunk_size=100,
+            session_factory=lambda: session,
+        )
+        return downloader, session
+
+    async def test_preview_only_stream_is_dropped_and_counts_saved_bytes(self) -> None:
+        data = b"x" * 5000
+        downloader, session = self._downloader(data)
+
+        async with downloader.stream("https://cdn.test/a.log", size=len(data)) as stream:
+            preview = await stream.read_preview(250)
+
+        self.assertEqual(preview, b"x" * 250)
+        self.assertTrue(session.responses[0].closed)
+        self.assertEqual(downloader.stats.bytes_downloaded, 300)
+        self.assertEqual(downloader.stats.bytes_saved, 4700)
+        self.assertEqual(downloader.stats.full_downloads, 0)
+
+    async def test_read_all_continues_the_same_stream_after_preview(self) -> None:
+        data = bytes(range(256)) * 20
+        downloader, session = self._downloader(data)
+
+        async with downloader.stream("https://cdn.test/latest.log", size=len(data)) as stream:
+            await stream.read_preview(250)
+            full = await stream.read_all()
+
+        self.assertEqual(full, data)
+        self.assertEqual(len(session.responses), 1)
+        self.assertTrue(session.responses[0].released)
+        self.assertEqual(downloader.stats.full_downloads, 1)
+        self.assertEqual(downloader.stats.bytes_saved, 0)
+
+    async def test_spool_writes_preview_and_rest_and_hashes_the_body(self) -> None:
+        data = bytes(range(256)) * 20
+        downloader, session = self._downloader(data)
+        out = io.BytesIO()
+
+        async with downloader.stream("https://cdn.test/latest.log", size=len(data)) as stream:
+            await stream.read_preview(250)
+            digest = await stream.spool(out)
+
+        self.assertEqual(out.getvalue(), data)
+        self.assertEqual(digest, hashlib.sha256(data).hexdigest())
+        self.assertTrue(session.responses[0].released)
+
+    async def test_small_file_completes_during_preview(self) -> None:
+        downloader, _ = self._downloader(b"tiny log")
+
+        async with downloader.stream("https://cdn.test/a.log", size=8) as stream:
+            preview = await stream.read_preview(250)
+            self.assertTrue(stream.complete)
+
+        self.assertEqual(preview, b"tiny log")
+
+    async def test_download_enforces_max_bytes(self) -> None:
+        downloader, _ = self._downloader(b"x" * 500, max_bytes=300)
+
+        with self.assertRaises(AttachmentTooLarge):
+            await downloader.download("https://cdn.test/huge.log", size=500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,25 @@
+import asyncio
 import os
 import unittest
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 
 os.environ.setdefault("DISCORD_TOKEN", "dummy-discord-token")
 os.environ.setdefault("OPENAI_KEY", "dummy-openai-key")
 os.environ.setdefault("GH_APP_PRIVATE_KEY_PEM", "dummy-github-key")
 
+from bulmaai.cogs.bug_reports import BugReportsCog
 from bulmaai.config import load_settings
 from bulmaai.services.bug_report_ai import DuplicateAssessment, _coerce_triage
+from bulmaai.services.bug_reports import BugReport
+from bulmaai.services.duplicate_candidates import (
+    build_queries,
+    component_labels,
+    index_terms,
+    rank_duplicate_candidates,
+    search_duplicate_candidates,
+)
 from bulmaai.ui.bug_report_views import apply_status, build_triage_embed
 
 
@@ -151,5 +162,170 @@ class BugTriageEmbedTests(unittest.TestCase):
         self.assertNotIn("already fixed", names)
 
 
+class _SearchService:
+    def __init__(self, results: dict[str, list[dict]], labels: list[dict]) -> None:
+        self.results = results
+        self.labels = labels
+        self.queries: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search_issues(self, text: str, *, per_page: int = 10) -> list[dict]:
+        self.queries.append(text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if text not in self.results:
+            raise RuntimeError("search failed")
+        return self.results[text]
+
+    async def get_labels(self) -> list[dict]:
+        return self.labels
+
+
+class DuplicateCandidateTests(unittest.IsolatedAsyncioTestCase):
+    REPORT = (
+        "Crash when charging ki blast\n\n"
+        "Game closes with java.lang.NullPointerException in KiBlastEntity, log says "
+        "`Ticking entity ki_blast`."
+    )
+
+    def test_queries_cover_title_and_error_strings(self) -> None:
+        self.assertEqual(
+            build_queries("Crash when charging ki blast", self.REPORT),
+            ["crash charging blast", '"NullPointerException"', '"Ticking entity ki_blast"'],
+        )
+
+    def test_component_labels_skip_generic_labels(self) -> None:
+        labels = [{"name": "bug"}, {"name": "ki blast"}, {"name": "transformations"}]
+        self.assertEqual(component_labels(labels, self.REPORT), ["ki blast"])
+
+    async def test_searches_run_concurrently_and_merge_hits(self) -> None:
+        shared = {"number": 4, "title": "NullPointerException charging ki blast"}
+        service = _SearchService(
+            {
+                "crash charging blast": [shared, {"number": 9, "title": "Charging crash", "pull_request": {}}],
+                '"NullPointerException"': [shared, {"number": 2, "title": "NPE in menu"}],
+                'label:"ki blast" crash charging blast': [{"number": 7, "title": "Ki blast too strong"}],
+            },
+            labels=[{"name": "ki blast"}],
+        )
+
+        candidates = await search_duplicate_candidates(
+            service,
+            title="Crash when charging ki blast",
+            report_text=self.REPORT,
+        )
+
+        self.assertEqual(len(service.queries), 4)
+        self.assertGreaterEqual(service.max_in_flight, 3)
+        self.assertEqual({c["number"] for c in candidates}, {2, 4, 7})
+        self.assertEqual(next(c for c in candidates if c["number"] == 4)["_query_hits"], 2)
+
+    def test_ranking_prefers_matching_errors_and_titles(self) -> None:
+        candidates = [
+            {"number": 1, "title": "Scouter HUD overlaps chat"},
+            {"number": 2, "title": "Ki blast crash", "body": "NullPointerException in KiBlastEntity"},
+            {"number": 3, "title": "Charging ki is slow"},
+        ]
+
+        ranked = rank_duplicate_candidates(self.REPORT, candidates, limit=2)
+
+        self.assertEqual([c["number"] for c in ranked], [2, 3])
+
+    def test_index_terms_lead_with_title_then_errors(self) -> None:
+        terms = index_terms("Crash when charging ki blast", self.REPORT)
+
+        self.assertEqual(terms[:4], ["crash", "charging", "blast", "nullpointerexception"])
+        self.assertIn("kiblastentity", terms)
+        self.assertEqual(len(terms), len(set(terms)))
+
+
+class DuplicateRetrievalTests(unittest.IsolatedAsyncioTestCase):
+    def _cog(self) -> BugReportsCog:
+        cog = BugReportsCog.__new__(BugReportsCog)
+        cog.settings = SimpleNamespace(bug_report_repo="dragonminez")
+        return cog
+
+    async def test_synced_mirror_answers_without_github_search(self) -> None:
+        local = AsyncMock(return_value=[{"number": 4, "title": "Ki blast crash", "_rank": 0.4}])
+        remote = AsyncMock()
+        with (
+            patch("bulmaai.cogs.bug_reports.shared_github_mirror.is_synced", AsyncMock(return_value=True)),
+            patch("bulmaai.services.duplicate_candidates.search_similar_github_items", local),
+            patch("bulmaai.cogs.bug_reports.search_duplicate_candidates", remote),
+        ):
+            candidates = await self._cog()._retrieve_duplicate_candidates("Ki blast crash", "It crashes")
+
+        self.assertEqual([c["number"] for c in candidates], [4])
+        self.assertEqual(local.await_args.args, ("dragonminez",))
+        self.assertEqual(local.await_args.kwargs["terms"][:2], ["blast", "crash"])
+        remote.assert_not_awaited()
+
+    async def test_unsynced_mirror_falls_back_to_github_search(self) -> None:
+        remote = AsyncMock(return_value=[{"number": 2}])
+        with (
+            patch("bulmaai.cogs.bug_reports.shared_github_mirror.is_synced", AsyncMock(return_value=False)),
+            patch("bulmaai.cogs.bug_reports._get_github_service", return_value=object()),
+            patch("bulmaai.cogs.bug_reports.search_duplicate_candidates", remote),
+        ):
+            candidates = await self._cog()._retrieve_duplicate_candidates("Ki blast crash", "It crashes")
+
+        self.assertEqual(candidates, [{"number": 2}])
+        remote.assert_awaited_once()
+
+
+class TrackedIssuePollTests(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    def _report(thread_id: int, issue_number: int, repo: str = "dragonminez") -> BugReport:
+        return BugReport(
+            thread_id=thread_id,
+            guild_id=1,
+            reporter_id=2,
+            triage_message_id=None,
+            repo=repo,
+            issue_number=issue_number,
+            status="tracked",
+            ai_title=None,
+            ai_summary=None,
+            created_at=None,
+            updated_at=None,
+        )
+
+    async def test_one_batched_read_per_repo_and_only_changed_threads_are_touched(self) -> None:
+        reports = [self._report(10, 1), self._report(11, 2), self._report(12, 3), self._report(13, 4, repo="other")]
+        services = {
+            "dragonminez": SimpleNamespace(
+                get_issue_states=AsyncMock(
+                    return_value={
+                        1: {"state": "open", "state_reason": None},
+                        2: {"state": "closed", "state_reason": "completed"},
+                        3: None,
+                    }
+                )
+            ),
+            "other": SimpleNamespace(
+                get_issue_states=AsyncMock(return_value={4: {"state": "closed", "state_reason": "not_planned"}})
+            ),
+        }
+        cog = BugReportsCog.__new__(BugReportsCog)
+        cog.settings = SimpleNamespace()
+        cog._resolve_report = AsyncMock()
+        set_status = AsyncMock()
+
+        with (
+            patch("bulmaai.cogs.bug_reports.list_tracked", AsyncMock(return_value=reports)),
+            patch("bulmaai.cogs.bug_reports._get_github_service", side_effect=lambda _settings, repo: services[repo]),
+            patch("bulmaai.cogs.bug_reports.set_status", set_status),
+        ):
+            await cog._poll_once()
+
+        services["dragonminez"].get_issue_states.assert_awaited_once_with([1, 2, 3])
+        services["other"].get_issue_states.assert_awaited_once_with([4])
+        cog._resolve_report.assert_awaited_once_with(reports[1])
+        self.assertEqual([call.args for call in set_status.await_args_list], [(12, "dismissed"), (13, "dismissed")])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 
@@ -7,7 +9,15 @@ os.environ.setdefault("DISCORD_TOKEN", "dummy-discord-token")
 os.environ.setdefault("OPENAI_KEY", "dummy-openai-key")
 os.environ.setdefault("GH_APP_PRIVATE_KEY_PEM", "dummy-github-key")
 
-from bulmaai.config import load_settings
+from bulmaai.bot import http_client_options
+from bulmaai.config import (
+    current_settings,
+    load_settings,
+    refresh_settings,
+    set_setting_override,
+    settings_snapshot,
+)
+from bulmaai.services import http
 
 
 class ConfigSettingsTests(unittest.TestCase):
@@ -16,6 +26,9 @@ class ConfigSettingsTests(unittest.TestCase):
             os.environ,
             {
                 "AI_SUPPORT_DEBOUNCE_SECONDS": "0",
+                "AI_SUPPORT_STREAM_REPLIES": "false",
+                "AI_SUPPORT_ANSWER_CACHE_ENABLED": "true",
+                "OPENAI_SUPPORT_ANSWER_CACHE_EMBEDDING_MODEL": "text-embedding-3-small",
                 "OPENAI_SUPPORT_FAST_REASONING_EFFORT": "low",
                 "OPENAI_SUPPORT_VECTOR_STORE_IDS": "vs_docs, vs_tickets",
                 "OPENAI_SUPPORT_FILE_SEARCH_MAX_RESULTS": "8",
@@ -29,6 +42,9 @@ class ConfigSettingsTests(unittest.TestCase):
             settings = load_settings(include_overrides=False)
 
         self.assertEqual(settings.ai_support_debounce_seconds, 0)
+        self.assertFalse(settings.ai_support_stream_replies)
+        self.assertTrue(settings.ai_support_answer_cache_enabled)
+        self.assertEqual(settings.openai_support_answer_cache_embedding_model, "text-embedding-3-small")
         self.assertEqual(settings.openai_support_fast_reasoning_effort, "low")
         self.assertEqual(settings.openai_support_vector_store_ids, ("vs_docs", "vs_tickets"))
         self.assertEqual(settings.openai_support_file_search_max_results, 8)
@@ -37,6 +53,13 @@ class ConfigSettingsTests(unittest.TestCase):
         self.assertEqual(settings.openai_faq_vector_store_id, "vs_faq")
         self.assertEqual(settings.openai_faq_generated_path, "data/knowledge/generated/faq.md")
 
+    def test_support_answer_cache_is_opt_in(self) -> None:
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("AI_SUPPORT_ANSWER_CACHE_ENABLED", None)
+            settings = load_settings(include_overrides=False)
+
+        self.assertFalse(settings.ai_support_answer_cache_enabled)
+
     def test_phishdestroy_settings_are_environment_configurable(self) -> None:
         with patch.dict(
             os.environ,
@@ -123,6 +146,7 @@ class ConfigSettingsTests(unittest.TestCase):
                 "PATREON_OAUTH_CLIENT_SECRET": "patreon-client-secret",
                 "PATREON_WEBHOOK_SECRET": "patreon-webhook-secret",
                 "PATREON_ELIGIBLE_TIER_IDS": "tier-contributor,tier-benefactor",
+                "WHITELIST_BATCH_WINDOW_SECONDS": "0.5",
             },
             clear=False,
         ):
@@ -132,6 +156,7 @@ class ConfigSettingsTests(unittest.TestCase):
         self.assertEqual(settings.patreon_oauth_client_secret, "patreon-client-secret")
         self.assertEqual(settings.patreon_webhook_secret, "patreon-webhook-secret")
         self.assertEqual(settings.patreon_eligible_tier_ids, ("tier-contributor", "tier-benefactor"))
+        self.assertEqual(settings.whitelist_batch_window_seconds, 0.5)
         self.assertEqual(
             settings.patreon_oauth_redirect_uri,
             "https://downloads.dragonminez.com/patreon/oauth/callback",
@@ -174,5 +199,98 @@ class ConfigSettingsTests(unittest.TestCase):
 
         self.assertEqual(settings.patreon_eligible_tier_ids, ("23999392", "23999460"))
 
+    def test_log_parser_pool_settings_are_environment_configurable(self) -> None:
+        with patch.dict(
+            os.environ,
+            {
+                "LOG_PARSER_WORKERS": "3",
+                "LOG_PARSER_QUEUE_SIZE": "0",
+                "LOG_PARSER_TIMEOUT_SECONDS": "12",
+            },
+            clear=False,
+        ):
+            settings = load_settings(include_overrides=False)
+
+        self.assertEqual(settings.log_parser_workers, 3)
+        self.assertEqual(settings.log_parser_queue_size, 0)
+        self.assertEqual(settings.log_parser_timeout_seconds, 12)
+
+    def test_http_client_settings_are_environment_configurable(self) -> None:
+        with patch.dict(
+            os.environ,
+            {
+                "HTTP_MAX_CONNECTIONS": "40",
+                "HTTP_MAX_CONNECTIONS_PER_HOST": "4",
+                "HTTP_KEEPALIVE_SECONDS": "0",
+                "HTTP_MAX_RETRIES": "0",
+                "HTTP_RATE_LIMIT_PER_SECOND": "2",
+            },
+            clear=False,
+        ):
+            settings = load_settings(include_overrides=False)
+
+        self.assertEqual(settings.http_max_connections, 40)
+        self.assertEqual(settings.http_max_connections_per_host, 4)
+        self.assertEqual(settings.http_keepalive_seconds, 0)
+        self.assertEqual(settings.http_timeout_seconds, 30)
+        self.assertEqual(settings.http_max_retries, 0)
+        self.assertEqual(settings.http_rate_limit_per_second, 2)
+        self.assertEqual(settings.http_rate_limit_burst, 20)
+
+    def test_http_client_settings_reach_the_shared_client(self) -> None:
+        with patch.dict(os.environ, {"HTTP_MAX_CONNECTIONS_PER_HOST": "4", "HTTP_MAX_RETRIES": "0"}, clear=False):
+            settings = load_settings(include_overrides=False)
+
+        with patch("bulmaai.services.http._client", None), patch("bulmaai.services.http._client_options", {}):
+            http.set_client_options(**http_client_options(settings))
+            client = http.get_client()
+
+        self.assertEqual(client.max_connections_per_host, 4)
+        self.assertEqual(client.max_retries, 0)
+        self.assertEqual(client.max_retry_wait_seconds, settings.http_max_retry_wait_seconds)
+        self.assertEqual(client.default_limits.rate_per_second, settings.http_rate_limit_per_second)
+
+
+class SettingsSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.overrides_path = Path(directory.name) / "settings_overrides.json"
+        for patcher in (
+            patch("bulmaai.config._settings_overrides_path", return_value=self.overrides_path),
+            patch("bulmaai.config._snapshot", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reads_are_served_from_one_snapshot(self) -> None:
+        first = current_settings()
+
+        with patch("bulmaai.config.load_settings") as load:
+            self.assertIs(current_settings(), first)
+            self.assertIs(refresh_settings(if_changed=True).settings, first)
+        load.assert_not_called()
+        self.assertEqual(settings_snapshot().version, 1)
+
+    def test_override_swaps_in_a_new_version(self) -> None:
+        before = settings_snapshot()
+
+        set_setting_override("ai_support_history_limit", "7")
+        after = settings_snapshot()
+
+        self.assertEqual(after.version, before.version + 1)
+        self.assertEqual(after.settings.ai_support_history_limit, 7)
+        self.assertIsNot(after.settings, before.settings)
+
+    def test_file_changes_are_picked_up_when_checked(self) -> None:
+        before = settings_snapshot()
+        self.overrides_path.write_text('{"ai_support_history_limit": 3}', encoding="utf-8")
+
+        after = refresh_settings(if_changed=True)
+
+        self.assertEqual(after.version, before.version + 1)
+        self.assertEqual(after.settings.ai_support_history_limit, 3)
+
+
 if __name__ == "__main__":
     unittest.main()
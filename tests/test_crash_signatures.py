@@ -0,0 +1,58 @@
+import unittest
+
+from bulmaai.utils.crash_signatures import (
+    CrashSignature,
+    CrashSignatureIndex,
+    default_crash_signature_index,
+    signatures_from_dict,
+)
+from bulmaai.utils.log_parser import LogReport
+
+
+def _signature(signature_id: str, *patterns: str) -> CrashSignature:
+    return CrashSignature(id=signature_id, cause=signature_id, fix="", patterns=patterns)
+
+
+class CrashSignatureIndexTests(unittest.TestCase):
+    def test_matches_case_insensitively_in_database_order(self) -> None:
+        index = CrashSignatureIndex(
+            [_signature("oom", "OutOfMemoryError"), _signature("mixin", "Mixin apply failed")]
+        )
+
+        hits = index.match("mixin APPLY failed for x\njava.lang.outofmemoryerror")
+
+        self.assertEqual([sig.id for sig in hits], ["oom", "mixin"])
+
+    def test_overlapping_and_contained_patterns_are_all_found(self) -> None:
+        index = CrashSignatureIndex(
+            [
+                _signature("long", "NoClassDefFoundError: software/bernie"),
+                _signature("short", "NoClassDefFoundError"),
+                _signature("tail", "ClassDefFoundError: soft"),
+            ]
+        )
+
+        hits = index.match("java.lang.NoClassDefFoundError: software/bernie/geckolib")
+
+        self.assertEqual({sig.id for sig in hits}, {"long", "short", "tail"})
+
+    def test_match_report_reads_errors_and_stacktrace(self) -> None:
+        report = LogReport(
+            errors=["[12:00:00] [main/ERROR] [x/]: Failed to create mod instance."],
+            stacktrace="java.lang.OutOfMemoryError: Java heap space",
+        )
+
+        ids = [sig.id for sig in default_crash_signature_index().match_report(report)]
+
+        self.assertEqual(ids, ["out-of-memory", "mod-constructor"])
+        self.assertEqual(default_crash_signature_index().match_report(LogReport()), [])
+
+    def test_rejects_duplicate_or_empty_signatures(self) -> None:
+        with self.assertRaises(ValueError):
+            signatures_from_dict({"signatures": [{"id": "a", "patterns": ["x"]}, {"id": "a", "patterns": ["y"]}]})
+        with self.assertRaises(ValueError):
+            signatures_from_dict({"signatures": [{"id": "a", "patterns": []}]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from bulmaai.github.github_app_auth import GitHubAppAuth, InstallationTokenManager
+
+
+class _FakeResponse:
+    status_code = 201
+    headers: dict = {}
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def json(self) -> dict:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _auth(tokens: InstallationTokenManager, installation_id: str = "42") -> GitHubAppAuth:
+    auth = GitHubAppAuth(app_id="1", installation_id=installation_id, private_key_pem="pem", tokens=tokens)
+    auth._make_jwt = lambda: "jwt"
+    return auth
+
+
+class InstallationTokenManagerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.tokens = InstallationTokenManager()
+
+    async def asyncTearDown(self) -> None:
+        await self.tokens.close()
+
+    async def test_concurrent_callers_share_one_mint_across_auth_instances(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            await release.wait()
+            return _FakeResponse({"token": "tok-1", "expires_at": "2099-01-01T00:00:00Z"})
+
+        mocked = AsyncMock(side_effect=slow_request)
+        with patch("bulmaai.github.github_app_auth.request", mocked):
+            pending = [
+                asyncio.create_task(_auth(self.tokens).get_installation_token()) for _ in range(5)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending)
+            again = await _auth(self.tokens).get_installation_token()
+
+        self.assertEqual(results, ["tok-1"] * 5)
+        self.assertEqual(again, "tok-1")
+        mocked.assert_awaited_once()
+
+    async def test_tokens_are_keyed_by_installation(self) -> None:
+        mocked = AsyncMock(
+            side_effect=[
+                _FakeResponse({"token": "tok-a", "expires_at": "2099-01-01T00:00:00Z"}),
+                _FakeResponse({"token": "tok-b", "expires_at": "2099-01-01T00:00:00Z"}),
+            ]
+        )
+        with patch("bulmaai.github.github_app_auth.request", mocked):
+            first = await _auth(self.tokens, "42").get_installation_token()
+            second = await _auth(self.tokens, "43").get_installation_token()
+
+        self.assertEqual((first, second), ("tok-a", "tok-b"))
+        self.assertIn("/installations/43/", mocked.await_args_list[1].args[1])
+
+    async def test_expires_at_from_response_drives_expiry(self) -> None:
+        clock = _Clock()
+        tokens = InstallationTokenManager(clock=clock, refresh_margin_seconds=0)
+        mint = AsyncMock(side_effect=[("tok-1", clock.now + 120), ("tok-2", clock.now + 3600)])
+
+        self.assertEqual(await tokens.get_token(("1", "42"), mint), "tok-1")
+        clock.now += 30
+        self.assertEqual(await tokens.get_token(("1", "42"), mint), "tok-1")
+        clock.now += 40  # inside the final minute: never hand this token out
+        self.assertEqual(await tokens.get_token(("1", "42"), mint), "tok-2")
+        self.assertEqual(mint.await_count, 2)
+        await tokens.close()
+
+    async def test_used_token_is_refreshed_in_background_before_expiry(self) -> None:
+        clock = _Clock()
+        tokens = InstallationTokenManager(clock=clock, refresh_margin_seconds=3600)
+        mint = AsyncMock(side_effect=[("tok-1", clock.now + 3600), ("tok-2", clock.now + 7200)])
+
+        self.assertEqual(await tokens.get_token(("1", "42"), mint), "tok-1")
+        self.assertEqual(await tokens.get_token(("1", "42"), mint), "tok-1")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        self.assertEqual(mint.await_count, 2)
+        self.assertEqual(await tokens.get_token(("1", "42"), mint), "tok-2")
+        await tokens.close()
+
+    async def test_unused_token_is_left_to_lapse(self) -> None:
+        clock = _Clock()
+        tokens = InstallationTokenManager(clock=clock, refresh_margin_seconds=3600)
+        mint = AsyncMock(return_value=("tok-1", clock.now + 3600))
+
+        await tokens.get_token(("1", "42"), mint)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        mint.assert_awaited_once()
+        await tokens.close()
+
+    async def test_failed_mint_is_raised_to_every_waiter(self) -> None:
+        mint = AsyncMock(side_effect=RuntimeError("boom"))
+
+        results = await asyncio.gather(
+            self.tokens.get_token(("1", "42"), mint),
+            self.tokens.get_token(("1", "42"), mint),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        mint.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
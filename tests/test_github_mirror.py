@@ -0,0 +1,184 @@
+import os
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+os.environ.setdefault("DISCORD_TOKEN", "dummy-discord-token")
+os.environ.setdefault("OPENAI_KEY", "dummy-openai-key")
+os.environ.setdefault("GH_APP_PRIVATE_KEY_PEM", "dummy-github-key")
+
+from bulmaai.cogs.github_cmds import _get_issue, _get_pr
+from bulmaai.github.github_service import GitHubService
+from bulmaai.services.github_mirror import (
+    GitHubSyncState,
+    _item_kind,
+    _normalized_item,
+    search_github_items,
+    sync_github_repo,
+)
+
+
+class _FakeService:
+    repo = "dragonminez"
+
+    def __init__(self, items: list[dict]) -> None:
+        self.items = items
+        self.iter_kwargs: dict = {}
+
+    async def iter_issues(self, **kwargs):
+        self.iter_kwargs = kwargs
+        for item in self.items:
+            yield item
+
+    async def get_labels(self) -> list[dict]:
+        return [{"name": "bug", "color": "d73a4a"}]
+
+
+class GitHubMirrorSyncTests(unittest.IsolatedAsyncioTestCase):
+    async def test_sync_resumes_from_cursor_and_advances_it(self) -> None:
+        service = _FakeService(
+            [
+                {"number": 7, "title": "Crash", "state": "open", "updated_at": "2026-10-02T08:00:00Z"},
+                {"number": 9, "title": "PR", "state": "open", "updated_at": "2026-10-03T09:30:00Z", "pull_request": {}},
+            ]
+        )
+        previous = GitHubSyncState(
+            repo="dragonminez",
+            items_cursor=datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc),
+            synced_at=None,
+        )
+        upsert = AsyncMock()
+        replace_labels = AsyncMock()
+        set_state = AsyncMock()
+
+        with (
+            patch("bulmaai.services.github_mirror.get_github_sync_state", AsyncMock(return_value=previous)),
+            patch("bulmaai.services.github_mirror.upsert_github_items", upsert),
+            patch("bulmaai.services.github_mirror.replace_github_labels", replace_labels),
+            patch("bulmaai.services.github_mirror.set_github_sync_state", set_state),
+        ):
+            written = await sync_github_repo(service)
+
+        self.assertEqual(written, 2)
+        self.assertEqual(service.iter_kwargs["since"], "2026-10-01T12:00:00Z")
+        self.assertEqual(service.iter_kwargs["sort"], "updated")
+        self.assertEqual(service.iter_kwargs["direction"], "asc")
+        upsert.assert_awaited_once_with("dragonminez", service.items)
+        replace_labels.assert_awaited_once_with("dragonminez", [{"name": "bug", "color": "d73a4a"}])
+        set_state.assert_awaited_once_with(
+            "dragonminez",
+            items_cursor=datetime(2026, 10, 3, 9, 30, tzinfo=timezone.utc),
+        )
+
+    async def test_first_sync_walks_everything(self) -> None:
+        service = _FakeService([])
+        set_state = AsyncMock()
+
+        with (
+            patch("bulmaai.services.github_mirror.get_github_sync_state", AsyncMock(return_value=None)),
+            patch("bulmaai.services.github_mirror.upsert_github_items", AsyncMock()),
+            patch("bulmaai.services.github_mirror.replace_github_labels", AsyncMock()),
+            patch("bulmaai.services.github_mirror.set_github_sync_state", set_state),
+        ):
+            written = await sync_github_repo(service)
+
+        self.assertEqual(written, 0)
+        self.assertIsNone(service.iter_kwargs["since"])
+        set_state.assert_awaited_once_with("dragonminez", items_cursor=None)
+
+    def test_pull_requests_are_classified_and_normalized(self) -> None:
+        as_issue = {"number": 3, "pull_request": {"merged_at": "2026-10-03T09:30:00Z"}}
+
+        self.assertEqual(_item_kind({"number": 1}), "issue")
+        self.assertEqual(_item_kind(as_issue), "pull")
+        self.assertEqual(_item_kind({"number": 4, "head": {"ref": "x"}}), "pull")
+        self.assertEqual(_normalized_item(as_issue)["merged_at"], "2026-10-03T09:30:00Z")
+
+
+class GitHubMirrorReadTests(unittest.IsolatedAsyncioTestCase):
+    async def test_search_text_is_matched_literally(self) -> None:
+        conn = AsyncMock()
+        conn.fetch.return_value = []
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.return_value = conn
+
+        with patch("bulmaai.services.github_mirror.get_pool", AsyncMock(return_value=pool)):
+            await search_github_items("dragonminez", kind="issue", text="100%_done\\")
+
+        query, *args = conn.fetch.await_args.args
+        self.assertIn("ESCAPE", query)
+        self.assertEqual(args[2], "100\\%\\_done\\\\")
+
+    async def test_selected_items_are_read_from_the_mirror(self) -> None:
+        service = SimpleNamespace(repo="dragonminez", get_issue=AsyncMock(), get_pr=AsyncMock())
+        issue = {"number": 3, "state": "open"}
+        pr = {"number": 4, "state": "closed", "head": {"ref": "x"}, "base": {"ref": "main"}, "merged_at": "t"}
+
+        with (
+            patch("bulmaai.cogs.github_cmds.shared_github_mirror.is_synced", AsyncMock(return_value=True)),
+            patch("bulmaai.cogs.github_cmds.get_github_item", AsyncMock(side_effect=[issue, pr])),
+        ):
+            self.assertEqual(await _get_issue(service, 3), issue)
+            self.assertTrue((await _get_pr(service, 4))["merged"])
+
+        service.get_issue.assert_not_awaited()
+        service.get_pr.assert_not_awaited()
+
+    async def test_missing_or_partial_rows_fall_back_to_the_api(self) -> None:
+        service = SimpleNamespace(
+            repo="dragonminez",
+            get_issue=AsyncMock(return_value={"number": 3}),
+            get_pr=AsyncMock(return_value={"number": 4}),
+        )
+        # A PR synced from the issues endpoint has no head/base.
+        issue_shaped_pr = {"number": 4, "state": "open", "pull_request": {}}
+
+        with (
+            patch("bulmaai.cogs.github_cmds.shared_github_mirror.is_synced", AsyncMock(return_value=True)),
+            patch("bulmaai.cogs.github_cmds.get_github_item", AsyncMock(side_effect=[None, issue_shaped_pr])),
+        ):
+            self.assertEqual(await _get_issue(service, 3), {"number": 3})
+            self.assertEqual(await _get_pr(service, 4), {"number": 4})
+
+
+class _FakeResponse:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, payload) -> None:
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class GitHubServiceMirrorHookTests(unittest.IsolatedAsyncioTestCase):
+    async def test_writes_are_recorded_in_the_mirror(self) -> None:
+        mirror = SimpleNamespace(record=AsyncMock(), record_labels=AsyncMock())
+        service = GitHubService(
+            auth=SimpleNamespace(get_installation_token=AsyncMock(return_value="token")),
+            owner="DragonMineZ",
+            repo="dragonminez",
+            mirror=mirror,
+        )
+        closed = {"number": 5, "state": "closed"}
+        labels = [{"name": "bug"}]
+
+        with patch(
+            "bulmaai.github.github_service.request",
+            AsyncMock(side_effect=[_FakeResponse(closed), _FakeResponse(labels)]),
+        ):
+            await service.close_issue(5)
+            await service.add_labels(5, ["bug"])
+
+        mirror.record.assert_awaited_once_with("dragonminez", closed)
+        mirror.record_labels.assert_awaited_once_with("dragonminez", 5, labels)
+
+
+if __name__ == "__main__":
+    unittest.main()
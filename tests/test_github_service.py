@@ -1,16 +1,20 @@
 import unittest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlsplit
 
 from requests import HTTPError
 
-from bulmaai.github.github_service import GitHubService
+from bulmaai.github.github_service import FileSnapshot, GitHubService
+from bulmaai.github.graphql import GitHubGraphQLError, GraphQLBatch
+from bulmaai.github.response_cache import GitHubResponseCache
 
 
 class FakeResponse:
-    def __init__(self, status_code: int, payload: dict):
+    def __init__(self, status_code: int, payload: dict, headers: dict | None = None):
         self.status_code = status_code
         self._payload = payload
+        self.headers = headers or {}
 
     def json(self):
         return self._payload
@@ -97,5 +101,375 @@ class GitHubServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(pr, existing_pr)
 
 
+    async def test_reads_revalidate_with_etag_and_serve_304_from_cache(self) -> None:
+        service = GitHubService(
+            auth=SimpleNamespace(get_installation_token=AsyncMock(return_value="token")),
+            owner="DragonMineZ",
+            repo=".github",
+            response_cache=GitHubResponseCache(),
+        )
+        request_mock = AsyncMock(
+            side_effect=[
+                FakeResponse(200, [{"number": 1}], {"ETag": 'W/"v1"', "Last-Modified": "Tue, 01 Oct 2026 10:00:00 GMT"}),
+                FakeResponse(304, {}),
+                FakeResponse(200, [{"number": 2}], {"ETag": 'W/"v2"'}),
+            ]
+        )
+
+        with patch("bulmaai.github.github_service.request", request_mock):
+            first = await service.list_issues(state="all")
+            second = await service.list_issues(state="all")
+            third = await service.list_issues(state="all")
+
+        self.assertEqual(first, [{"number": 1}])
+        self.assertEqual(second, [{"number": 1}])
+        self.assertEqual(third, [{"number": 2}])
+        first_headers = request_mock.await_args_list[0].kwargs["headers"]
+        second_headers = request_mock.await_args_list[1].kwargs["headers"]
+        self.assertNotIn("If-None-Match", first_headers)
+        self.assertEqual(second_headers["If-None-Match"], 'W/"v1"')
+        self.assertEqual(second_headers["If-Modified-Since"], "Tue, 01 Oct 2026 10:00:00 GMT")
+        self.assertEqual(service.response_cache.hits, 1)
+
+    async def test_responses_are_cached_per_query(self) -> None:
+        cache = GitHubResponseCache(max_entries=1)
+        service = GitHubService(
+            auth=SimpleNamespace(get_installation_token=AsyncMock(return_value="token")),
+            owner="DragonMineZ",
+            repo=".github",
+            response_cache=cache,
+        )
+        request_mock = AsyncMock(
+            side_effect=[
+                FakeResponse(200, [], {"ETag": '"open"'}),
+                FakeResponse(200, [], {"ETag": '"closed"'}),
+                FakeResponse(200, [], {"ETag": '"open"'}),
+            ]
+        )
+
+        with patch("bulmaai.github.github_service.request", request_mock):
+            await service.list_prs(state="open")
+            await service.list_prs(state="closed")
+            await service.list_prs(state="open")
+
+        # The LRU holds one entry, so "open" was evicted by "closed".
+        self.assertNotIn("If-None-Match", request_mock.await_args_list[2].kwargs["headers"])
+        self.assertEqual(len(cache), 1)
+
+    async def test_304_is_served_even_if_the_entry_was_evicted_meanwhile(self) -> None:
+        cache = GitHubResponseCache(max_entries=1)
+        service = GitHubService(
+            auth=SimpleNamespace(get_installation_token=AsyncMock(return_value="token")),
+            owner="DragonMineZ",
+            repo=".github",
+            response_cache=cache,
+        )
+
+        async def fake_request(method, url, *, headers=None, params=None):
+            if "If-None-Match" not in headers:
+                return FakeResponse(200, [{"number": 1}], {"ETag": '"v1"'})
+            # A concurrent read evicts the entry while this revalidation is in flight.
+            cache.resolve(cache.key("https://other.test"), FakeResponse(200, [], {"ETag": '"x"'}))
+            return FakeResponse(304, {})
+
+        with patch("bulmaai.github.github_service.request", AsyncMock(side_effect=fake_request)):
+            await service.list_issues(state="all")
+            second = await service.list_issues(state="all")
+
+        self.assertEqual(second, [{"number": 1}])
+        self.assertEqual(cache.hits, 1)
+
+
+    def _paged_request(self, pages: dict[int, list[dict]], calls: list[int]) -> AsyncMock:
+        base = "https://api.github.com/repos/DragonMineZ/.github/issues"
+        last = max(pages)
+
+        async def fake_request(method, url, *, headers=None, params=None):
+            page = int(parse_qs(urlsplit(url).query).get("page", ["1"])[0])
+            calls.append(page)
+            links = []
+            if page < last:
+                links.append(f'<{base}?state=all&per_page=2&page={page + 1}>; rel="next"')
+                links.append(f'<{base}?state=all&per_page=2&page={last}>; rel="last"')
+            return FakeResponse(200, pages[page], {"Link": ", ".join(links)})
+
+        return AsyncMock(side_effect=fake_request)
+
+    def _service(self) -> GitHubService:
+        return GitHubService(
+            auth=SimpleNamespace(get_installation_token=AsyncMock(return_value="token")),
+            owner="DragonMineZ",
+            repo=".github",
+            response_cache=GitHubResponseCache(),
+        )
+
+    async def test_iter_issues_follows_link_headers_in_order(self) -> None:
+        pages = {n: [{"number": 2 * n - 1}, {"number": 2 * n}] for n in range(1, 6)}
+        calls: list[int] = []
+
+        with patch("bulmaai.github.github_service.request", self._paged_request(pages, calls)):
+            numbers = [issue["number"] async for issue in self._service().iter_issues(state="all", per_page=2)]
+
+        self.assertEqual(numbers, list(range(1, 11)))
+        self.assertEqual(sorted(calls), [1, 2, 3, 4, 5])
+
+    async def test_iter_issues_stops_fetching_once_limit_is_reached(self) -> None:
+        pages = {n: [{"number": 2 * n - 1}, {"number": 2 * n}] for n in range(1, 11)}
+        calls: list[int] = []
+
+        with patch("bulmaai.github.github_service.request", self._paged_request(pages, calls)):
+            numbers = [
+                issue["number"]
+                async for issue in self._service().iter_issues(state="all", per_page=2, limit=5)
+            ]
+
+        self.assertEqual(numbers, [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(calls), [1, 2, 3])
+
+    async def test_iter_issues_can_skip_pull_requests(self) -> None:
+        pages = {
+            1: [{"number": 1, "pull_request": {}}, {"number": 2}],
+            2: [{"number": 3, "pull_request": {}}, {"number": 4}],
+            3: [{"number": 5}, {"number": 6}],
+        }
+        calls: list[int] = []
+
+        with patch("bulmaai.github.github_service.request", self._paged_request(pages, calls)):
+            numbers = [
+                issue["number"]
+                async for issue in self._service().iter_issues(
+                    state="all", per_page=2, limit=3, include_pull_requests=False
+                )
+            ]
+
+        self.assertEqual(numbers, [2, 4, 5])
+
+
+class GitHubGraphQLTests(unittest.IsolatedAsyncioTestCase):
+    def _service(self) -> GitHubService:
+        return GitHubService(
+            auth=SimpleNamespace(get_installation_token=AsyncMock(return_value="token")),
+            owner="DragonMineZ",
+            repo=".github",
+            whitelist_file_path="whitelist.txt",
+        )
+
+    def _snapshot(self, **overrides) -> FileSnapshot:
+        values = {
+            "path": "whitelist.txt",
+            "branch": "patreon/user-1",
+            "repository_id": "R_1",
+            "base_oid": "base-oid",
+            "base_text": "ExistingUser\n",
+            "branch_exists": False,
+            "head_oid": "base-oid",
+            "branch_text": "ExistingUser\n",
+            "pull_request": None,
+        }
+        values.update(overrides)
+        return FileSnapshot(**values)
+
+    async def test_snapshot_reads_base_branch_and_open_pr_in_one_query(self) -> None:
+        data = {
+            "repository": {
+                "id": "R_1",
+                "base": {"target": {"oid": "base-oid"}},
+                "head": {
+                    "target": {"oid": "head-oid"},
+                    "associatedPullRequests": {"nodes": [{"number": 7, "url": "https://example.test/pr/7"}]},
+                },
+                "baseFile": {"oid": "blob-a", "text": "A\n"},
+                "headFile": {"text": "A\nB\n"},
+            }
+        }
+        request_mock = AsyncMock(return_value=FakeResponse(200, {"data": data}))
+
+        with patch("bulmaai.github.graphql.request", request_mock):
+            snapshot = await self._service().get_whitelist_snapshot("patreon/user-1")
+
+        request_mock.assert_awaited_once()
+        variables = request_mock.await_args.kwargs["json"]["variables"]
+        self.assertEqual(variables["headFile"], "patreon/user-1:whitelist.txt")
+        self.assertTrue(snapshot.branch_exists)
+        self.assertEqual(snapshot.head_oid, "head-oid")
+        self.assertEqual(snapshot.branch_text, "A\nB\n")
+        self.assertEqual(snapshot.base_blob_oid, "blob-a")
+        self.assertEqual(snapshot.pull_request, {"number": 7, "html_url": "https://example.test/pr/7"})
+
+    async def test_missing_branch_reads_as_base(self) -> None:
+        data = {
+            "repository": {
+                "id": "R_1",
+                "base": {"target": {"oid": "base-oid"}},
+                "head": None,
+                "baseFile": {"text": "A\n"},
+                "headFile": None,
+            }
+        }
+
+        with patch("bulmaai.github.graphql.request", AsyncMock(return_value=FakeResponse(200, {"data": data}))):
+            snapshot = await self._service().get_whitelist_snapshot("patreon/user-1")
+
+        self.assertFalse(snapshot.branch_exists)
+        self.assertEqual(snapshot.head_oid, "base-oid")
+        self.assertEqual(snapshot.branch_text, "A\n")
+
+    async def test_branch_commit_and_pr_are_one_mutation(self) -> None:
+        response = FakeResponse(
+            200,
+            {
+                "data": {
+                    "branch": {"ref": {"name": "patreon/user-1"}},
+                    "commit": {"commit": {"oid": "new-oid"}},
+                    "pr": {"pullRequest": {"number": 12, "url": "https://example.test/pr/12"}},
+                }
+            },
+        )
+        request_mock = AsyncMock(return_value=response)
+
+        with patch("bulmaai.github.graphql.request", request_mock):
+            pr = await self._service().commit_whitelist_and_open_pr(
+                self._snapshot(),
+                new_text="ExistingUser\nNewTester\n",
+                message="Add beta tester: NewTester",
+                title="Add beta tester: NewTester",
+                body="Requested.",
+            )
+
+        self.assertEqual(pr, {"number": 12, "html_url": "https://example.test/pr/12"})
+        request_mock.assert_awaited_once()
+        payload = request_mock.await_args.kwargs["json"]
+        query = payload["query"]
+        self.assertLess(query.index("createRef"), query.index("createCommitOnBranch"))
+        self.assertLess(query.index("createCommitOnBranch"), query.index("createPullRequest"))
+        commit = payload["variables"]["commit_input"]
+        self.assertEqual(commit["expectedHeadOid"], "base-oid")
+        self.assertEqual(commit["fileChanges"]["additions"][0]["contents"], "RXhpc3RpbmdVc2VyCk5ld1Rlc3Rlcgo=")
+
+    async def test_nothing_to_do_reuses_open_pr_without_a_request(self) -> None:
+        existing = {"number": 7, "html_url": "https://example.test/pr/7"}
+        request_mock = AsyncMock()
+
+        with patch("bulmaai.github.graphql.request", request_mock):
+            pr = await self._service().commit_whitelist_and_open_pr(
+                self._snapshot(branch_exists=True, head_oid="head-oid", pull_request=existing),
+                new_text=None,
+                message="m",
+                title="t",
+                body="b",
+            )
+
+        self.assertEqual(pr, existing)
+        request_mock.assert_not_awaited()
+
+    async def test_graphql_errors_raise(self) -> None:
+        response = FakeResponse(200, {"data": {"commit": None}, "errors": [{"message": "Expected branch to point to x"}]})
+
+        with patch("bulmaai.github.graphql.request", AsyncMock(return_value=response)):
+            with self.assertRaises(GitHubGraphQLError) as caught:
+                await self._service().commit_whitelist_and_open_pr(
+                    self._snapshot(branch_exists=True, pull_request={"number": 7, "html_url": "u"}),
+                    new_text="x\n",
+                    message="m",
+                    title="t",
+                    body="b",
+                )
+
+        self.assertIn("Expected branch", str(caught.exception))
+
+    async def test_branch_created_by_a_failed_mutation_is_removed(self) -> None:
+        response = FakeResponse(
+            200,
+            {
+                "data": {"branch": {"ref": {"name": "patreon/user-1"}}, "commit": None, "pr": None},
+                "errors": [{"message": "Expected branch to point to x"}],
+            },
+        )
+        service = self._service()
+        service.remove_branch = AsyncMock(side_effect=HTTPError("404"))
+
+        with patch("bulmaai.github.graphql.request", AsyncMock(return_value=response)):
+            with self.assertRaises(GitHubGraphQLError):
+                await service.commit_whitelist_and_open_pr(
+                    self._snapshot(),
+                    new_text="x\n",
+                    message="m",
+                    title="t",
+                    body="b",
+                )
+
+        service.remove_branch.assert_awaited_once_with("patreon/user-1")
+
+    async def test_existing_branch_is_kept_when_the_mutation_fails(self) -> None:
+        response = FakeResponse(200, {"data": {"commit": None}, "errors": [{"message": "Expected branch to point to x"}]})
+        service = self._service()
+        service.remove_branch = AsyncMock()
+
+        with patch("bulmaai.github.graphql.request", AsyncMock(return_value=response)):
+            with self.assertRaises(GitHubGraphQLError):
+                await service.commit_whitelist_and_open_pr(
+                    self._snapshot(branch_exists=True, pull_request={"number": 7, "html_url": "u"}),
+                    new_text="x\n",
+                    message="m",
+                    title="t",
+                    body="b",
+                )
+
+        service.remove_branch.assert_not_awaited()
+
+    async def test_issue_states_are_read_in_one_query_and_missing_issues_map_to_none(self) -> None:
+        response = FakeResponse(
+            200,
+            {
+                "data": {
+                    "repository": {
+                        "i3": {"state": "OPEN", "stateReason": None},
+                        "i5": {"state": "CLOSED", "stateReason": "NOT_PLANNED"},
+                        "i8": None,
+                    }
+                },
+                "errors": [{"type": "NOT_FOUND", "path": ["repository", "i8"], "message": "Could not resolve"}],
+            },
+        )
+        request_mock = AsyncMock(return_value=response)
+
+        with patch("bulmaai.github.graphql.request", request_mock):
+            states = await self._service().get_issue_states([3, 5, 8, 3])
+
+        request_mock.assert_awaited_once()
+        self.assertIn("i5: issue(number: 5)", request_mock.await_args.kwargs["json"]["query"])
+        self.assertEqual(
+            states,
+            {
+                3: {"state": "open", "state_reason": None},
+                5: {"state": "closed", "state_reason": "not_planned"},
+                8: None,
+            },
+        )
+
+    async def test_issue_states_raise_when_the_repository_is_missing(self) -> None:
+        response = FakeResponse(
+            200,
+            {"data": {"repository": None}, "errors": [{"type": "NOT_FOUND", "path": ["repository"]}]},
+        )
+
+        with patch("bulmaai.github.graphql.request", AsyncMock(return_value=response)):
+            with self.assertRaises(GitHubGraphQLError):
+                await self._service().get_issue_states([3])
+
+    def test_batch_namespaces_variables_by_alias(self) -> None:
+        batch = GraphQLBatch()
+        batch.add("a", "addLabelsToLabelable", "clientMutationId", {"input": ("AddLabelsToLabelableInput!", {"x": 1})})
+        batch.add("b", "addLabelsToLabelable", "clientMutationId", {"input": ("AddLabelsToLabelableInput!", {"x": 2})})
+
+        self.assertEqual(
+            batch.render(),
+            "mutation($a_input: AddLabelsToLabelableInput!, $b_input: AddLabelsToLabelableInput!) { "
+            "a: addLabelsToLabelable(input: $a_input) { clientMutationId } "
+            "b: addLabelsToLabelable(input: $b_input) { clientMutationId } }",
+        )
+        self.assertEqual(batch.variables, {"a_input": {"x": 1}, "b_input": {"x": 2}})
+
+
 if __name__ == "__main__":
     unittest.main()
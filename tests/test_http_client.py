@@ -0,0 +1,248 @@
+import asyncio
+import time
+import unittest
+
+from aiohttp import web
+from requests import HTTPError
+
+from bulmaai.services.http import HostLimits, HTTPClient, TokenBucket, _normalize_params
+
+
+class _LocalServer:
+    """Tiny aiohttp app that records the client port of every request."""
+
+    def __init__(self) -> None:
+        self.peers: list[int] = []
+        self.hits: dict[str, int] = {}
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.peers.append(request.transport.get_extra_info("peername")[1])
+        hit = self.hits[request.path] = self.hits.get(request.path, 0) + 1
+        if request.path == "/limited" and hit == 1:
+            return web.json_response({"message": "slow down"}, status=429, headers={"Retry-After": "2"})
+        if request.path == "/secondary" and hit == 1:
+            return web.json_response(
+                {"message": "You have exceeded a secondary rate limit."},
+                status=403,
+                headers={"Retry-After": "1"},
+            )
+        if request.path == "/flaky":
+            return web.json_response({"message": "unavailable"}, status=503)
+        if request.path == "/exhausted":
+            return web.json_response(
+                {"message": "ok"},
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 5)},
+            )
+        if request.path == "/missing":
+            return web.json_response({"message": "Not Found"}, status=404)
+        if request.path == "/slow":
+            await asyncio.sleep(1)
+        body = await request.text()
+        return web.json_response(
+            {"method": request.method, "query": request.query_string, "body": body},
+            headers={"ETag": '"abc"'},
+        )
+
+    async def __aenter__(self) -> "_LocalServer":
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        assert self._runner is not None
+        await self._runner.cleanup()
+
+
+class HTTPClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_sequential_requests_reuse_one_keep_alive_connection(self) -> None:
+        client = HTTPClient()
+        try:
+            async with _LocalServer() as server:
+                for _ in range(5):
+                    response = await client.request("GET", f"{server.base_url}/ping")
+                    self.assertEqual(response.status_code, 200)
+        finally:
+            await client.close()
+
+        self.assertEqual(len(server.peers), 5)
+        self.assertEqual(len(set(server.peers)), 1)
+
+    async def test_response_mirrors_requests_api(self) -> None:
+        client = HTTPClient()
+        try:
+            async with _LocalServer() as server:
+                response = await client.request(
+                    "post",
+                    f"{server.base_url}/echo",
+                    params={"page": 2, "state": None, "labels": ["bug", "ui"]},
+                    json={"title": "x"},
+                )
+                missing = await client.request("GET", f"{server.base_url}/missing")
+        finally:
+            await client.close()
+
+        self.assertTrue(response.ok)
+        self.assertEqual(response.headers["etag"], '"abc"')
+        payload = response.json()
+        self.assertEqual(payload["method"], "POST")
+        self.assertEqual(payload["query"], "page=2&labels=bug&labels=ui")
+        self.assertEqual(payload["body"], '{"title": "x"}')
+
+        with self.assertRaises(HTTPError) as caught:
+            missing.raise_for_status()
+        self.assertEqual(caught.exception.response.status_code, 404)
+        self.assertIn("404 Client Error", str(caught.exception))
+
+    async def test_per_call_timeout_is_enforced(self) -> None:
+        client = HTTPClient(max_retries=0)
+        try:
+            async with _LocalServer() as server:
+                with self.assertRaises(asyncio.TimeoutError):
+                    await client.request("GET", f"{server.base_url}/slow", timeout=0.2)
+        finally:
+            await client.close()
+
+
+class _FakeClock:
+    """Virtual time: sleeping advances the clock instantly."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimitAndRetryTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.clock = _FakeClock()
+        self.client = HTTPClient(clock=self.clock, sleep=self.clock.sleep)
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+
+    async def test_retry_after_pauses_the_host_then_retries(self) -> None:
+        async with _LocalServer() as server:
+            response = await self.client.request("POST", f"{server.base_url}/limited", json={})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(server.hits["/limited"], 2)
+        self.assertAlmostEqual(sum(self.clock.sleeps), 2.0)
+        self.assertEqual(self.client.stats.rate_limited, 1)
+        self.assertEqual(self.client.stats.retries, 1)
+
+    async def test_github_secondary_rate_limit_403_is_retried(self) -> None:
+        async with _LocalServer() as server:
+            response = await self.client.request("GET", f"{server.base_url}/secondary")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(server.hits["/secondary"], 2)
+
+    async def test_server_errors_retry_only_idempotent_methods(self) -> None:
+        async with _LocalServer() as server:
+            get = await self.client.request("GET", f"{server.base_url}/flaky")
+            gets = server.hits["/flaky"]
+            post = await self.client.request("POST", f"{server.base_url}/flaky")
+
+        self.assertEqual(get.status_code, 503)
+        self.assertEqual(gets, 1 + self.client.max_retries)
+        self.assertEqual(post.status_code, 503)
+        self.assertEqual(server.hits["/flaky"], gets + 1)
+
+    async def test_exhausted_rate_limit_blocks_the_next_request(self) -> None:
+        async with _LocalServer() as server:
+            await self.client.request("GET", f"{server.base_url}/exhausted")
+            self.assertEqual(self.clock.sleeps, [])
+            await self.client.request("GET", f"{server.base_url}/ping")
+
+        self.assertGreater(sum(self.clock.sleeps), 3)
+
+    async def test_long_retry_after_returns_the_limited_response(self) -> None:
+        client = HTTPClient(max_retry_wait_seconds=1, clock=self.clock, sleep=self.clock.sleep)
+        try:
+            async with _LocalServer() as server:
+                response = await client.request("GET", f"{server.base_url}/limited")
+        finally:
+            await client.close()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.clock.sleeps, [])
+
+    async def test_per_call_overrides_disable_retries_and_waits(self) -> None:
+        async with _LocalServer() as server:
+            flaky = await self.client.request("GET", f"{server.base_url}/flaky", retries=0)
+            limited = await self.client.request("GET", f"{server.base_url}/limited", retries=0, max_retry_wait=0)
+
+        self.assertEqual(flaky.status_code, 503)
+        self.assertEqual(server.hits["/flaky"], 1)
+        self.assertEqual(limited.status_code, 429)
+        self.assertEqual(server.hits["/limited"], 1)
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(self.client.stats.retries, 0)
+
+    async def test_writes_use_the_host_write_bucket(self) -> None:
+        client = HTTPClient(
+            host_limits={"127.0.0.1": HostLimits(100, 100, write_rate_per_second=1, write_burst=1)},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        try:
+            async with _LocalServer() as server:
+                for _ in range(3):
+                    await client.request("GET", f"{server.base_url}/ping")
+                self.assertEqual(self.clock.sleeps, [])
+                for _ in range(3):
+                    await client.request("POST", f"{server.base_url}/ping")
+        finally:
+            await client.close()
+
+        self.assertAlmostEqual(sum(self.clock.sleeps), 2.0)
+
+
+class TokenBucketTests(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_then_paced_at_rate(self) -> None:
+        clock = _FakeClock()
+        bucket = TokenBucket(4, 2, clock=clock, sleep=clock.sleep)
+
+        waits = [await bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.25)
+        self.assertAlmostEqual(waits[3], 0.25)
+
+    async def test_block_until_delays_every_caller(self) -> None:
+        clock = _FakeClock()
+        bucket = TokenBucket(100, 10, clock=clock, sleep=clock.sleep)
+        bucket.block_until(clock.now + 3)
+
+        first, second = await asyncio.gather(bucket.acquire(), bucket.acquire())
+
+        self.assertAlmostEqual(first, 3.0)
+        self.assertEqual(second, 0.0)
+        self.assertAlmostEqual(clock.now, 1003.0)
+
+
+class NormalizeParamsTests(unittest.TestCase):
+    def test_matches_requests_encoding_rules(self) -> None:
+        self.assertIsNone(_normalize_params(None))
+        self.assertEqual(
+            _normalize_params({"a": 1, "b": None, "c": True, "d": ("x", None, "y")}),
+            [("a", "1"), ("c", "True"), ("d", "x"), ("d", "y")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+
+from bulmaai.utils.log_parser import MAX_LINE_CHARS, MAX_STACKTRACE_LEN, parse_log, parse_log_file
+
+
+LATEST_LOG = "\n".join(
+    [
+        "[24Jun2023 06:57:40.001] [main/INFO] [cpw.mods.modlauncher.Launcher/MODLAUNCHER]: "
+        "ModLauncher running: args [--fml.forgeVersion, 47.2.0, --fml.mcVersion, 1.20.1]",
+        "[24Jun2023 06:57:40.010] [main/INFO] [cpw.mods.modlauncher.Launcher/MODLAUNCHER]: "
+        "ModLauncher 10.0.9 starting: java version 17.0.8 by Microsoft; OS Windows 10 arch amd64 version 10.0",
+        "[24Jun2023 06:57:42.886] [main/INFO] [net.minecraftforge.fml.loading.FMLLoader/CORE]: "
+        "Forge mod loading, version 47.2.0, for MC 1.20.1 with MCP 20230612.114412",
+        "[24Jun2023 06:57:43.001] [main/DEBUG] [net.minecraftforge.fml.loading.moddiscovery.ModDiscoverer/SCAN]: "
+        "Found valid mod file dragonminez-2.0.1.jar with {dragonminez} mods - versions {2.0.1}",
+        "[24Jun2023 06:57:43.002] [main/DEBUG] [net.minecraftforge.fml.loading.moddiscovery.ModDiscoverer/SCAN]: "
+        "Found valid mod file geckolib-4.2.jar with {geckolib} mods - versions {4.2}",
+        "[24Jun2023 06:58:00.000] [Render thread/ERROR] [net.minecraftforge.fml.ModLoader/]: Failed to create mod instance.",
+        "java.lang.NullPointerException: value is null",
+        "\tat com.dragonminez.common.Init.register(Init.java:10)",
+        "",
+        "",
+        "[24Jun2023 06:58:01.000] [Render thread/INFO] [net.minecraft.client.Minecraft/]: Stopping!",
+    ]
+)
+
+CRASH_REPORT = "\n".join(
+    [
+        "---- Minecraft Crash Report ----",
+        "Description: Mod loading error has occurred",
+        "",
+        "java.lang.Exception: Mod Loading has failed",
+        "\tat net.minecraftforge.logging.CrashReportExtender.dump(CrashReportExtender.java:55)",
+        "",
+        "",
+        "-- System Details --",
+        "\tOperating System: Windows 11 (amd64) version 10.0",
+        "\tJava Version: 17.0.8, Microsoft",
+        "\tMemory: 512000000 bytes (488 MiB)",
+        "\t\txenon-0.3.31.jar |Xenon |xenon |0.3.31 |DONE |Manifest: NOSIGNATURE",
+        "\t\tdragonminez-2.0.1.jar |DragonMineZ |dragonminez |2.0.1 |ERROR |Manifest: NOSIGNATURE",
+    ]
+)
+
+
+class ParseLatestLogTests(unittest.TestCase):
+    def test_extracts_environment_from_header(self) -> None:
+        report = parse_log(LATEST_LOG)
+
+        self.assertTrue(report.is_forge)
+        self.assertEqual(report.java_version, "17.0.8")
+        self.assertEqual(report.forge_version, "47.2.0")
+        self.assertEqual(report.mc_version, "1.20.1")
+        self.assertEqual(report.operating_system, "Windows 10")
+
+    def test_extracts_discovered_mods_and_dragonminez_version(self) -> None:
+        report = parse_log(LATEST_LOG)
+
+        self.assertEqual(report.mods, {"dragonminez": "2.0.1", "geckolib": "4.2"})
+        self.assertEqual(report.dragonminez_version, "2.0.1")
+
+    def test_collects_error_lines_and_trace_until_two_blank_lines(self) -> None:
+        report = parse_log(LATEST_LOG)
+
+        self.assertEqual(len(report.errors), 1)
+        self.assertIn("Failed to create mod instance.", report.errors[0])
+        self.assertIn("java.lang.NullPointerException: value is null", report.stacktrace)
+        self.assertNotIn("Stopping!", report.stacktrace)
+
+    def test_crlf_line_endings_parse_the_same(self) -> None:
+        self.assertEqual(parse_log(LATEST_LOG.replace("\n", "\r\n")), parse_log(LATEST_LOG))
+
+
+class ParseCrashReportTests(unittest.TestCase):
+    def test_extracts_crash_report_details_and_mod_table(self) -> None:
+        report = parse_log(CRASH_REPORT)
+
+        self.assertTrue(report.is_forge)
+        self.assertEqual(report.java_version, "17.0.8")
+        self.assertEqual(report.operating_system, "Windows 11 (amd64) version 10.0")
+        self.assertEqual(report.memory, "512000000 bytes (488 MiB)")
+        self.assertEqual(report.mods, {"xenon": "0.3.31", "dragonminez": "2.0.1"})
+        self.assertEqual(report.errors, ["Description: Mod loading error has occurred"])
+        self.assertIn("java.lang.Exception: Mod Loading has failed", report.stacktrace)
+
+
+class ParseLimitsTests(unittest.TestCase):
+    def test_errors_and_stacktrace_are_capped(self) -> None:
+        lines = []
+        for i in range(40):
+            lines.append(f"[12:00:{i:02d}] [Render thread/ERROR] [x/]: boom {i}")
+            lines.append(f"\tat com.example.Frame{i}.run(Frame.java:{i})")
+        report = parse_log("\n".join(lines))
+
+        self.assertEqual(len(report.errors), 15)
+        self.assertEqual(report.errors[-1], "[12:00:14] [Render thread/ERROR] [x/]: boom 14")
+        self.assertTrue(report.stacktrace.endswith("\n... (truncated)"))
+        self.assertEqual(len(report.stacktrace), MAX_STACKTRACE_LEN + len("\n... (truncated)"))
+
+    def test_header_fields_prefer_primary_pattern_over_earlier_fallback(self) -> None:
+        text = "\n".join(
+            [
+                "--fml.forgeVersion, 47.1.0",
+                "Forge mod loading, version 47.2.0, for MC 1.20.1",
+            ]
+        )
+        report = parse_log(text)
+
+        self.assertEqual(report.forge_version, "47.2.0")
+        self.assertEqual(report.mc_version, "1.20.1")
+
+
+class ParseChunkedInputTests(unittest.TestCase):
+    def test_byte_chunks_parse_the_same_as_text_at_any_boundary(self) -> None:
+        data = (CRASH_REPORT + "\n" + LATEST_LOG + "\nDescription: caf\u00e9 \u65e5\u672c\n").encode("utf-8")
+        expected = parse_log(data.decode("utf-8"))
+
+        for size in (1, 3, 64, 4096):
+            chunks = (data[i : i + size] for i in range(0, len(data), size))
+            self.assertEqual(parse_log(chunks), expected, size)
+        self.assertEqual(parse_log(data), expected)
+
+    def test_overlong_line_without_newline_is_cut_and_parsing_continues(self) -> None:
+        chunks = [
+            b"[12:00:00] [main/ERROR] [x/]: " + b"A" * 1000,
+            *[b"B" * 50_000 for _ in range(4)],
+            b"\n[12:00:00] [Render thread/FATAL] [x/]: after\n",
+        ]
+        report = parse_log(iter(chunks))
+
+        self.assertEqual(len(report.errors), 2)
+        self.assertEqual(len(report.errors[0]), MAX_LINE_CHARS)
+        self.assertIn("after", report.errors[1])
+
+    def test_parse_log_file_reads_in_chunks(self) -> None:
+        with tempfile.NamedTemporaryFile("wb", suffix=".log", delete=False) as file:
+            file.write(LATEST_LOG.encode("utf-8"))
+        try:
+            report = parse_log_file(file.name, chunk_size=7)
+        finally:
+            os.remove(file.name)
+
+        self.assertEqual(report, parse_log(LATEST_LOG))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+
+os.environ.setdefault("DISCORD_TOKEN", "dummy-discord-token")
+os.environ.setdefault("OPENAI_KEY", "dummy-openai-key")
+os.environ.setdefault("GH_APP_PRIVATE_KEY_PEM", "dummy-github-key")
+
+from bulmaai.cogs.log_parser import MAX_FILE_SIZE, LogParserCog
+from bulmaai.services.attachment_download import AttachmentDownloader
+from bulmaai.services.log_parsing import LogParseQueueFull
+from bulmaai.services.log_report_cache import LogReportCache
+from bulmaai.utils.log_parser import LogReport
+
+
+# Larger than PREVIEW_BYTES, so a full download is distinguishable from triage.
+LOG_BODY = b"[main/INFO]: ModLauncher running: args [--fml.mcVersion, 1.20.1]\n" * 1000
+
+
+class _FakeContent:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._pos = 0
+
+    async def read(self, n: int) -> bytes:
+        chunk = self._data[self._pos : self._pos + n]
+        self._pos += len(chunk)
+        return chunk
+
+
+class _FakeResponse:
+    def __init__(self, data: bytes) -> None:
+        self.content = _FakeContent(data)
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def release(self) -> None:
+        return None
+
+
+class _FakeSession:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self.gets = 0
+
+    async def get(self, url: str) -> _FakeResponse:
+        self.gets += 1
+        return _FakeResponse(self._data)
+
+    async def close(self) -> None:
+        return None
+
+
+def _cog(session: _FakeSession) -> LogParserCog:
+    cog = LogParserCog.__new__(LogParserCog)
+    cog._pending = {}
+    cog._parser = MagicMock()
+    cog._cache = LogReportCache()
+    cog._downloader = AttachmentDownloader(max_bytes=MAX_FILE_SIZE, session_factory=lambda: session)
+    return cog
+
+
+def _message(*attachments: SimpleNamespace) -> MagicMock:
+    message = MagicMock()
+    message.id = 42
+    message.author.bot = False
+    message.attachments = list(attachments)
+    message.reply = AsyncMock()
+    message.add_reaction = AsyncMock()
+    return message
+
+
+def _attachment(attachment_id: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=attachment_id,
+        filename="latest.log",
+        size=len(LOG_BODY),
+        url=f"https://cdn.example.test/{attachment_id}/latest.log",
+    )
+
+
+class LogParserCogTests(unittest.IsolatedAsyncioTestCase):
+    async def test_busy_parser_keeps_high_confidence_upload_pending(self) -> None:
+        cog = _cog(_FakeSession(LOG_BODY))
+        cog._parser.parse_file = AsyncMock(side_effect=LogParseQueueFull("busy"))
+        attachment = _attachment()
+        message = _message(attachment)
+
+        await LogParserCog.on_message(cog, message)
+
+        message.reply.assert_awaited_once()
+        self.assertIn("try again", message.reply.await_args.args[0])
+        self.assertEqual(cog._pending, {42: [attachment.url]})
+        message.add_reaction.assert_awaited_once()
+
+    async def test_reupload_is_answered_from_cache_without_a_full_download(self) -> None:
+        cog = _cog(_FakeSession(LOG_BODY))
+        cog._parser.parse_file = AsyncMock(return_value=LogReport(mc_version="1.20.1"))
+
+        await LogParserCog.on_message(cog, _message(_attachment(1)))
+        reupload = _message(_attachment(2))
+        await LogParserCog.on_message(cog, reupload)
+
+        cog._parser.parse_file.assert_awaited_once()
+        reupload.reply.assert_awaited_once()
+        self.assertEqual(cog._downloader.stats.full_downloads, 1)
+        self.assertEqual(cog._cache.stats.downloads_skipped, 1)
+        self.assertEqual(cog._cache.digest_for_attachment(2), cog._cache.digest_for_attachment(1))
+
+    async def test_known_attachment_is_answered_without_downloading(self) -> None:
+        session = _FakeSession(LOG_BODY)
+        cog = _cog(session)
+        cog._parser.parse_file = AsyncMock(return_value=LogReport(mc_version="1.20.1"))
+        attachment = _attachment()
+
+        await LogParserCog.on_message(cog, _message(attachment))
+        await LogParserCog.on_message(cog, _message(attachment))
+
+        self.assertEqual(session.gets, 1)
+        cog._parser.parse_file.assert_awaited_once()
+        self.assertEqual(cog._cache.stats.downloads_skipped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+import unittest
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+from bulmaai.utils.log_parser import LogReport, parse_log, parse_log_file
+
+
+CORPUS_DIR = Path(__file__).resolve().parent / "fixtures" / "log_corpus"
+EXPECTED: dict[str, dict[str, Any]] = json.loads((CORPUS_DIR / "expected.json").read_text(encoding="utf-8"))
+
+# Each corpus file is also padded to this size to check scaling.
+SCALED_BYTES = 4 * 1024 * 1024
+# Generous enough for slow CI; quadratic behaviour blows far past it.
+SCALED_PARSE_BUDGET_SECONDS = 5.0
+# parse_log_file reads 1 MiB chunks, so peak memory must not follow file size.
+SCALED_PEAK_MEMORY_BYTES = 16 * 1024 * 1024
+
+_FILLER = (
+    "[02Mar2024 18:41:{s:02d}.{n:03d}] [Render thread/INFO] [net.minecraft.client.Minecraft/]: Loaded {n} advancements",
+    "[02Mar2024 18:41:{s:02d}.{n:03d}] [Worker-Main-{w}/INFO] [net.minecraft.server.packs.resources/]: Reloading ResourceManager: vanilla, mod_resources",
+    "[02Mar2024 18:41:{s:02d}.{n:03d}] [Render thread/WARN] [net.minecraft.client.sounds.SoundEngine/]: Missing sound for event: dragonminez:aura_{n}",
+    "[02Mar2024 18:41:{s:02d}.{n:03d}] [modloading-worker-0/DEBUG] [net.minecraftforge.registries.GameData/REGISTRIES]: Registering {n} entries",
+)
+
+# One line per regex that used to (or could) backtrack badly. Lines stay under
+# MAX_LINE_CHARS so the parser sees them whole.
+ADVERSARIAL_LINES = {
+    "crash report table": "  |" + " " * 60_000,
+    "log table": "|" + "a" * 60_000,
+    "mod entry, Loading": "version: " + "Loading a " * 6_000,
+    "mod entry, Mod ID": "version: " + "Mod ID: x " * 6_000,
+    "mod discovery": "found valid mod file " + "x with {a} mods - versions {" * 1_500,
+    "simple mod list": "  a" + " " * 60_000,
+    "os fallback": "; OS a " * 8_000 + "xarch",
+    "dragonminez fallback": "dragonminez " * 5_000 + "-",
+    "error line": "[" + "a/" * 15_000 + " [b/ERROR" + "]" * 20_000,
+    "stacktrace start": "Exception " + "java.a " * 8_000,
+    "memory": "Memory: " + " " * 60_000,
+}
+ADVERSARIAL_BUDGET_SECONDS = 1.0
+
+
+def score_report(report: LogReport, expected: dict[str, Any]) -> dict[str, bool]:
+    """Return field name -> whether *report* extracted it correctly."""
+    results: dict[str, bool] = {}
+    for name, value in expected.items():
+        if name == "error_count":
+            results[name] = len(report.errors) == value
+        elif name == "stacktrace_contains":
+            results[name] = all(part in (report.stacktrace or "") for part in value)
+        else:
+            results[name] = getattr(report, name) == value
+    return results
+
+
+def _scaled_copy(path: Path, target_bytes: int) -> str:
+    """Write *path* plus filler lines up to *target_bytes* to a temp file."""
+    data = path.read_bytes()
+    with tempfile.NamedTemporaryFile("wb", suffix=path.suffix, delete=False) as file:
+        file.write(data)
+        if not data.endswith(b"\n"):
+            file.write(b"\n")
+        size = len(data)
+        n = 0
+        while size < target_bytes:
+            n += 1
+            line = _FILLER[n % len(_FILLER)].format(s=n % 60, n=n % 1000, w=n % 8).encode() + b"\n"
+            file.write(line)
+            size += len(line)
+    return file.name
+
+
+def _time_adversarial_lines(conn: Connection) -> None:
+    # Pipe sends are synchronous; a Queue's feeder thread would never get the
+    # GIL back while a runaway regex is matching.
+    for name, line in ADVERSARIAL_LINES.items():
+        conn.send((name, None))
+        start = time.perf_counter()
+        parse_log(line + "\n")
+        conn.send((name, time.perf_counter() - start))
+    conn.close()
+
+
+class LogParserCorpusTests(unittest.TestCase):
+    def test_corpus_fields_are_extracted(self) -> None:
+        for filename, case in EXPECTED.items():
+            with self.subTest(filename=filename):
+                report = parse_log_file(str(CORPUS_DIR / filename))
+                results = score_report(report, case["fields"])
+                regressions = [
+                    name for name, ok in results.items() if not ok and name not in case["known_gaps"]
+                ]
+                self.assertEqual(regressions, [])
+
+    def test_scaled_corpus_parses_in_bounded_time_and_memory(self) -> None:
+        for filename in EXPECTED:
+            with self.subTest(filename=filename):
+                source = CORPUS_DIR / filename
+                scaled = _scaled_copy(source, SCALED_BYTES)
+                try:
+                    start = time.perf_counter()
+                    report = parse_log_file(scaled)
+                    elapsed = time.perf_counter() - start
+
+                    tracemalloc.start()
+                    try:
+                        parse_log_file(scaled)
+                        _, peak = tracemalloc.get_traced_memory()
+                    finally:
+                        tracemalloc.stop()
+                finally:
+                    os.remove(scaled)
+
+                self.assertEqual(report, parse_log_file(str(source)))
+                self.assertLess(elapsed, SCALED_PARSE_BUDGET_SECONDS)
+                self.assertLess(peak, SCALED_PEAK_MEMORY_BYTES)
+
+    def test_regexes_do_not_backtrack_catastrophically(self) -> None:
+        # A runaway regex cannot be interrupted in-process, so the lines are
+        # parsed in a child that is killed if it overruns.
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_time_adversarial_lines, args=(sender,), daemon=True)
+        process.start()
+        sender.close()
+        current = "process start-up"
+        slow: dict[str, float] = {}
+        try:
+            for _ in range(len(ADVERSARIAL_LINES) * 2):
+                if not receiver.poll(ADVERSARIAL_BUDGET_SECONDS * 10 + 20):
+                    self.fail(f"parsing the adversarial {current!r} line did not finish")
+                name, elapsed = receiver.recv()
+                current = name
+                if elapsed is not None and elapsed > ADVERSARIAL_BUDGET_SECONDS:
+                    slow[name] = round(elapsed, 2)
+        finally:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+        self.assertEqual(slow, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from bulmaai.services.log_parsing import (
+    LogParseQueueFull,
+    LogParseTimeout,
+    LogParsingService,
+)
+from bulmaai.utils.log_parser import LogReport
+
+
+def _thread_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1)
+
+
+class LogParsingServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_parses_in_worker_process(self) -> None:
+        service = LogParsingService(max_workers=1, max_queue_size=0)
+        try:
+            report = await service.parse("ModLauncher running: args [--fml.mcVersion, 1.20.1]")
+        finally:
+            service.close()
+
+        self.assertTrue(report.is_forge)
+        self.assertEqual(report.mc_version, "1.20.1")
+        self.assertEqual(service.stats.completed, 1)
+
+    async def test_parse_file_streams_the_log_in_the_worker(self) -> None:
+        with tempfile.NamedTemporaryFile("wb", suffix=".log", delete=False) as file:
+            file.write(b"ModLauncher running: args [--fml.mcVersion, 1.20.1]\n")
+        service = LogParsingService(max_workers=1, max_queue_size=0)
+        try:
+            report = await service.parse_file(file.name)
+        finally:
+            service.close()
+            os.remove(file.name)
+
+        self.assertEqual(report.mc_version, "1.20.1")
+        self.assertEqual(service.stats.completed, 1)
+
+    async def test_rejects_jobs_beyond_workers_plus_queue(self) -> None:
+        release = threading.Event()
+
+        def blocking_parse(text: str) -> LogReport:
+            release.wait(5)
+            return LogReport(mc_version=text)
+
+        service = LogParsingService(
+            max_workers=1,
+            max_queue_size=1,
+            parse_func=blocking_parse,
+            executor_factory=_thread_executor,
+        )
+        running = asyncio.create_task(service.parse("1.20.1"))
+        queued = asyncio.create_task(service.parse("1.19.2"))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(service.queue_size, 1)
+        with self.assertRaises(LogParseQueueFull):
+            await service.parse("1.18.2")
+
+        release.set()
+        reports = await asyncio.gather(running, queued)
+        service.close()
+
+        self.assertEqual([r.mc_version for r in reports], ["1.20.1", "1.19.2"])
+        self.assertEqual(service.stats.rejected, 1)
+        self.assertEqual(service.stats.completed, 2)
+        self.assertGreater(service.stats.queue_wait_seconds_max, 0)
+
+    async def test_close_wakes_jobs_waiting_for_a_worker(self) -> None:
+        release = threading.Event()
+
+        def blocking_parse(text: str) -> LogReport:
+            release.wait(5)
+            return LogReport(mc_version=text)
+
+        service = LogParsingService(
+            max_workers=1,
+            max_queue_size=1,
+            parse_func=blocking_parse,
+            executor_factory=_thread_executor,
+        )
+        running = asyncio.create_task(service.parse("1.20.1"))
+        queued = asyncio.create_task(service.parse("1.19.2"))
+        await asyncio.sleep(0.05)
+
+        service.close()
+        with self.assertRaisesRegex(RuntimeError, "log parsing service closed"):
+            await asyncio.wait_for(queued, timeout=1)
+        release.set()
+        await asyncio.gather(running, return_exceptions=True)
+
+        self.assertEqual(service.in_flight, 0)
+
+    async def test_timeout_replaces_worker_and_next_job_still_runs(self) -> None:
+        def parse(text: str) -> LogReport:
+            if text == "slow":
+                time.sleep(0.5)
+            return LogReport(mc_version=text)
+
+        created: list[ThreadPoolExecutor] = []
+
+        def factory() -> ThreadPoolExecutor:
+            executor = _thread_executor()
+            created.append(executor)
+            return executor
+
+        service = LogParsingService(
+            max_workers=1,
+            max_queue_size=0,
+            timeout_seconds=0.1,
+            parse_func=parse,
+            executor_factory=factory,
+        )
+        with self.assertRaises(LogParseTimeout):
+            await service.parse("slow")
+        report = await service.parse("1.20.1")
+        service.close()
+
+        self.assertEqual(report.mc_version, "1.20.1")
+        self.assertEqual(service.stats.timed_out, 1)
+        self.assertEqual(len(created), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
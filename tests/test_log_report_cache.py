@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from bulmaai.services.log_report_cache import (
+    LogReportCache,
+    content_digest,
+    report_from_dict,
+    report_to_dict,
+)
+from bulmaai.utils.log_parser import LogReport
+
+
+class LogReportCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_lookup_counts_hits_and_misses(self) -> None:
+        cache = LogReportCache()
+        digest = content_digest(b"latest.log contents")
+
+        self.assertIsNone(await cache.lookup(digest))
+        await cache.store(digest, LogReport(mc_version="1.20.1"), filename="latest.log")
+        entry = await cache.lookup(digest)
+
+        self.assertEqual(entry.report.mc_version, "1.20.1")
+        self.assertEqual(entry.filename, "latest.log")
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+
+    async def test_evicts_least_recently_used_entry(self) -> None:
+        cache = LogReportCache(max_entries=2)
+        cache.put("a", LogReport())
+        cache.put("b", LogReport())
+        cache.get("a")
+        cache.put("c", LogReport())
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats.evictions, 1)
+
+    async def test_expired_entries_are_dropped(self) -> None:
+        cache = LogReportCache(ttl_seconds=60)
+        with patch("bulmaai.services.log_report_cache.time.monotonic", return_value=1000.0):
+            cache.put("a", LogReport())
+        with patch("bulmaai.services.log_report_cache.time.monotonic", return_value=1061.0):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    async def test_persistent_hit_populates_memory(self) -> None:
+        cache = LogReportCache(persist=True)
+        stored = LogReport(java_version="17.0.8", mods={"dragonminez": "2.0.1"})
+        with patch(
+            "bulmaai.services.log_report_cache.load_persisted_log_report",
+            AsyncMock(return_value=stored),
+        ) as load:
+            first = await cache.lookup("digest")
+            second = await cache.lookup("digest")
+
+        load.assert_awaited_once()
+        self.assertEqual(first.report, stored)
+        self.assertIs(second, first)
+        self.assertEqual(cache.stats.persistent_hits, 1)
+        self.assertEqual(cache.stats.hits, 2)
+
+    async def test_attachment_alias_resolves_digest(self) -> None:
+        cache = LogReportCache()
+        cache.remember_attachment(123, "digest")
+        self.assertEqual(cache.digest_for_attachment(123), "digest")
+        self.assertIsNone(cache.digest_for_attachment(456))
+
+    async def test_preview_alias_is_keyed_by_size_and_preview_hash(self) -> None:
+        cache = LogReportCache()
+        cache.remember_preview(1000, "preview", "digest")
+        self.assertEqual(cache.digest_for_preview(1000, "preview"), "digest")
+        self.assertIsNone(cache.digest_for_preview(1001, "preview"))
+
+    def test_report_round_trips_through_dict(self) -> None:
+        report = LogReport(mc_version="1.20.1", errors=["boom"], mods={"a": "1"}, is_forge=True)
+        self.assertEqual(report_from_dict(report_to_dict(report)), report)
+
+
+if __name__ == "__main__":
+    unittest.main()
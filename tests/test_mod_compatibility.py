@@ -0,0 +1,108 @@
+import unittest
+
+from bulmaai.utils.log_parser import LogReport
+from bulmaai.utils.mod_compatibility import (
+    VersionRange,
+    compatibility_from_dict,
+    default_mod_compatibility_index,
+    parse_version,
+)
+
+
+_DATABASE = {
+    "releases": [
+        {
+            "dragonminez": ">=2.0.0,<3.0.0",
+            "minecraft": "==1.20.1",
+            "forge": ">=47.1.0",
+            "java": ">=17",
+            "mods": {"geckolib": ">=4.2"},
+        }
+    ],
+    "incompatible": [
+        {"mods": {"optifine": "*"}, "reason": "no optifine"},
+        {"mods": {"oculus": "<1.6.4", "embeddium": "*"}, "reason": "old oculus"},
+    ],
+}
+
+
+class VersionRangeTests(unittest.TestCase):
+    def test_parse_version_takes_leading_numeric_components(self) -> None:
+        self.assertEqual(parse_version("17.0.8_372"), (17, 0, 8, 372))
+        self.assertEqual(parse_version("4.4.7-beta"), (4, 4, 7))
+        self.assertEqual(parse_version("1.20.0"), (1, 20))
+        self.assertIsNone(parse_version("unknown"))
+
+    def test_ranges_combine_clauses(self) -> None:
+        allowed = VersionRange.parse(">=47.1.0,<48")
+
+        self.assertTrue(allowed.contains(parse_version("47.2.0")))
+        self.assertTrue(allowed.contains(parse_version("47.1")))
+        self.assertFalse(allowed.contains(parse_version("48.0.1")))
+        self.assertTrue(VersionRange.parse("*").contains((0,)))
+        with self.assertRaises(ValueError):
+            VersionRange.parse(">=banana")
+
+
+class ModCompatibilityIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = compatibility_from_dict(_DATABASE)
+
+    def test_clean_pack_has_no_issues(self) -> None:
+        report = LogReport(
+            mc_version="1.20.1",
+            forge_version="47.2.0",
+            java_version="17.0.8",
+            dragonminez_version="2.0.1",
+            mods={"dragonminez": "2.0.1", "geckolib": "4.4.7", "oculus": "1.6.9", "embeddium": "0.3.0"},
+        )
+
+        self.assertEqual(self.index.check(report), [])
+
+    def test_reports_conflicts_platform_and_dependency_problems(self) -> None:
+        report = LogReport(
+            mc_version="1.20.1",
+            forge_version="46.0.14",
+            java_version="17.0.8",
+            dragonminez_version="2.0.1",
+            mods={"dragonminez": "2.0.1", "OptiFine": "HD_U_I6", "oculus": "1.6.0", "embeddium": "0.3.0"},
+        )
+
+        messages = [issue.message for issue in self.index.check(report)]
+
+        self.assertEqual(messages[:2], ["no optifine", "old oculus"])
+        self.assertIn("needs Forge >=47.1.0, found 46.0.14", messages[2])
+        self.assertIn("requires `geckolib` >=4.2", messages[3])
+
+    def test_unknown_dragonminez_release_only_checks_conflicts(self) -> None:
+        report = LogReport(dragonminez_version="1.3.0", forge_version="36.2.0", mods={"optifine": "x"})
+
+        self.assertEqual([issue.message for issue in self.index.check(report)], ["no optifine"])
+
+    def test_dependencies_are_not_checked_without_a_parsed_mod_list(self) -> None:
+        report = LogReport(mc_version="1.20.1", forge_version="47.2.0", dragonminez_version="2.0.1", mods={})
+
+        self.assertEqual(self.index.check(report), [])
+
+    def test_unparseable_dependency_version_counts_as_missing(self) -> None:
+        report = LogReport(
+            mc_version="1.20.1",
+            forge_version="47.2.0",
+            dragonminez_version="2.0.1",
+            mods={"dragonminez": "2.0.1", "geckolib": "[MISSING]"},
+        )
+
+        messages = [issue.message for issue in self.index.check(report)]
+
+        self.assertEqual(len(messages), 1)
+        self.assertIn("requires `geckolib` >=4.2", messages[0])
+
+    def test_bundled_database_loads(self) -> None:
+        index = default_mod_compatibility_index()
+
+        self.assertIsNotNone(index.release_for("2.0.1"))
+        self.assertTrue(index.incompatibilities)
+
+
+if __name__ == "__main__":
+    unittest.main()
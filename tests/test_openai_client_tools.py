@@ -1,3 +1,4 @@
+import asyncio
 import os
 import types
 import unittest
@@ -9,12 +10,17 @@ os.environ.setdefault("OPENAI_KEY", "dummy-openai-key")
 os.environ.setdefault("GH_APP_PRIVATE_KEY_PEM", "dummy-github-key")
 
 from bulmaai.services.openai_client import (
+    _ReplyStream,
     _build_file_search_tool,
+    client,
     _build_openai_metadata,
+    _create_response,
+    _handle_tools_and_final_reply,
     _select_reasoning_effort,
     get_schemas,
     run_support_agent,
 )
+from bulmaai.services.support_answer_cache import SupportAnswerCache
 
 
 class OpenAIClientToolTests(unittest.IsolatedAsyncioTestCase):
@@ -149,6 +155,310 @@ class OpenAIClientToolTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(trace.reasoning_tokens, 12)
         self.assertEqual(trace.reply_text, "Use the configured form key.")
 
+    async def test_streamed_support_reply_forwards_deltas_and_records_first_token(self) -> None:
+        final = types.SimpleNamespace(id="resp_stream", output=[], output_text="Hello there.", usage=None)
+
+        async def events():
+            yield types.SimpleNamespace(type="response.created")
+            yield types.SimpleNamespace(type="response.output_text.delta", delta="Hello")
+            yield types.SimpleNamespace(type="response.output_text.delta", delta=" there.")
+            yield types.SimpleNamespace(type="response.completed", response=final)
+
+        deltas: list[str] = []
+
+        async def on_text_delta(delta: str) -> None:
+            deltas.append(delta)
+
+        create = AsyncMock(return_value=events())
+        with (
+            patch.object(client.responses, "create", create),
+            patch("bulmaai.services.openai_client.record_support_ai_trace", new_callable=AsyncMock) as record_trace,
+        ):
+            result = await run_support_agent(
+                messages=[{"role": "user", "content": "Hi", "speaker_id": "123"}],
+                enabled_tools=[],
+                language_hint="en",
+                user_id=123,
+                channel_id=456,
+                settings=types.SimpleNamespace(
+                    openai_support_model="gpt-5-mini",
+                    openai_model="gpt-5-mini",
+                    openai_support_max_output_tokens=100,
+                    ai_support_timeout_seconds=1,
+                    openai_support_reasoning_effort="medium",
+                    openai_support_vector_store_ids=(),
+                ),
+                on_text_delta=on_text_delta,
+            )
+
+        self.assertTrue(create.await_args.kwargs["stream"])
+        self.assertEqual(deltas, ["Hello", " there."])
+        self.assertEqual(result["reply"], "Hello there.")
+        self.assertEqual(result["response_id"], "resp_stream")
+        trace = record_trace.await_args.args[0]
+        self.assertIsNotNone(trace.first_token_ms)
+        self.assertLessEqual(trace.first_token_ms, trace.latency_ms)
+
+    async def test_streamed_tool_rounds_are_separated_and_recorded_as_posted(self) -> None:
+        async def lookup(**kwargs):
+            return {"version": "1.4.2"}
+
+        call = types.SimpleNamespace(type="function_call", name="lookup", arguments="{}", call_id="call_a")
+        first = types.SimpleNamespace(id="resp_1", output=[call], output_text="Let me check.", usage=None)
+        final = types.SimpleNamespace(id="resp_2", output=[], output_text="Update to 1.4.2.", usage=None)
+
+        def events(text: str, response):
+            async def stream():
+                yield types.SimpleNamespace(type="response.output_text.delta", delta=text)
+                yield types.SimpleNamespace(type="response.completed", response=response)
+
+            return stream()
+
+        deltas: list[str] = []
+
+        async def on_text_delta(delta: str) -> None:
+            deltas.append(delta)
+
+        create = AsyncMock(side_effect=[events("Let me check.", first), events("Update to 1.4.2.", final)])
+        with (
+            patch.object(client.responses, "create", create),
+            patch("bulmaai.services.openai_client.tools_registry.get_func", return_value=lookup),
+            patch("bulmaai.services.openai_client.record_support_ai_trace", new_callable=AsyncMock) as record_trace,
+        ):
+            reply_stream = _ReplyStream(on_text_delta)
+            response = await _create_response(timeout_seconds=1, reply_stream=reply_stream, model="gpt-4.1-mini")
+            result = await _handle_tools_and_final_reply(
+                response=response,
+                base_input=[],
+                base_tool_results=None,
+                system_prompt="",
+                model="gpt-4.1-mini",
+                lang="en",
+                settings=types.SimpleNamespace(
+                    openai_support_max_output_tokens=100,
+                    ai_support_timeout_seconds=1,
+                    openai_support_reasoning_effort="medium",
+                ),
+                user_id=1,
+                channel_id=2,
+                reply_stream=reply_stream,
+                trace_context={"started_at": 0.0, "workflow": "support_question", "model": "gpt-4.1-mini"},
+            )
+
+        self.assertEqual(deltas, ["Let me check.", "\n\nUpdate to 1.4.2."])
+        self.assertEqual(result["reply"], "Let me check.\n\nUpdate to 1.4.2.")
+        self.assertEqual(record_trace.await_args.args[0].reply_text, result["reply"])
+
+    async def test_tool_calls_run_concurrently_and_failures_become_error_outputs(self) -> None:
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_tool(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"value": kwargs["value"]}
+
+        async def broken_tool(**kwargs):
+            raise ValueError("boom")
+
+        async def hung_tool(**kwargs):
+            await asyncio.Event().wait()
+
+        tools = {"slow": slow_tool, "broken": broken_tool, "hung": hung_tool}
+        calls = [
+            types.SimpleNamespace(type="function_call", name="slow", arguments='{"value": 1}'),
+            types.SimpleNamespace(type="function_call", name="broken", arguments="{}"),
+            types.SimpleNamespace(type="function_call", name="hung", arguments="{}"),
+            types.SimpleNamespace(type="function_call", name="slow", arguments='{"value": 2}'),
+        ]
+        followup = types.SimpleNamespace(id="resp_2", output=[], output_text="Done.")
+
+        with (
+            patch("bulmaai.services.openai_client.TOOL_CALL_TIMEOUT_SECONDS", 0.05),
+            patch("bulmaai.services.openai_client.tools_registry.get_func", side_effect=lambda name, bot_context=None: tools[name]),
+            patch("bulmaai.services.openai_client._create_response", new_callable=AsyncMock, return_value=followup) as create_response,
+        ):
+            result = await _handle_tools_and_final_reply(
+                response=types.SimpleNamespace(output=calls),
+                base_input=[],
+                base_tool_results=None,
+                system_prompt="",
+                model="gpt-4.1-mini",
+                lang="en",
+                settings=types.SimpleNamespace(
+                    openai_support_max_output_tokens=100,
+                    ai_support_timeout_seconds=1,
+                    openai_support_reasoning_effort="medium",
+                ),
+                user_id=1,
+                channel_id=2,
+            )
+
+        self.assertEqual(result["reply"], "Done.")
+        self.assertEqual(max_in_flight, 2)
+        self.assertEqual([r["name"] for r in result["tool_results"]], ["slow", "broken", "hung", "slow"])
+        outputs = [r["output"] for r in result["tool_results"]]
+        self.assertEqual(outputs[0], {"value": 1})
+        self.assertIn("ValueError", outputs[1]["error"])
+        self.assertIn("timed out", outputs[2]["error"])
+        self.assertEqual(outputs[3], {"value": 2})
+        followup_input = create_response.await_args.kwargs["input"]
+        self.assertEqual([item["content"].split()[1] for item in followup_input], ["slow", "broken", "hung", "slow"])
+
+    async def test_tool_rounds_chain_with_previous_response_id_and_send_only_outputs(self) -> None:
+        async def lookup(**kwargs):
+            return {"version": "1.4.2"} if kwargs.get("what") == "version" else {"notes": "fixed in 1.4.2"}
+
+        def call(call_id: str, what: str):
+            return types.SimpleNamespace(type="function_call", name="lookup", arguments=f'{{"what": "{what}"}}', call_id=call_id)
+
+        responses = [
+            types.SimpleNamespace(id="resp_2", output=[call("call_b", "notes")], output_text=""),
+            types.SimpleNamespace(id="resp_3", output=[], output_text="Update to 1.4.2."),
+        ]
+        tools = [{"type": "function", "name": "lookup"}]
+
+        with (
+            patch("bulmaai.services.openai_client.tools_registry.get_func", return_value=lookup),
+            patch("bulmaai.services.openai_client._create_response", new_callable=AsyncMock, side_effect=responses) as create_response,
+            patch("bulmaai.services.openai_client.record_support_ai_trace", new_callable=AsyncMock) as record_trace,
+        ):
+            result = await _handle_tools_and_final_reply(
+                response=types.SimpleNamespace(id="resp_1", output=[call("call_a", "version")]),
+                base_input=[{"role": "user", "content": "x" * 5000}],
+                base_tool_results=None,
+                system_prompt="prompt",
+                model="gpt-4.1-mini",
+                lang="en",
+                settings=types.SimpleNamespace(
+                    openai_support_max_output_tokens=100,
+                    ai_support_timeout_seconds=1,
+                    openai_support_reasoning_effort="medium",
+                    openai_support_store_responses=True,
+                ),
+                user_id=1,
+                channel_id=2,
+                tools=tools,
+                trace_context={"started_at": 0.0, "workflow": "support_question", "model": "gpt-4.1-mini"},
+            )
+
+        self.assertEqual(result["reply"], "Update to 1.4.2.")
+        self.assertEqual([r["output"] for r in result["tool_results"]], [{"version": "1.4.2"}, {"notes": "fixed in 1.4.2"}])
+        first, second = (c.kwargs for c in create_response.await_args_list)
+        self.assertEqual(first["previous_response_id"], "resp_1")
+        self.assertEqual(
+            first["input"],
+            [{"type": "function_call_output", "call_id": "call_a", "output": '{"version": "1.4.2"}'}],
+        )
+        self.assertEqual(first["tools"], tools)
+        self.assertEqual(second["previous_response_id"], "resp_2")
+        self.assertEqual(second["input"][0]["call_id"], "call_b")
+        self.assertEqual(record_trace.await_args.args[0].previous_response_id, "resp_2")
+
+    async def test_tool_loop_stops_at_round_limit(self) -> None:
+        async def lookup(**kwargs):
+            return {}
+
+        def looping_response(index: int):
+            return types.SimpleNamespace(
+                id=f"resp_{index}",
+                output=[types.SimpleNamespace(type="function_call", name="lookup", arguments="{}", call_id=f"c{index}")],
+                output_text="",
+            )
+
+        with (
+            patch("bulmaai.services.openai_client.MAX_TOOL_ROUNDS", 2),
+            patch("bulmaai.services.openai_client.tools_registry.get_func", return_value=lookup),
+            patch(
+                "bulmaai.services.openai_client._create_response",
+                new_callable=AsyncMock,
+                side_effect=[looping_response(i) for i in range(2, 10)],
+            ) as create_response,
+        ):
+            result = await _handle_tools_and_final_reply(
+                response=looping_response(1),
+                base_input=[],
+                base_tool_results=None,
+                system_prompt="",
+                model="gpt-4.1-mini",
+                lang="en",
+                settings=types.SimpleNamespace(
+                    openai_support_max_output_tokens=100,
+                    ai_support_timeout_seconds=1,
+                    openai_support_reasoning_effort="medium",
+                ),
+                user_id=1,
+                channel_id=2,
+            )
+
+        self.assertEqual(create_response.await_count, 2)
+        self.assertEqual(len(result["tool_results"]), 2)
+        self.assertEqual(result["reply"], "(no reply)")
+
+    async def test_repeated_standalone_question_is_answered_from_cache(self) -> None:
+        settings = types.SimpleNamespace(
+            openai_support_model="gpt-5-mini",
+            openai_model="gpt-5-mini",
+            openai_support_max_output_tokens=100,
+            ai_support_timeout_seconds=1,
+            openai_support_reasoning_effort="medium",
+            openai_support_fast_reasoning_effort="low",
+            openai_support_vector_store_ids=("vs_docs",),
+            ai_support_answer_cache_enabled=True,
+        )
+
+        def list_files(**kwargs):
+            async def files():
+                yield types.SimpleNamespace(id="file-a", created_at=100, status="completed")
+
+            return files()
+
+        answer = types.SimpleNamespace(id="resp_1", output=[], output_text="Install Forge 47.2 first.")
+
+        async def ask(text: str) -> dict:
+            return await run_support_agent(
+                messages=[{"role": "user", "content": text, "speaker_id": "123"}],
+                enabled_tools=[],
+                language_hint="en",
+                user_id=123,
+                channel_id=456,
+                settings=settings,
+            )
+
+        with (
+            patch("bulmaai.services.openai_client.support_answer_cache", SupportAnswerCache()),
+            patch.object(client.vector_stores.files, "list", list_files),
+            patch(
+                "bulmaai.services.openai_client._create_response",
+                new_callable=AsyncMock,
+                return_value=answer,
+            ) as create_response,
+            patch("bulmaai.services.openai_client.record_support_ai_trace", new_callable=AsyncMock) as record_trace,
+        ):
+            first = await ask("How do I install the mod?")
+            second = await ask("how do i install the mod")
+            contextual = await run_support_agent(
+                messages=[
+                    {"role": "user", "content": "How do I install the mod?", "speaker_id": "123"},
+                    {"role": "assistant", "content": "Which launcher?"},
+                    {"role": "user", "content": "How do I install the mod?", "speaker_id": "123"},
+                ],
+                enabled_tools=[],
+                language_hint="en",
+                user_id=123,
+                channel_id=456,
+                settings=settings,
+            )
+
+        self.assertEqual(first["reply"], second["reply"])
+        self.assertEqual(contextual["reply"], "Install Forge 47.2 first.")
+        self.assertEqual(create_response.await_count, 2)
+        traces = [call.args[0] for call in record_trace.await_args_list]
+        self.assertEqual([trace.answer_cache for trace in traces], [None, "exact", None])
+
     async def test_ticket_support_agent_uses_openai_conversation_state(self) -> None:
         with (
             patch(
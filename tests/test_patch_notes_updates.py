@@ -64,6 +64,7 @@ class PatchNotesPollTests(unittest.IsolatedAsyncioTestCase):
         cog = PatchNotesUpdatesCog.__new__(PatchNotesUpdatesCog)
         cog.bot = SimpleNamespace()
         cog.gh = SimpleNamespace(get_file=AsyncMock(return_value=(file_content, "blobsha")))
+        cog._last_blob_sha = None
         cog._announced: list[str] = []
 
         async def fake_announce(summary: str) -> None:
@@ -147,6 +148,19 @@ class PatchNotesPollTests(unittest.IsolatedAsyncioTestCase):
         upsert.assert_not_awaited()
         self.assertEqual(cog._announced, [])
 
+    async def test_unchanged_blob_skips_state_lookup(self) -> None:
+        cog = self._cog(file_content="# Patch Notes\n- First entry\n")
+        get_state = AsyncMock(return_value=None)
+
+        with (
+            patch("bulmaai.cogs.patch_notes_updates.get_patch_notes_state", new=get_state),
+            patch("bulmaai.cogs.patch_notes_updates.upsert_patch_notes_state", new=AsyncMock()),
+        ):
+            await cog._poll_once()
+            await cog._poll_once()
+
+        get_state.assert_awaited_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -140,6 +140,28 @@ class FakeGitHub:
             }
         )
 
+    async def get_whitelist_snapshot(self, branch):
+        base_text, base_sha = await self.get_whitelist_file(ref=self.base_branch)
+        branch_text, branch_sha = await self.get_whitelist_file(ref=branch)
+        return SimpleNamespace(
+            branch=branch,
+            base_text=base_text,
+            base_blob_oid=base_sha,
+            branch_text=branch_text,
+            head_oid=branch_sha,
+        )
+
+    async def commit_whitelist_and_open_pr(self, snapshot, *, new_text, message, title, body):
+        self.created_branches.append((snapshot.branch, self.base_branch))
+        if new_text is not None:
+            await self.put_whitelist_file(
+                branch=snapshot.branch,
+                new_text=new_text,
+                sha=snapshot.head_oid,
+                message=message,
+            )
+        return await self.create_or_get_pr(head_branch=snapshot.branch, title=title, body=body)
+
     async def create_pr(self, *, head_branch, title, body):
         return {"number": 12, "html_url": "https://example.test/pr/12"}
 
@@ -551,7 +573,8 @@ class PatreonWhitelistFlowTests(unittest.IsolatedAsyncioTestCase):
             )
 
         self.assertEqual(cog.gh.merged_prs, [12])
-        self.assertEqual(cog.gh.removed_branches, ["patreon/user-456"])
+        self.assertEqual(len(cog.gh.removed_branches), 1)
+        self.assertTrue(cog.gh.removed_branches[0].startswith("patreon/whitelist-batch-"))
         self.assertEqual(upsert_grant.await_args.args[0].kind, PatreonGrantKind.SELF)
         self.assertIn("approved automatically", destination.sent[-1][0][0])
 
@@ -722,6 +745,17 @@ class PatreonWhitelistFlowTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(destination.sent[-1][0][0], "`NewTester` is already whitelisted. Nothing to do.")
         self.assertEqual(staff_channel.sent, [])
 
+    async def test_whitelisted_answers_come_from_the_cached_index(self) -> None:
+        cog = PatreonWhitelistFlowCog.__new__(PatreonWhitelistFlowCog)
+        cog.bot = SimpleNamespace(settings=self._settings())
+        cog.gh = FakeGitHub()
+        cog.gh.get_whitelist_file = AsyncMock(return_value=("ExistingUser\nNewTester\n", "sha-1"))
+
+        self.assertTrue(await cog._is_whitelisted("NewTester"))
+        self.assertTrue(await cog._is_whitelisted("newtester"))
+        self.assertFalse(await cog._is_whitelisted("Someone"))
+        cog.gh.get_whitelist_file.assert_awaited_once()
+
     async def test_auto_approval_falls_back_to_staff_review_when_github_refuses_merge(self) -> None:
         staff_channel = FakeChannel()
         author = SimpleNamespace(
@@ -890,7 +924,7 @@ class PatreonWhitelistFlowTests(unittest.IsolatedAsyncioTestCase):
             interaction = FakeButtonInteraction(user=author)
             await update_view.children[0].callback(interaction)
 
-        self.assertEqual(cog.gh.created_branches, [("patreon/user-456", "main")])
+        self.assertEqual(len(cog.gh.created_branches), 1)
         self.assertEqual(cog.gh.put_calls[0]["new_text"], "ExistingUser\nNewTester\n")
         self.assertEqual(cog.gh.put_calls[0]["message"], "Update beta tester: OldTester -> NewTester")
         self.assertEqual(cog.gh.merged_prs, [12])
@@ -1213,10 +1247,11 @@ class PatreonWhitelistFlowTests(unittest.IsolatedAsyncioTestCase):
 
         await cog._remove_whitelist_grants(456, grants, "declined_patron")
 
-        self.assertEqual(cog.gh.created_branches, [("patreon/remove-456", "main")])
+        batch_branch = cog.gh.created_branches[0][0]
+        self.assertTrue(batch_branch.startswith("patreon/whitelist-batch-"))
         self.assertEqual(cog.gh.put_calls[0]["new_text"], "KeepMe\n")
         self.assertEqual(cog.gh.merged_prs, [12])
-        self.assertEqual(cog.gh.removed_branches, ["patreon/remove-456"])
+        self.assertEqual(cog.gh.removed_branches, [batch_branch])
 
     async def test_beta_access_rejects_invalid_minecraft_username_immediately(self) -> None:
         bot = SimpleNamespace(settings=SimpleNamespace(patreon_access_role_ids=(123,)))
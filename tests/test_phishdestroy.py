@@ -40,9 +40,11 @@ class PhishDestroyClientTests(unittest.IsolatedAsyncioTestCase):
 
         client = PhishDestroyClient(timeout_seconds=2)
 
-        with patch("bulmaai.services.phishdestroy.http.request", side_effect=fake_request):
+        with patch("bulmaai.services.phishdestroy.http.request", side_effect=fake_request) as request:
             verdict = await client.check_domain("bad.example")
 
+        self.assertEqual(request.call_args.kwargs["retries"], 0)
+        self.assertEqual(request.call_args.kwargs["max_retry_wait"], 0)
         self.assertTrue(verdict.threat)
         self.assertEqual(verdict.domain, "bad.example")
         self.assertEqual(verdict.risk_score, 85)
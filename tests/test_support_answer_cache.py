@@ -0,0 +1,145 @@
+import types
+import unittest
+
+from bulmaai.services.support_answer_cache import (
+    SupportAnswerCache,
+    normalize_question,
+    scrub_requester,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FileListing:
+    """Stands in for ``vector_stores.files.list``: one listing per call, async-iterable like a paginator."""
+
+    def __init__(self, *listings) -> None:
+        self.listings = list(listings)
+        self.calls = 0
+
+    def __call__(self, *, vector_store_id: str, limit: int):
+        self.calls += 1
+        listing = self.listings.pop(0)
+        if isinstance(listing, Exception):
+            raise listing
+
+        async def files():
+            for store_file in listing:
+                yield store_file
+
+        return files()
+
+
+def _vector_store_client(*listings) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        vector_stores=types.SimpleNamespace(files=types.SimpleNamespace(list=_FileListing(*listings)))
+    )
+
+
+def _file(file_id: str, created_at: int) -> types.SimpleNamespace:
+    return types.SimpleNamespace(id=file_id, created_at=created_at, status="completed")
+
+
+class SupportAnswerCacheTests(unittest.IsolatedAsyncioTestCase):
+    def test_normalizes_case_punctuation_and_mentions(self) -> None:
+        self.assertEqual(
+            normalize_question("<@123>  How do I INSTALL the mod?!"),
+            "how do i install the mod",
+        )
+
+    def test_exact_hits_are_scoped(self) -> None:
+        cache = SupportAnswerCache()
+        cache.put("gpt-5|en|v1", "How do I install the mod?", "Use the launcher.")
+
+        hit = cache.get("gpt-5|en|v1", "how do i install the mod")
+
+        self.assertEqual((hit.reply, hit.kind), ("Use the launcher.", "exact"))
+        self.assertIsNone(cache.get("gpt-5|es|v1", "How do I install the mod?"))
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+
+    def test_semantic_hit_needs_close_embedding_in_same_scope(self) -> None:
+        cache = SupportAnswerCache()
+        cache.put("s", "Which Forge version do I need?", "Forge 47.2.", embedding=[1.0, 0.0])
+
+        close = cache.get("s", "What forge version is required", embedding=[0.99, 0.05])
+        far = cache.get("s", "Where is the beta?", embedding=[0.2, 0.98])
+        other_scope = cache.get("t", "What forge version is required", embedding=[0.99, 0.05])
+
+        self.assertEqual((close.reply, close.kind), ("Forge 47.2.", "semantic"))
+        self.assertGreater(close.similarity, 0.92)
+        self.assertIsNone(far)
+        self.assertIsNone(other_scope)
+
+    def test_stored_replies_drop_the_requester_name_and_mentions(self) -> None:
+        cache = SupportAnswerCache()
+        cache.put(
+            "s",
+            "How do I install the mod?",
+            "Hi Goku, <@123> use the launcher. Thanks, goku!",
+            requester_names=["Goku"],
+        )
+
+        self.assertEqual(cache.get("s", "How do I install the mod?").reply, "Hi, use the launcher. Thanks!")
+
+    def test_scrub_keeps_short_names_and_partial_words(self) -> None:
+        self.assertEqual(scrub_requester("Kai, open Kaioken settings.", ["Kai", "Al"]), "open Kaioken settings.")
+        self.assertEqual(scrub_requester("Al, open the menu.", ["Al"]), "Al, open the menu.")
+
+    def test_entries_expire(self) -> None:
+        clock = _Clock()
+        cache = SupportAnswerCache(ttl_seconds=60, clock=clock)
+        cache.put("s", "q", "a")
+        clock.now += 61
+
+        self.assertIsNone(cache.get("s", "q"))
+
+    async def test_knowledge_version_change_clears_entries(self) -> None:
+        clock = _Clock()
+        cache = SupportAnswerCache(clock=clock)
+        # Same number of files; one was replaced by an edited upload.
+        client = _vector_store_client(
+            [_file("file-a", 100), _file("file-b", 200)],
+            [_file("file-a", 100), _file("file-c", 300)],
+        )
+
+        first = await cache.knowledge_version(client, ["vs_docs"])
+        cache.put(f"m|en|{first}", "q", "a")
+        self.assertEqual(await cache.knowledge_version(client, ["vs_docs"]), first)
+        self.assertEqual(client.vector_stores.files.list.calls, 1)
+
+        clock.now += 601
+        second = await cache.knowledge_version(client, ["vs_docs"])
+
+        self.assertNotEqual(second, first)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.invalidations, 1)
+
+    async def test_unchanged_files_keep_the_version(self) -> None:
+        clock = _Clock()
+        cache = SupportAnswerCache(clock=clock)
+        client = _vector_store_client(
+            [_file("file-a", 100), _file("file-b", 200)],
+            [_file("file-b", 200), _file("file-a", 100)],
+        )
+
+        first = await cache.knowledge_version(client, ["vs_docs"])
+        clock.now += 601
+
+        self.assertEqual(await cache.knowledge_version(client, ["vs_docs"]), first)
+        self.assertEqual(cache.stats.invalidations, 0)
+
+    async def test_no_or_unreadable_knowledge_base_disables_caching(self) -> None:
+        cache = SupportAnswerCache()
+        failing = _vector_store_client(RuntimeError("down"))
+
+        self.assertIsNone(await cache.knowledge_version(failing, []))
+        self.assertIsNone(await cache.knowledge_version(failing, ["vs_docs"]))
+
+if __name__ == "__main__":
+    unittest.main()
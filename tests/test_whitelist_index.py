@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import AsyncMock
+
+from bulmaai.services.whitelist_index import WhitelistIndex, WhitelistIndexCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class WhitelistIndexTests(unittest.TestCase):
+    def test_membership_is_case_insensitive_and_ignores_padding(self) -> None:
+        whitelist = WhitelistIndex("Alpha\n  Beta  \n\nGamma\n")
+
+        self.assertIn("alpha", whitelist)
+        self.assertIn("BETA", whitelist)
+        self.assertNotIn("Delta", whitelist)
+        self.assertNotIn("", whitelist)
+        self.assertEqual(len(whitelist), 3)
+
+    def test_edits_touch_only_affected_lines(self) -> None:
+        whitelist = WhitelistIndex("Alpha\n\nBeta\nGamma\n")
+
+        self.assertTrue(whitelist.replace("beta", "Bravo"))
+        self.assertTrue(whitelist.remove(["GAMMA"]))
+        self.assertTrue(whitelist.add("Delta"))
+
+        self.assertEqual(whitelist.text(), "Alpha\n\nBravo\nDelta\n")
+
+    def test_noop_edits_report_unchanged(self) -> None:
+        whitelist = WhitelistIndex("Alpha\nBeta\n")
+
+        self.assertFalse(whitelist.add("ALPHA"))
+        self.assertFalse(whitelist.remove(["Missing"]))
+        self.assertFalse(whitelist.replace("Missing", "beta"))
+        self.assertTrue(whitelist.replace("Alpha", "Beta"))
+        self.assertEqual(whitelist.text(), "Beta\n")
+
+    def test_case_only_rename_rewrites_the_line(self) -> None:
+        whitelist = WhitelistIndex("Alpha\nnotch\nBeta\n")
+
+        self.assertTrue(whitelist.replace("notch", "Notch"))
+        self.assertEqual(whitelist.text(), "Alpha\nNotch\nBeta\n")
+        self.assertFalse(whitelist.replace("NOTCH", "Notch"))
+        self.assertIn("notch", whitelist)
+
+    def test_copy_is_independent(self) -> None:
+        whitelist = WhitelistIndex("Alpha\n", sha="sha-1")
+        clone = whitelist.copy()
+        clone.add("Beta")
+
+        self.assertNotIn("Beta", whitelist)
+        self.assertEqual(clone.sha, "sha-1")
+
+    def test_removing_every_entry_renders_an_empty_file(self) -> None:
+        whitelist = WhitelistIndex("Alpha\n\n")
+
+        self.assertTrue(whitelist.remove(["alpha"]))
+        self.assertEqual(whitelist.text(), "")
+
+
+class WhitelistIndexCacheTests(unittest.IsolatedAsyncioTestCase):
+    def _gh(self, *responses):
+        return type("GH", (), {"base_branch": "main", "get_whitelist_file": AsyncMock(side_effect=list(responses))})()
+
+    async def test_fresh_index_is_served_without_a_request(self) -> None:
+        clock = _Clock()
+        cache = WhitelistIndexCache(ttl_seconds=60, clock=clock)
+        gh = self._gh(("Alpha\n", "sha-1"))
+
+        first = await cache.get(gh)
+        clock.now += 30
+        second = await cache.get(gh)
+
+        self.assertIs(first, second)
+        gh.get_whitelist_file.assert_awaited_once_with(ref="main")
+
+    async def test_index_is_rebuilt_only_when_sha_changes(self) -> None:
+        clock = _Clock()
+        cache = WhitelistIndexCache(ttl_seconds=60, clock=clock)
+        gh = self._gh(("Alpha\n", "sha-1"), ("Alpha\n", "sha-1"), ("Alpha\nBeta\n", "sha-2"))
+
+        first = await cache.get(gh)
+        clock.now += 61
+        same = await cache.get(gh)
+        clock.now += 61
+        changed = await cache.get(gh)
+
+        self.assertIs(first, same)
+        self.assertIsNot(first, changed)
+        self.assertIn("Beta", changed)
+
+    async def test_invalidate_forces_a_reload(self) -> None:
+        cache = WhitelistIndexCache(ttl_seconds=60)
+        gh = self._gh(("Alpha\n", "sha-1"), ("Alpha\nBeta\n", "sha-1"))
+
+        await cache.get(gh)
+        cache.invalidate()
+
+        self.assertIn("Beta", await cache.get(gh))
+
+
+if __name__ == "__main__":
+    unittest.main()
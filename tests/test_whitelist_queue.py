@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from requests import HTTPError
+
+from bulmaai.services.whitelist_queue import WhitelistChange, WhitelistChangeQueue
+
+
+class FakeGitHub:
+    def __init__(self, base_text: str) -> None:
+        self.base_text = base_text
+        self.commits = []
+        self.merged_prs = []
+        self.removed_branches = []
+
+    async def get_whitelist_snapshot(self, branch):
+        return SimpleNamespace(
+            branch=branch,
+            base_text=self.base_text,
+            base_blob_oid=None,
+            branch_text=self.base_text,
+        )
+
+    async def commit_whitelist_and_open_pr(self, snapshot, *, new_text, message, title, body):
+        self.commits.append({"branch": snapshot.branch, "new_text": new_text, "title": title, "body": body})
+        return {"number": 30 + len(self.commits), "html_url": f"https://example.test/pr/{30 + len(self.commits)}"}
+
+    async def merge_pr(self, pr_number):
+        self.merged_prs.append(pr_number)
+        self.base_text = self.commits[-1]["new_text"]
+
+    async def add_pr_comment(self, pr_number, comment):
+        return None
+
+    async def remove_branch(self, branch):
+        self.removed_branches.append(branch)
+
+
+class ConflictingGitHub(FakeGitHub):
+    async def merge_pr(self, pr_number):
+        error = HTTPError("409 Client Error: Conflict")
+        error.response = SimpleNamespace(status_code=409)
+        raise error
+
+    async def get_pr(self, pr_number):
+        return {"number": pr_number, "merged": False}
+
+
+def _add(nickname: str) -> WhitelistChange:
+    return WhitelistChange.add(nickname, summary=f"Add beta tester: {nickname}", detail=f"Add `{nickname}`.")
+
+
+class WhitelistChangeQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_changes_share_one_commit_and_report_per_change(self) -> None:
+        gh = FakeGitHub("Keep\nOldName\nExpired\nAlready\n")
+        queue = WhitelistChangeQueue(gh, window_seconds=0.01)
+
+        added, updated, removed, unchanged = await asyncio.gather(
+            queue.submit(_add("Fresh")),
+            queue.submit(WhitelistChange.update("oldname", "NewName", summary="Update", detail="Rename.")),
+            queue.submit(WhitelistChange.remove(["EXPIRED"], summary="Remove", detail="Expired.")),
+            queue.submit(_add("already")),
+        )
+
+        self.assertEqual(len(gh.commits), 1)
+        self.assertEqual(gh.commits[0]["new_text"], "Keep\nNewName\nAlready\nFresh\n")
+        self.assertEqual(gh.commits[0]["title"], "Update Patreon beta whitelist (3 changes)")
+        self.assertEqual(gh.commits[0]["body"].splitlines(), ["- Add `Fresh`.", "- Rename.", "- Expired."])
+        self.assertEqual(gh.merged_prs, [31])
+        self.assertEqual(gh.removed_branches, [gh.commits[0]["branch"]])
+        for result in (added, updated, removed):
+            self.assertTrue(result.changed)
+            self.assertTrue(result.merged)
+            self.assertEqual(result.pr_url, "https://example.test/pr/31")
+        self.assertFalse(unchanged.changed)
+        self.assertIsNone(unchanged.pr_url)
+
+    async def test_later_changes_start_a_new_batch_on_the_merged_base(self) -> None:
+        gh = FakeGitHub("Keep\n")
+        queue = WhitelistChangeQueue(gh, window_seconds=0)
+
+        first = await queue.submit(_add("Fresh"))
+        again = await queue.submit(_add("Fresh"))
+        second = await queue.submit(_add("Other"))
+
+        self.assertTrue(first.changed)
+        self.assertFalse(again.changed)
+        self.assertEqual(second.pr_number, 32)
+        self.assertEqual(gh.base_text, "Keep\nFresh\nOther\n")
+        self.assertNotEqual(gh.commits[0]["branch"], gh.commits[1]["branch"])
+
+    async def test_refused_merge_leaves_pr_open_for_staff(self) -> None:
+        gh = ConflictingGitHub("Keep\n")
+        queue = WhitelistChangeQueue(gh, window_seconds=0)
+
+        result = await queue.submit(_add("Fresh"))
+
+        self.assertTrue(result.changed)
+        self.assertFalse(result.merged)
+        self.assertEqual(result.merge_status, 409)
+        self.assertEqual(gh.removed_branches, [])
+
+    async def test_commit_failure_is_raised_to_changed_submitters_only(self) -> None:
+        gh = FakeGitHub("Already\n")
+
+        async def fail(*args, **kwargs):
+            raise RuntimeError("github down")
+
+        gh.commit_whitelist_and_open_pr = fail
+        queue = WhitelistChangeQueue(gh, window_seconds=0.01)
+
+        failed, unchanged = await asyncio.gather(
+            queue.submit(_add("Fresh")),
+            queue.submit(_add("Already")),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(failed, RuntimeError)
+        self.assertFalse(unchanged.changed)
+
+
+if __name__ == "__main__":
+    unittest.main()